@@ -0,0 +1,87 @@
+"""
+Compara os serializadores CSV, plain e JSON com as versões linha a linha anteriores.
+
+Série com 4 colunas float e índice por minuto, com valores arredondados a 4 casas
+decimais e em precisão completa. Também confere que as saídas são idênticas.
+
+Uso: python benchmarks/serializers.py [tamanhos...]   (padrão: 10000 100000 1000000)
+"""
+from llm4time.core.data import UniTimeSeries, MultiTimeSeries
+from llm4time.core.formatting import to_csv, to_plain, to_json
+from llm4time.core.formatting._benchmark import _timed
+import numpy as np
+import pandas as pd
+import json
+import sys
+
+
+def _rows(ts):
+  if isinstance(ts, UniTimeSeries):
+    return [ts.name], [[v] for v in ts.to_list()]
+  return ts.columns, ts.to_numpy().tolist()
+
+
+def legacy_to_csv(ts) -> str:
+  columns, values = _rows(ts)
+  header = f"{ts.index.name}," + ",".join(columns)
+  lines = [f"{idx}," + ",".join(str(v) for v in row)
+           for idx, row in zip(ts.index, values)]
+  return header + "\n" + "\n".join(lines)
+
+
+def legacy_to_plain(ts) -> str:
+  columns, values = _rows(ts)
+  lines = [
+      f"{ts.index.name}: {idx}, " +
+      ", ".join(f"{col}: {val}" for col, val in zip(columns, row))
+      for idx, row in zip(ts.index, values)
+  ]
+  return "\n".join(lines)
+
+
+def legacy_to_json(ts) -> str:
+  columns, values = _rows(ts)
+  data = [
+      {ts.index.name: idx, **{col: val for col, val in zip(columns, row)}}
+      for idx, row in zip([str(idx) for idx in ts.index], values)
+  ]
+  return json.dumps(data)
+
+
+SERIALIZERS = {
+    "csv": (legacy_to_csv, to_csv),
+    "plain": (legacy_to_plain, to_plain),
+    "json": (legacy_to_json, to_json),
+}
+
+
+def series(size: int, decimals: int | None, seed: int = 0) -> MultiTimeSeries:
+  rng = np.random.default_rng(seed)
+  index = pd.date_range("2024-01-01", periods=size, freq="min", name="date")
+  values = rng.normal(100, 25, (size, 4))
+  values = values if decimals is None else np.round(values, decimals)
+  return MultiTimeSeries(values, index=index, columns=["a", "b", "c", "d"])
+
+
+def main(sizes: list[int], repeat: int = 1) -> pd.DataFrame:
+  rows = []
+  for size in sizes:
+    for decimals in (4, None):
+      ts = series(size, decimals)
+      for name, (old, new) in SERIALIZERS.items():
+        old_string, old_time = _timed(lambda: old(ts), repeat)
+        new_string, new_time = _timed(lambda: new(ts), repeat)
+        rows.append({
+            "rows": size, "format": name,
+            "decimals": "full" if decimals is None else decimals,
+            "old": old_time, "new": new_time, "speedup": old_time / new_time,
+            "identical": old_string == new_string,
+        })
+  return pd.DataFrame(rows).set_index(["rows", "decimals", "format"])
+
+
+if __name__ == "__main__":
+  sizes = [int(s) for s in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+  with pd.option_context("display.width", 200, "display.max_columns", None,
+                         "display.float_format", "{:.4f}".format):
+    print(main(sizes))
@@ -0,0 +1,84 @@
+"""
+Compara `encode_textual`/`decode_textual` com as versões valor a valor anteriores.
+
+Uso: python benchmarks/textual.py [tamanhos...]   (padrão: 10000 100000 1000000)
+"""
+from llm4time.core.data import UniTimeSeries, MultiTimeSeries
+from llm4time.core.formatting import encode_textual, decode_textual
+from llm4time.core.formatting._benchmark import _timed
+import numpy as np
+import pandas as pd
+import re
+import sys
+
+
+def legacy_encode_textual(ts):
+  ts = ts.copy()
+
+  def encode(v):
+    if pd.isna(v):
+      return v
+    return ' '.join(str(v))
+
+  if isinstance(ts, UniTimeSeries):
+    ts = ts.astype(object)
+    ts[:] = ts.apply(encode)
+  else:
+    for col in ts.num_columns:
+      ts[col] = ts[col].astype(object)
+      ts[col] = ts[col].apply(encode)
+  return ts
+
+
+def legacy_decode_textual(ts):
+  ts = ts.copy()
+
+  def decode(v):
+    s = str(v).strip()
+    if re.fullmatch(r"[-\d\s.]+", s):
+      return float(s.replace(" ", ""))
+    return v
+
+  if isinstance(ts, UniTimeSeries):
+    ts = ts.apply(decode)
+  else:
+    for col in ts.columns:
+      ts[col] = ts[col].apply(decode)
+  return ts
+
+
+def series(size: int, seed: int = 0) -> dict[str, UniTimeSeries | MultiTimeSeries]:
+  rng = np.random.default_rng(seed)
+  index = pd.date_range("2024-01-01", periods=size, freq="min", name="date")
+  values = np.round(rng.normal(100, 25, size), 2)
+  values[rng.random(size) < 0.01] = np.nan
+  return {
+      "uni": UniTimeSeries(values, index=index, name="value"),
+      "multi": MultiTimeSeries(
+          {"x": values, "y": rng.integers(0, 1000, size)}, index=index),
+  }
+
+
+def main(sizes: list[int], repeat: int = 3) -> pd.DataFrame:
+  rows = []
+  for size in sizes:
+    for kind, ts in series(size).items():
+      encoded, new_encode = _timed(lambda: encode_textual(ts), repeat)
+      _, old_encode = _timed(lambda: legacy_encode_textual(ts), repeat)
+      _, new_decode = _timed(lambda: decode_textual(encoded), repeat)
+      _, old_decode = _timed(lambda: legacy_decode_textual(encoded), repeat)
+      rows.append({
+          "rows": size, "series": kind,
+          "encode_old": old_encode, "encode_new": new_encode,
+          "encode_speedup": old_encode / new_encode,
+          "decode_old": old_decode, "decode_new": new_decode,
+          "decode_speedup": old_decode / new_decode,
+      })
+  return pd.DataFrame(rows).set_index(["rows", "series"])
+
+
+if __name__ == "__main__":
+  sizes = [int(s) for s in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+  with pd.option_context("display.width", 200, "display.max_columns", None,
+                         "display.float_format", "{:.4f}".format):
+    print(main(sizes))
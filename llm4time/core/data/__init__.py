@@ -1,4 +1,5 @@
 from ._base import *
+from ._precision import *
 from .unitimeseries import *
 from .multitimeseries import *
 from .reader import *
@@ -1,8 +1,12 @@
 from enum import Enum
-from typing import Self
+from typing import Iterator, Self
 from abc import ABC, abstractmethod
 import llm4time as lt
 import pandas as pd
+import numpy as np
+from . import _compression
+from . import _search
+from ._precision import Scaler, _round
 import random
 import os
 
@@ -12,6 +16,7 @@ class Sampling(str, Enum):
   BACKEND = "backend"
   RANDOM = "random"
   UNIFORM = "uniform"
+  SIMILAR = "similar"
 
 
 class TSFormat(str, Enum):
@@ -31,6 +36,12 @@ class TSType(str, Enum):
   TEXTUAL = "textual"
 
 
+class Compression(str, Enum):
+  TRUNCATE = "truncate"
+  PAA = "paa"
+  LTTB = "lttb"
+
+
 class TimeSeriesStatistics(ABC):
 
   @abstractmethod
@@ -370,6 +381,49 @@ class TimeSeriesPlot(ABC):
     ...
 
 
+class Window:
+  """
+  Janela de uma série temporal, referenciada por posição e tamanho, sem cópia dos dados.
+  """
+  __slots__ = ("parent", "start", "stop")
+
+  def __init__(self, parent: "TimeSeries", start: int, stop: int) -> None:
+    self.parent = parent
+    self.start = start
+    self.stop = stop
+
+  def __len__(self) -> int:
+    return self.stop - self.start
+
+  def __repr__(self) -> str:
+    return f"Window(start={self.start}, stop={self.stop})"
+
+  @property
+  def index(self) -> pd.Index:
+    return self.parent.index[self.start:self.stop]
+
+  @property
+  def values(self) -> np.ndarray:
+    return self.parent.to_numpy()[self.start:self.stop]
+
+  def to_series(self, copy: bool = False) -> "TimeSeries":
+    """
+    Converte a janela em uma série temporal do mesmo tipo da série original.
+
+    Args:
+        copy (bool): Se True, copia os dados; caso contrário, a nova série pode
+                     compartilhar memória com a original.
+
+    Returns:
+        TimeSeries: Janela como `UniTimeSeries` ou `MultiTimeSeries`.
+    """
+    ts = self.parent.iloc[self.start:self.stop]
+    return ts.copy() if copy else ts
+
+  def to_str(self, *args, **kwargs) -> str:
+    return self.to_series().to_str(*args, **kwargs)
+
+
 class TimeSeries(ABC):
   @abstractmethod
   def agg_duplicates(self: Self, method: str, inplace: bool | None) -> Self | None:
@@ -448,6 +502,10 @@ class TimeSeries(ABC):
             - 'backend': Gera janelas sequenciais a partir do final da série.
             - 'random': Seleciona aleatoriamente os pontos iniciais das janelas.
             - 'uniform': Gera janelas distribuídas uniformemente ao longo da série.
+            - 'similar': Seleciona as janelas cuja entrada tem a forma (z-normalizada)
+              mais próxima da janela mais recente da série, via busca de
+              subsequências por FFT (MASS). Janelas escolhidas não se sobrepõem em
+              mais de meia janela.
         window (int): Tamanho de cada janela.
         samples (int): Número total de amostras a serem geradas.
         step (int): Intervalo entre os pontos iniciais das janelas.
@@ -458,8 +516,95 @@ class TimeSeries(ABC):
 
     Raises:
         ValueError: Se o método informado não for um dos suportados:
-                    'frontend', 'backend', 'random' ou 'uniform'.
+                    'frontend', 'backend', 'random', 'uniform' ou 'similar'.
+    """
+    return [
+        (input.to_series(copy=True), output.to_series(copy=True))
+        for input, output in self.iter_slide(method, window, samples, step)
+    ]
+
+  def iter_slide(
+      self: Self,
+      method: Sampling,
+      window: int,
+      samples: int,
+      step: int = None
+  ) -> Iterator[tuple["Window", "Window"]]:
+    """
+    Versão preguiçosa de `slide`: gera os pares (entrada, saída) sob demanda.
+
+    Cada janela é um `Window`, que apenas referencia a série original por posição
+    e tamanho, sem copiar dados. A conversão para `UniTimeSeries`/`MultiTimeSeries`
+    acontece somente ao chamar `Window.to_series()`.
+
+    Args:
+        method (Sampling): Estratégia de amostragem (ver `slide`).
+        window (int): Tamanho de cada janela.
+        samples (int): Número total de amostras a serem geradas.
+        step (int): Intervalo entre os pontos iniciais das janelas.
+
+    Yields:
+        tuple[Window, Window]: Par de janelas consecutivas (entrada, saída).
+
+    Raises:
+        ValueError: Se o método informado não for suportado.
+    """
+    for idx in self._starts(method, window, samples, step):
+      yield (Window(self, idx, idx + window),
+             Window(self, idx + window, idx + 2 * window))
+
+  def slide_array(
+      self: Self,
+      method: Sampling,
+      window: int,
+      samples: int,
+      step: int = None
+  ) -> tuple[np.ndarray, np.ndarray]:
     """
+    Versão matricial de `slide` para consumidores vetorizados.
+
+    As janelas são obtidas com `np.lib.stride_tricks.sliding_window_view`. Quando os
+    pontos iniciais são igualmente espaçados (ex: 'frontend', 'backend', 'uniform'
+    com `step`), os arrays retornados são visões somente leitura da série, sem cópia.
+
+    Args:
+        method (Sampling): Estratégia de amostragem (ver `slide`).
+        window (int): Tamanho de cada janela.
+        samples (int): Número total de amostras a serem geradas.
+        step (int): Intervalo entre os pontos iniciais das janelas.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Entradas e saídas, cada uma com formato
+            (amostras, janela, colunas).
+
+    Raises:
+        ValueError: Se o método informado não for suportado.
+    """
+    idxs = self._starts(method, window, samples, step)
+    values = self.to_numpy().reshape(len(self), -1)
+    if not idxs or window <= 0:
+      empty = values[:0, None].repeat(max(window, 0), axis=1)
+      return empty, empty.copy()
+
+    # (posições, colunas, 2 * janela) -> (posições, 2 * janela, colunas), ainda
+    # uma visão.
+    view = np.lib.stride_tricks.sliding_window_view(values, 2 * window, axis=0)
+    view = view.transpose(0, 2, 1)
+    steps = np.diff(idxs)
+    if len(idxs) == 1 or (steps[0] > 0 and (steps == steps[0]).all()):
+      pairs = view[idxs[0]:idxs[-1] + 1:int(steps[0]) if len(idxs) > 1 else 1]
+    else:
+      pairs = view[idxs]
+    return pairs[:, :window], pairs[:, window:]
+
+  def _starts(
+      self: Self,
+      method: Sampling,
+      window: int,
+      samples: int,
+      step: int | None
+  ) -> list[int]:
+    # Posições iniciais dos pares (entrada, saída) de `slide`.
     max_start = len(self) - 2 * window
 
     if method == Sampling.FRONTEND:
@@ -484,26 +629,93 @@ class TimeSeries(ABC):
       else:
         idxs = list(range(0, max_start + 1, step))[:samples]
 
+    elif method == Sampling.SIMILAR:
+      data = self.to_frame() if isinstance(self, pd.Series) else self
+      values = data.select_dtypes(include="number").to_numpy(dtype=float)
+      if window <= 0 or values.shape[1] == 0:
+        return []
+      idxs = _search.similar_windows(values, window, samples)
+
     else:
-      raise ValueError('Supported methods: frontend, backend, random, uniform.')
+      raise ValueError(
+          'Supported methods: frontend, backend, random, uniform, similar.')
+
+    # Descarta posições fora da série (ex: mais amostras do que a série comporta).
+    return [idx for idx in idxs if 0 <= idx and idx + 2 * window <= len(self)]
+
+  def compress(
+      self: Self,
+      points: int,
+      method: Compression = Compression.LTTB,
+      keep_recent: int = 0
+  ) -> Self:
+    """
+    Reduz a série a no máximo `points` observações.
+
+    As `keep_recent` observações mais recentes são mantidas em resolução total e
+    o restante do orçamento é usado para representar o histórico mais antigo.
+    A taxa de compressão é registrada em `attrs['compression']`.
+
+    Args:
+        points (int): Quantidade máxima de observações da série comprimida.
+        method (Compression): Método aplicado ao histórico antigo:
+            - 'truncate': Descarta o histórico antigo (mantém apenas as mais recentes).
+            - 'paa': Piecewise Aggregate Approximation (média por segmento).
+            - 'lttb': Largest-Triangle-Three-Buckets (preserva a forma visual).
+        keep_recent (int): Observações recentes mantidas sem compressão.
 
-    windows = []
-    for idx in idxs:
-      end_out = idx + 2 * window
-      if end_out > len(self):
-        break
-      windows.append((
-          self._constructor(self.iloc[idx:idx + window].copy()),
-          self._constructor(self.iloc[idx + window:end_out].copy())
-      ))
-    return windows
+    Returns:
+        TimeSeries: Série comprimida.
 
-  def to_str(self: Self, format: TSFormat, type: TSType = TSType.NUMERIC) -> str:
+    Raises:
+        ValueError: Se `points` for menor que 1 ou o método não for suportado.
+    """
+    if points < 1:
+      raise ValueError("Points must be at least 1.")
+    try:
+      method = Compression(method)
+    except ValueError:
+      raise ValueError("Supported compressions: truncate, paa, lttb.")
+
+    n = len(self)
+    keep_recent = min(keep_recent, points, n)
+    if n <= points:
+      ts = self._constructor(self.copy())
+    elif method == Compression.TRUNCATE or keep_recent == points:
+      ts = self._constructor(self.iloc[-points:].copy())
+    else:
+      old, recent = self.iloc[:n - keep_recent], self.iloc[n - keep_recent:]
+      data = old.to_frame() if isinstance(old, pd.Series) else old
+      if method == Compression.PAA:
+        data = _compression.paa(data, points - keep_recent)
+      else:
+        data = data.iloc[_compression.lttb_indices(
+            _compression.lttb_signal(data), points - keep_recent)]
+      old = data.iloc[:, 0].rename(self.name) if isinstance(self, pd.Series) else data
+      ts = self._constructor(pd.concat([old, recent]))
+
+    ts.attrs["compression"] = {
+        "method": method.value,
+        "original": n,
+        "compressed": len(ts),
+        "ratio": n / max(1, len(ts)),
+    }
+    return ts
+
+  def to_str(
+      self: Self,
+      format: TSFormat | str,
+      type: TSType = TSType.NUMERIC,
+      decimals: int | None = None,
+      significant_digits: int | None = None,
+      scaler: Scaler | None = None,
+      index: bool = True
+  ) -> str:
     """
     Converte a série temporal para uma representação em string em diversos formatos.
 
     Args:
-        format (TSFormat): Formato desejado para a conversão. Formatos suportados:
+        format (TSFormat | str): Formato desejado para a conversão. Formatos suportados:
             - TSFormat.ARRAY: Retorna a série como array.
             - TSFormat.CONTEXT: Retorna a série em formato contextual.
             - TSFormat.CSV: Retorna a série como CSV.
@@ -513,32 +725,41 @@ class TimeSeries(ABC):
             - TSFormat.PLAIN: Retorna a série como texto simples.
             - TSFormat.SYMBOL: Retorna a série usando notação simbólica.
             - TSFormat.TSV: Retorna a série como TSV.
+            Formatos adicionais podem ser registrados com `register_format`.
         type (TSType, optional): Tipo da representação desejada. Pode ser:
             - TSType.NUMERIC (padrão): Mantém os valores numéricos da série.
             - TSType.TEXTUAL: Converte a série para uma forma textual codificada.
+        decimals (int | None): Casas decimais dos valores numéricos. Com 0 (ou
+            negativo), os valores são escritos como inteiros. Se None, não arredonda.
+        significant_digits (int | None): Algarismos significativos dos valores
+            numéricos. Se None, não arredonda.
+        scaler (Scaler | None): Escala afim para inteiros. Se ainda não ajustado, é
+            ajustado nesta série; os parâmetros ficam no objeto, que deve ser passado
+            a `from_str` para inverter a escala. Os valores são escritos como inteiros,
+            salvo se `decimals` for informado.
+        index (bool): Se False, omite os instantes e escreve apenas os valores. Em
+            séries de frequência regular, `from_str(..., last=...)` reconstrói o índice.
 
     Returns:
         str: Representação em string da série temporal no formato e tipo especificados.
 
     Raises:
-        ValueError: Se o `format` fornecido não for suportado.
-    """
-    ts = lt.encode_textual(self) if type == TSType.TEXTUAL else self
-
-    formats_map = {
-        TSFormat.ARRAY: lt.to_array,
-        TSFormat.CONTEXT: lt.to_context,
-        TSFormat.CSV: lt.to_csv,
-        TSFormat.CUSTOM: lt.to_custom,
-        TSFormat.JSON: lt.to_json,
-        TSFormat.MARKDOWN: lt.to_markdown,
-        TSFormat.PLAIN: lt.to_plain,
-        TSFormat.SYMBOL: lt.to_symbol,
-        TSFormat.TSV: lt.to_tsv,
-    }
-    if format not in formats_map:
-      raise ValueError(f"Unknown format: {format}.")
-    return formats_map[format](ts)
+        ValueError: Se o `format` fornecido não for suportado ou não aceitar a série
+            ou o tipo de representação.
+    """
+    spec = lt.get_format(format)
+    if not spec.supports(self, type):
+      raise ValueError(
+          f"Format '{getattr(format, 'value', format)}' does not support "
+          f"{TSType(type).value} {self.__class__.__name__}.")
+
+    ts = self
+    if scaler is not None:
+      ts = (scaler if scaler.fitted else scaler.fit(ts)).transform(ts)
+      decimals = 0 if decimals is None else decimals
+    ts = _round(ts, decimals, significant_digits)
+    ts = lt.encode_textual(ts) if type == TSType.TEXTUAL else ts
+    return spec.encode(ts, index=index)
 
   def to_file(self: Self, path: str) -> None:
     """
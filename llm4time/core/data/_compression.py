@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb_signal(data: pd.DataFrame) -> np.ndarray:
+  """
+  Sinal único usado para escolher os pontos do LTTB.
+
+  Em séries multivariadas, usa a média das colunas numéricas padronizadas, de
+  forma que todas as colunas mantenham as mesmas linhas.
+  """
+  values = data.select_dtypes(include="number").to_numpy(dtype=float)
+  if values.shape[1] == 0:
+    return np.zeros(len(data))
+  std = np.nanstd(values, axis=0)
+  values = (values - np.nanmean(values, axis=0)) / np.where(std > 0, std, 1.0)
+  return np.nan_to_num(values.mean(axis=1))
+
+
+def lttb_indices(y: np.ndarray, points: int) -> np.ndarray:
+  """
+  Seleciona `points` índices pelo Largest-Triangle-Three-Buckets.
+
+  O primeiro e o último ponto são sempre mantidos. Em cada balde escolhe-se o
+  ponto que forma o maior triângulo com o ponto escolhido no balde anterior e a
+  média do balde seguinte. As médias dos baldes são calculadas de uma vez
+  (`np.add.reduceat`) e cada balde é avaliado de forma vetorizada.
+
+  Args:
+      y (np.ndarray): Valores da série (eixo x implícito: 0..n-1).
+      points (int): Quantidade de pontos a manter.
+
+  Returns:
+      np.ndarray: Índices selecionados, em ordem crescente.
+  """
+  n = len(y)
+  if points >= n or n <= 2:
+    return np.arange(n)
+  if points <= 2:
+    return np.array([0, n - 1])[:max(points, 1)]
+
+  edges = np.linspace(1, n - 1, points - 1).astype(int)
+  starts, ends = edges[:-1], edges[1:]
+  x = np.arange(n, dtype=float)
+  sizes = ends - starts
+  avg_x = np.add.reduceat(x[:n - 1], starts) / sizes
+  avg_y = np.add.reduceat(y[:n - 1], starts) / sizes
+  # Média do balde seguinte; o último balde usa o último ponto.
+  next_x = np.append(avg_x[1:], n - 1)
+  next_y = np.append(avg_y[1:], y[-1])
+
+  selected = np.empty(points, dtype=int)
+  selected[0], selected[-1] = 0, n - 1
+  a = 0
+  for i, (start, end) in enumerate(zip(starts, ends), start=1):
+    bx, by = x[start:end], y[start:end]
+    area = np.abs((x[a] - next_x[i - 1]) * (by - y[a])
+                  - (x[a] - bx) * (next_y[i - 1] - y[a]))
+    a = start + int(np.argmax(area))
+    selected[i] = a
+  return selected
+
+
+def paa(data: pd.DataFrame, points: int) -> pd.DataFrame:
+  """
+  Piecewise Aggregate Approximation: média de `points` segmentos contíguos.
+
+  Cada segmento é rotulado pelo seu primeiro instante. Colunas não numéricas
+  mantêm o primeiro valor de cada segmento.
+
+  Args:
+      data (pd.DataFrame): Dados a comprimir.
+      points (int): Quantidade de segmentos.
+
+  Returns:
+      pd.DataFrame: Dados agregados.
+  """
+  n = len(data)
+  if points >= n:
+    return data
+  starts = np.unique(np.linspace(0, n, points + 1).astype(int)[:-1])
+  result = data.iloc[starts].copy()
+  numeric = data.select_dtypes(include="number").columns
+  if len(numeric):
+    values = data[numeric].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+    counts = np.add.reduceat(valid, starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+      result[numeric] = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+  return result
@@ -0,0 +1,169 @@
+from typing import Any, Self, TYPE_CHECKING
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+  from ._base import TimeSeries
+
+
+class Scaler:
+
+  def __init__(self, levels: int = 1000) -> None:
+    """
+    Escala afim por coluna que leva os valores numéricos a inteiros em [0, levels].
+
+    Cada coluna é transformada em `round((x - offset) / step)`, com `offset` igual
+    ao mínimo e `step` igual a (máximo - mínimo) / levels, medidos em `fit`. Os
+    parâmetros ficam registrados no próprio objeto e `inverse` aplica
+    `offset + código * step`. Como os códigos são arredondados, a inversão
+    recupera os valores a menos de `step / 2` (com `levels=1000`, 0,05% da
+    amplitude da coluna).
+
+    Args:
+        levels (int): Maior inteiro da escala.
+
+    Raises:
+        ValueError: Se `levels` for menor que 1.
+    """
+    if levels < 1:
+      raise ValueError("Levels must be at least 1.")
+    self.levels = levels
+    self.offset: dict[Any, float] | None = None
+    self.step: dict[Any, float] | None = None
+
+  @property
+  def fitted(self) -> bool:
+    return self.offset is not None
+
+  def fit(self, ts: "TimeSeries") -> Self:
+    """
+    Mede o mínimo e o passo de cada coluna numérica.
+
+    Args:
+        ts (TimeSeries): Série temporal de referência.
+
+    Returns:
+        Scaler: O próprio objeto, já ajustado.
+    """
+    data = _frame(ts)
+    self.offset, self.step = {}, {}
+    for col in data.select_dtypes(include="number").columns:
+      values = data[col].to_numpy(dtype=float)
+      valid = values[~np.isnan(values)]
+      low, high = (valid.min(), valid.max()) if len(valid) else (0.0, 0.0)
+      self.offset[col] = float(low)
+      self.step[col] = float(high - low) / self.levels if high > low else 1.0
+    return self
+
+  def transform(self, ts: "TimeSeries") -> "TimeSeries":
+    """
+    Converte os valores para a escala inteira.
+
+    Os códigos são mantidos como float (inteiros exatos), preservando valores
+    ausentes e o uso da série em estatísticas.
+
+    Args:
+        ts (TimeSeries): Série temporal.
+
+    Returns:
+        TimeSeries: Série com os códigos.
+
+    Raises:
+        ValueError: Se o scaler não tiver sido ajustado.
+    """
+    return self._apply(
+        ts, lambda values, offset, step: np.rint((values - offset) / step) + 0.0)
+
+  def inverse(self, ts: "TimeSeries") -> "TimeSeries":
+    """
+    Converte códigos da escala inteira de volta para os valores originais.
+
+    Args:
+        ts (TimeSeries): Série com códigos (ex: a previsão lida por `from_str`).
+
+    Returns:
+        TimeSeries: Série na escala original.
+
+    Raises:
+        ValueError: Se o scaler não tiver sido ajustado.
+    """
+    return self._apply(ts, lambda values, offset, step: offset + values * step)
+
+  def _apply(self, ts: "TimeSeries", function) -> "TimeSeries":
+    if not self.fitted:
+      raise ValueError("Scaler must be fitted before use.")
+    data = _frame(ts).copy()
+    for col in data.select_dtypes(include="number").columns:
+      # Em série univariada com outro nome (ex: previsão), usa a única coluna ajustada.
+      key = col
+      if col not in self.offset and len(self.offset) == 1:
+        key = next(iter(self.offset))
+      if key in self.offset:
+        values = data[col].to_numpy(dtype=float)
+        data[col] = function(values, self.offset[key], self.step[key])
+    return _restore(ts, data)
+
+
+def _frame(ts: "TimeSeries") -> pd.DataFrame:
+  return ts.to_frame() if isinstance(ts, pd.Series) else ts
+
+
+def _restore(ts: "TimeSeries", data: pd.DataFrame) -> "TimeSeries":
+  # Devolve `data` no mesmo tipo (e nome, se univariada) de `ts`.
+  if isinstance(ts, pd.Series):
+    data = data.iloc[:, 0]
+    data.name = ts.name
+  return ts._constructor(data)
+
+
+def _significant(values: np.ndarray, digits: int) -> np.ndarray:
+  # Arredonda cada valor para `digits` algarismos significativos. Multiplicar ou
+  # dividir um inteiro por uma potência de 10 exata mantém a representação curta.
+  with np.errstate(divide="ignore", invalid="ignore"):
+    exponent = digits - 1 - np.floor(np.log10(np.abs(values)))
+  exponent = np.where(np.isfinite(exponent), exponent, 0).astype(int)
+  up = np.power(10.0, np.maximum(exponent, 0))
+  down = np.power(10.0, np.maximum(-exponent, 0))
+  return np.where(
+      exponent >= 0, np.rint(values * up) / up, np.rint(values / down) * down)
+
+
+def _round(
+    ts: "TimeSeries",
+    decimals: int | None,
+    significant_digits: int | None
+) -> "TimeSeries":
+  """
+  Arredonda as colunas numéricas para a serialização.
+
+  Colunas cujos valores arredondados são todos inteiros (ex: `decimals=0`) são
+  escritas como inteiros, sem o sufixo '.0'; NaN e infinitos são mantidos.
+  """
+  if decimals is None and significant_digits is None:
+    return ts
+  if significant_digits is not None and significant_digits < 1:
+    raise ValueError("Significant digits must be at least 1.")
+
+  data = _frame(ts).copy()
+  # Inteiros só mudam com algarismos significativos ou casas decimais negativas.
+  keep_integers = significant_digits is None and (decimals is None or decimals >= 0)
+  for col in data.select_dtypes(include="number").columns:
+    if data[col].dtype.kind in "iu" and keep_integers:
+      continue
+    values = data[col].to_numpy(dtype=float)
+    if significant_digits is not None:
+      values = _significant(values, significant_digits)
+    if decimals is not None:
+      values = np.round(values, decimals)
+    # '+ 0.0' evita '-0.0' em valores arredondados para zero.
+    values = values + 0.0
+    finite = np.isfinite(values)
+    integral = values[finite] == np.rint(values[finite])
+    if integral.all() and (np.abs(values[finite]) < 2 ** 53).all():
+      if finite.all():
+        values = values.astype(np.int64)
+      else:
+        values = values.astype(object)
+        values[finite] = values[finite].astype(np.int64)
+    data[col] = values
+  return _restore(ts, data)
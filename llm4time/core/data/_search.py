@@ -0,0 +1,84 @@
+import numpy as np
+
+
+def distance_profile(query: np.ndarray, values: np.ndarray) -> np.ndarray:
+  """
+  Distância euclidiana z-normalizada entre `query` e cada subsequência de `values`
+  (MASS).
+
+  Os produtos escalares deslizantes são obtidos por FFT e as médias e desvios
+  de todas as janelas por somas acumuladas, em O(n log n). Subsequências
+  constantes ficam à distância máxima (sqrt(m)), ou zero se a consulta também
+  for constante.
+
+  Args:
+      query (np.ndarray): Consulta de tamanho m.
+      values (np.ndarray): Série de tamanho n >= m.
+
+  Returns:
+      np.ndarray: Distâncias, de tamanho n - m + 1.
+  """
+  m, n = len(query), len(values)
+  q_std = query.std()
+  q = (query - query.mean()) / (q_std if q_std > 0 else 1.0)
+
+  size = 1 << (n + m - 1).bit_length()
+  spectrum = np.fft.rfft(values, size) * np.fft.rfft(q[::-1], size)
+  products = np.fft.irfft(spectrum, size)[m - 1:n]
+
+  cumsum = np.concatenate(([0.0], np.cumsum(values)))
+  cumsum2 = np.concatenate(([0.0], np.cumsum(values ** 2)))
+  means = (cumsum[m:] - cumsum[:-m]) / m
+  stds = np.sqrt(np.maximum((cumsum2[m:] - cumsum2[:-m]) / m - means ** 2, 0.0))
+
+  # Com a consulta normalizada (média 0), sum(q * t) = m * std_t * corr(q, t).
+  constant = stds <= 1e-12 * max(1.0, np.abs(values).max())
+  with np.errstate(invalid="ignore", divide="ignore"):
+    corr = np.where(constant, 0.0, products / (m * np.where(constant, 1.0, stds)))
+  if q_std == 0:
+    corr = np.where(constant, 1.0, 0.0)
+  return np.sqrt(np.maximum(2 * m * (1 - np.clip(corr, -1.0, 1.0)), 0.0))
+
+
+def similar_windows(values: np.ndarray, window: int, samples: int) -> list[int]:
+  """
+  Posições das `samples` janelas (entrada + saída) cuja entrada mais se parece
+  com a janela mais recente da série.
+
+  Janelas selecionadas não se sobrepõem em mais de meia janela, evitando
+  exemplos quase idênticos.
+
+  Args:
+      values (np.ndarray): Série (n,) ou bloco numérico (n, colunas). Em séries
+                           multivariadas as distâncias das colunas são somadas.
+      window (int): Tamanho das janelas de entrada e saída.
+      samples (int): Quantidade de janelas.
+
+  Returns:
+      list[int]: Posições iniciais, em ordem cronológica.
+  """
+  values = values.reshape(len(values), -1).astype(float)
+  n = len(values)
+  max_start = n - 2 * window
+  if max_start < 0 or samples <= 0:
+    return []
+
+  # Valores ausentes não entram na busca: são substituídos pela média da coluna.
+  values = np.where(np.isnan(values), np.nanmean(values, axis=0), values)
+  values = np.nan_to_num(values)
+  distances = sum(
+      distance_profile(values[-window:, j], values[:max_start + window, j])
+      for j in range(values.shape[1])
+  )
+
+  selected = []
+  blocked = np.zeros(max_start + 1, dtype=bool)
+  exclusion = max(1, window // 2)
+  for idx in np.argsort(distances, kind="stable"):
+    if blocked[idx]:
+      continue
+    selected.append(int(idx))
+    if len(selected) == samples:
+      break
+    blocked[max(0, idx - exclusion + 1):idx + exclusion] = True
+  return sorted(selected)
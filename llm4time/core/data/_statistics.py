@@ -4,6 +4,66 @@ from ._base import TimeSeriesStatistics
 from statsmodels.tsa.seasonal import STL
 from llm4time._infra import logger
 from typing import override
+import warnings
+
+# Ordem das estatísticas retornadas por `summary_stats()`.
+SUMMARY_STATISTICS = [
+    "mean", "median", "std", "min", "max", "q1", "q3",
+    "trend_strength", "seasonal_strength", "residual_strength"
+]
+
+
+def _summary_stats(
+    data: pd.DataFrame,
+    period: int = None,
+    decimals: int = 4
+) -> pd.DataFrame:
+  """
+  Calcula as estatísticas de `summary_stats()` para as colunas numéricas de `data`.
+
+  Momentos e quantis são calculados de uma vez sobre o bloco numérico e cada
+  coluna passa por uma única decomposição STL.
+  """
+  values = data.to_numpy(dtype=float)
+  with warnings.catch_warnings():
+    warnings.simplefilter("ignore", RuntimeWarning)
+    q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75], axis=0)
+    stats = [
+        np.nanmean(values, axis=0), median, np.nanstd(values, axis=0, ddof=1),
+        np.nanmin(values, axis=0), np.nanmax(values, axis=0), q1, q3
+    ]
+  strengths = np.array([_stl_strengths(data[col], period, decimals)
+                        for col in data.columns]).reshape(-1, 3).T
+  return pd.DataFrame(np.vstack([np.round(stats, decimals), strengths]),
+                      index=SUMMARY_STATISTICS, columns=data.columns)
+
+
+def _decompose(ts: pd.Series, period: int = None, decimals: int = 4) -> tuple:
+  res = STL(ts.dropna(), period=period).fit()
+  trend = res.trend.round(decimals or 4)
+  seasonal = res.seasonal.round(decimals or 4)
+  resid = res.resid.round(decimals or 4)
+  var_r = np.var(resid)
+  var_t = np.var(trend)
+  var_s = np.var(seasonal)
+  total_var = var_t + var_s + var_r
+
+  t_strength = round(var_t / total_var, decimals) if total_var > 0 else np.nan
+  s_strength = round(var_s / total_var, decimals) if total_var > 0 else np.nan
+  r_strength = round(var_r / total_var, decimals) if total_var > 0 else np.nan
+  return trend, seasonal, resid, t_strength, s_strength, r_strength
+
+
+def _stl_strengths(
+    ts: pd.Series,
+    period: int = None,
+    decimals: int = 4
+) -> tuple[float, float, float]:
+  try:
+    return _decompose(ts, period, decimals)[3:]
+  except Exception as e:
+    logger.error(f"STL decomposition failed: {e}")
+    return np.nan, np.nan, np.nan
 
 
 class UniTimeSeriesStatistics(TimeSeriesStatistics):
@@ -26,19 +86,8 @@ class UniTimeSeriesStatistics(TimeSeriesStatistics):
         }
 
     try:
-      res = STL(ts.dropna(), period=period).fit()
-      trend = res.trend.round(decimals or 4)
-      seasonal = res.seasonal.round(decimals or 4)
-      resid = res.resid.round(decimals or 4)
-      var_r = np.var(resid)
-      var_t = np.var(trend)
-      var_s = np.var(seasonal)
-      total_var = var_t + var_s + var_r
-
-      t_strength = round(var_t / total_var, decimals) if total_var > 0 else np.nan
-      s_strength = round(var_s / total_var, decimals) if total_var > 0 else np.nan
-      r_strength = round(var_r / total_var, decimals) if total_var > 0 else np.nan
-
+      trend, seasonal, resid, t_strength, s_strength, r_strength = _decompose(
+          ts, period, decimals)
       return {
           "trend": self.__class__(trend),
           "seasonal": self.__class__(seasonal),
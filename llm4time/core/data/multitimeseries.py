@@ -2,7 +2,7 @@ import pandas as pd
 from ._base import TimeSeries
 from ._plots import MultiTimeSeriesPlot
 from ._imputation import MultiTimeSeriesImputation
-from ._statistics import MultiTimeSeriesStatistics
+from ._statistics import MultiTimeSeriesStatistics, _summary_stats
 from ._metrics import MultiTimeSeriesMetrics
 from .unitimeseries import UniTimeSeries
 from typing import Optional, override
@@ -95,6 +95,32 @@ class MultiTimeSeries(
   def quantile(self, q: float, decimals: int = 4, **kwargs) -> float:
     return round(super().quantile(q, **kwargs), decimals)
 
+  def summary_stats(
+      self,
+      period: int = None,
+      freq: str = None,
+      decimals: int = 4
+  ) -> pd.DataFrame:
+    """
+    Calcula as estatísticas descritivas das colunas numéricas em uma única passagem.
+
+    Momentos e quantis são calculados de forma vetorizada sobre o bloco numérico
+    e cada coluna passa por uma única decomposição STL.
+
+    Args:
+        period (int): Período sazonal da STL. Se None, é inferido da frequência.
+        freq (str): Frequência aplicada à série antes da STL.
+        decimals (int): Casas decimais.
+
+    Returns:
+        pd.DataFrame: Uma coluna por coluna numérica e uma linha por estatística
+                      ('mean', 'median', 'std', 'min', 'max', 'q1', 'q3',
+                      'trend_strength', 'seasonal_strength', 'residual_strength').
+    """
+    ts = self.asfreq(freq) if freq else self
+    data = pd.DataFrame(ts.select_dtypes(include="number"))
+    return _summary_stats(data, period, decimals)
+
   def trend(self, strength: bool = False, period: int = None, freq: str = None, decimals: int = 4) -> pd.DataFrame:
     res = self.stl(period, freq, decimals)
     if strength:
@@ -2,7 +2,7 @@ import pandas as pd
 from ._base import TimeSeries
 from ._plots import UniTimeSeriesPlot
 from ._imputation import UniTimeSeriesImputation
-from ._statistics import UniTimeSeriesStatistics
+from ._statistics import UniTimeSeriesStatistics, _summary_stats
 from ._metrics import UniTimeSeriesMetrics
 from typing import Optional, Union, override
 
@@ -66,6 +66,33 @@ class UniTimeSeries(
   def quantile(self, q: float, decimals: int = 4, **kwargs) -> float:
     return round(super().quantile(q, **kwargs), decimals)
 
+  def summary_stats(
+      self,
+      period: int = None,
+      freq: str = None,
+      decimals: int = 4
+  ) -> pd.Series:
+    """
+    Calcula as estatísticas descritivas da série em uma única passagem.
+
+    Inclui média, mediana, desvio padrão, mínimo, máximo, quartis Q1 e Q3 e a
+    força da tendência, da sazonalidade e do resíduo, obtidas de uma única
+    decomposição STL.
+
+    Args:
+        period (int): Período sazonal da STL. Se None, é inferido da frequência.
+        freq (str): Frequência aplicada à série antes da STL.
+        decimals (int): Casas decimais.
+
+    Returns:
+        pd.Series: Estatísticas indexadas por nome ('mean', 'median', 'std', 'min',
+                   'max', 'q1', 'q3', 'trend_strength', 'seasonal_strength',
+                   'residual_strength'). Forças retornam NaN se a STL falhar.
+    """
+    ts = self.asfreq(freq) if freq else self
+    stats = _summary_stats(pd.DataFrame(ts), period, decimals)
+    return stats.iloc[:, 0].rename(self.name)
+
   def trend(self, strength: bool = False, period: int = None, freq: str = None, decimals: int = 4) -> Union['UniTimeSeries', float]:
     res = self.stl(period, freq, decimals)
     if strength:
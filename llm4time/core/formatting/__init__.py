@@ -2,22 +2,64 @@ from ._formats import *
 from ._parsers import *
 from ._encoders import *
 from ._decoders import *
+from ._registry import *
+from ._benchmark import *
 
-from ..data import TimeSeries, TSFormat
-
-
-def from_str(string: str, format: TSFormat) -> TimeSeries:
-  formats_map = {
-      TSFormat.ARRAY: from_array,
-      TSFormat.CONTEXT: from_context,
-      TSFormat.CSV: from_csv,
-      TSFormat.CUSTOM: from_custom,
-      TSFormat.JSON: from_json,
-      TSFormat.MARKDOWN: from_markdown,
-      TSFormat.PLAIN: from_plain,
-      TSFormat.SYMBOL: from_symbol,
-      TSFormat.TSV: from_tsv,
-  }
-  if format not in formats_map:
-    raise ValueError(f"Unknown format: {format}.")
-  return decode_textual(formats_map[format](string))
+from ..data import TimeSeries, TSFormat, Scaler
+import pandas as pd
+
+
+def from_str(
+    string: str,
+    format: TSFormat | str,
+    scaler: Scaler | None = None,
+    last: TimeSeries | pd.Timestamp | str | None = None,
+    freq: str | pd.DateOffset | None = None
+) -> TimeSeries:
+  """
+  Converte uma string (ex: a previsão de um modelo) em série temporal.
+
+  Args:
+      string (str): Série serializada em `format`.
+      format (TSFormat | str): Formato da série (ver `register_format`).
+      scaler (Scaler | None): Scaler usado na serialização, para inverter a escala.
+      last (TimeSeries | pd.Timestamp | str | None): Última observação conhecida ou
+          a própria série de histórico. Se informado, a string é lida sem índice
+          (`to_str(..., index=False)`) e os instantes são reconstruídos a partir dele.
+      freq (str | pd.DateOffset | None): Frequência dos instantes reconstruídos. Se
+          None, usa a frequência do índice de `last`.
+
+  Returns:
+      TimeSeries: Série temporal.
+
+  Raises:
+      ValueError: Se o formato não for suportado ou a frequência não puder ser
+          determinada.
+  """
+  spec = get_format(format)
+  if last is None:
+    ts = decode_textual(spec.decode(string))
+  else:
+    ts = decode_textual(spec.decode(string, index=False))
+    ts.index = _future_index(last, freq, len(ts))
+  return ts if scaler is None else scaler.inverse(ts)
+
+
+def _future_index(
+    last: TimeSeries | pd.Timestamp | str,
+    freq: str | pd.DateOffset | None,
+    periods: int
+) -> pd.DatetimeIndex:
+  """
+  Os `periods` instantes seguintes a `last`, na frequência `freq`.
+  """
+  name = None
+  if isinstance(last, (pd.Series, pd.DataFrame)):
+    freq = freq or last.index.freq
+    if freq is None and len(last.index) >= 3:
+      freq = pd.infer_freq(last.index)
+    last, name = last.index[-1], last.index.name
+  if freq is None:
+    raise ValueError("Frequency must be set to rebuild the index.")
+  index = pd.date_range(pd.Timestamp(last), periods=periods + 1, freq=freq, name=name)
+  return index[1:]
@@ -0,0 +1,107 @@
+from typing import Any, Callable
+from ..data import TimeSeries, TSType
+from ..prompts._tokens import count_tokens
+from ._registry import get_format, list_formats, _key
+import llm4time.core.formatting as l4f
+import numpy as np
+import pandas as pd
+import time
+
+
+def benchmark_formats(
+    ts: TimeSeries,
+    formats: list[str] | None = None,
+    type: TSType = TSType.NUMERIC,
+    tokenizer: Callable[[str], Any] | None = None,
+    repeat: int = 3,
+    **options
+) -> pd.DataFrame:
+  """
+  Compara o custo e a fidelidade dos formatos registrados em uma série.
+
+  Cada formato codifica a série com `to_str` e decodifica o resultado com
+  `from_str`. Os tempos são o melhor de `repeat` execuções. A fidelidade compara
+  a série lida com a original: `roundtrip` indica se índice e valores foram
+  recuperados exatamente e `max_error` é o maior erro absoluto dos valores (ex:
+  o arredondamento de `decimals`). Formatos que falham na leitura ficam com
+  tempo de decodificação e erro NaN.
+
+  Args:
+      ts (TimeSeries): Série temporal.
+      formats (list[str] | None): Formatos comparados. Se None, todos os formatos
+                                  registrados que aceitam a série e o tipo.
+      type (TSType): Tipo da representação (numérica ou textual).
+      tokenizer (Callable[[str], Any] | None): Tokenizador usado na contagem de tokens.
+      repeat (int): Execuções de cada medição de tempo.
+      **options: Opções de serialização passadas para `to_str` (ex: `decimals`,
+                 `scaler`, `index=False`).
+
+  Returns:
+      pd.DataFrame: Uma linha por formato (índice `format`), com as colunas
+          `encode_time`, `decode_time` (segundos), `chars`, `tokens`, `roundtrip` e
+          `max_error`.
+
+  Raises:
+      ValueError: Se `repeat` for menor que 1 ou um formato não estiver registrado.
+  """
+  if repeat < 1:
+    raise ValueError("Repeat must be at least 1.")
+  if formats is None:
+    specs = list_formats(ts, type)
+  else:
+    specs = [get_format(f) for f in formats]
+
+  # Sem índice, os instantes são reconstruídos a partir do anterior ao primeiro;
+  # sem frequência conhecida, a leitura falha e é registrada como tal.
+  decode_options = {"scaler": options.get("scaler")}
+  if not options.get("index", True) and len(ts):
+    freq = getattr(ts.index, "freq", None)
+    last = ts.index[0] - freq if freq is not None else ts.index[0]
+    decode_options.update(last=last, freq=freq)
+
+  rows = {}
+  for spec in specs:
+    string, encode_time = _timed(lambda: ts.to_str(spec.name, type, **options), repeat)
+    try:
+      decoded, decode_time = _timed(
+          lambda: l4f.from_str(string, spec.name, **decode_options), repeat)
+      roundtrip, max_error = _fidelity(ts, decoded)
+    except Exception:
+      decode_time, roundtrip, max_error = np.nan, False, np.nan
+    rows[_key(spec.name)] = {
+        "encode_time": encode_time,
+        "decode_time": decode_time,
+        "chars": len(string),
+        "tokens": count_tokens(string, tokenizer),
+        "roundtrip": roundtrip,
+        "max_error": max_error,
+    }
+  return pd.DataFrame.from_dict(rows, orient="index").rename_axis("format")
+
+
+def _timed(function: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+  # Resultado da última execução e o menor tempo entre as `repeat` execuções.
+  best = np.inf
+  for _ in range(repeat):
+    start_time = time.perf_counter()
+    result = function()
+    best = min(best, time.perf_counter() - start_time)
+  return result, best
+
+
+def _fidelity(original: TimeSeries, decoded: TimeSeries | None) -> tuple[bool, float]:
+  """
+  Compara a série lida com a original: (recuperada exatamente, maior erro absoluto).
+  """
+  if decoded is None:
+    return False, np.nan
+  expected = np.asarray(original.to_numpy(dtype=float)).reshape(len(original), -1)
+  actual = np.asarray(decoded.to_numpy(dtype=float)).reshape(len(decoded), -1)
+  if expected.shape != actual.shape:
+    return False, np.nan
+  missing = np.isnan(expected)
+  if (missing != np.isnan(actual)).any():
+    return False, np.nan
+  error = np.abs(expected - actual)[~missing]
+  max_error = float(error.max()) if len(error) else 0.0
+  return bool(original.index.equals(decoded.index) and max_error == 0.0), max_error
@@ -1,24 +1,87 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+import numpy as np
+import pandas as pd
 import re
 
+# Números espaçados têm ao menos um dígito: marcadores como '-' ou '.' são texto.
+_NUMBER = re.compile(r"[-\s.]*\d[-\d\s.]*")
+# Sobre os valores unidos por '\x00' (sem espaços): todos são números / algum é número.
+_ALL_NUMBERS = re.compile(r"[-.]*\d[-\d.]*(?:\x00[-.]*\d[-\d.]*)*")
+_ANY_NUMBER = re.compile(r"(?:\A|(?<=\x00))[-\s.]*\d[-\d\s.]*(?=\x00|\Z)")
+
 
 def decode_textual(ts: TimeSeries) -> TimeSeries:
   ts = ts.copy()
 
-  def decode(v):
-    s = str(v).strip()
-    if re.fullmatch(r"[-\d\s.]+", s):
-      return float(s.replace(" ", ""))
-    return v
-
   if isinstance(ts, UniTimeSeries):
-    ts = ts.apply(decode)
+    ts = ts._constructor(_decode(ts), index=ts.index, name=ts.name)
 
   elif isinstance(ts, MultiTimeSeries):
-    for col in ts.columns:
-      ts[col] = ts[col].apply(decode)
+    # Colunas numéricas ou de texto; categóricas, booleanas e datas ficam como estão.
+    for col in ts.select_dtypes(include=["number", "object"]).columns:
+      ts[col] = _decode(ts[col])
 
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
   return ts
+
+
+def _decode(column: pd.Series) -> np.ndarray:
+  """
+  Converte os valores espaçados ("1 2 . 5") de volta para float.
+
+  Apenas as colunas numéricas são lidas: colunas já numéricas viram float e
+  colunas de texto só quando trazem números espaçados. As demais (ex: categóricas
+  ou com marcadores como '-') são mantidas, assim como valores que não são
+  números espaçados.
+  """
+  values = column.to_numpy()
+  if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iuf":
+    return values.astype(float)
+  if column.dtype != object:
+    return values
+
+  valid = np.flatnonzero(~pd.isna(values))
+  strings = list(map(str, values[valid]))
+  text = "\x00".join(strings)
+  if not strings or text.count("\x00") != len(strings) - 1:
+    return _decode_values(values, valid, strings)
+
+  # Remove os espaços de todos os valores de uma vez e valida a coluna inteira.
+  text = text.replace(" ", "")
+  if _ALL_NUMBERS.fullmatch(text):
+    try:
+      numbers = np.array(text.split("\x00"), dtype=object).astype(float)
+    except ValueError:
+      # Sequências como '1-2' passam no padrão, mas não são números.
+      return _decode_values(values, valid, strings)
+    result = np.full(len(values), np.nan)
+    result[valid] = numbers
+    return result
+  if not _ANY_NUMBER.search(text):
+    return values
+  return _decode_values(values, valid, strings)
+
+
+def _decode_values(
+    values: np.ndarray,
+    valid: np.ndarray,
+    strings: list[str]
+) -> np.ndarray:
+  # Caminho valor a valor, para colunas que misturam números e textos.
+  numbers = [_float(s) if _NUMBER.fullmatch(s) else None
+             for s in map(str.strip, strings)]
+  matched = np.array([n is not None for n in numbers], dtype=bool)
+  if not matched.any():
+    return values
+  result = np.full(len(values), np.nan) if matched.all() else values.copy()
+  result[valid[matched]] = [n for n in numbers if n is not None]
+  return result
+
+
+def _float(string: str) -> float | None:
+  try:
+    return float(string.replace(" ", ""))
+  except ValueError:
+    return None
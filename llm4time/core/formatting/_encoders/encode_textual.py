@@ -1,25 +1,45 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from .._formats._strings import _numeric_strings
+import numpy as np
 import pandas as pd
 
 
 def encode_textual(ts: TimeSeries) -> TimeSeries:
   ts = ts.copy()
 
-  def encode(v):
-    if pd.isna(v):
-      return v
-    return ' '.join(str(v))
-
   if isinstance(ts, UniTimeSeries):
+    encoded = _encode(ts)
     ts = ts.astype(object)
-    ts[:] = ts.apply(encode)
+    ts[:] = encoded
 
   elif isinstance(ts, MultiTimeSeries):
     for col in ts.num_columns:
-      ts[col] = ts[col].astype(object)
-      ts[col] = ts[col].apply(encode)
+      ts[col] = _encode(ts[col])
 
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
   return ts
+
+
+def _encode(column: pd.Series) -> np.ndarray:
+  # ' '.join(str(v)) de cada valor não ausente; ausentes são mantidos.
+  values = column.to_numpy()
+  valid = ~pd.isna(values)
+  if not valid.any():
+    return values
+  result = values.astype(object)
+  if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iuf":
+    strings = _numeric_strings(values[valid])
+  else:
+    strings = list(map(str, values[valid]))
+  result[valid] = _spaced(strings)
+  return result
+
+
+def _spaced(strings: list[str]) -> list[str]:
+  # Espaça todos os valores de uma vez: "1.5\x002" -> "1 . 5 \x00 2".
+  text = "\x00".join(strings)
+  if not strings or text.count("\x00") != len(strings) - 1:
+    return [" ".join(s) for s in strings]
+  return " ".join(text).split(" \x00 ")
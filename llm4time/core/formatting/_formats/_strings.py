@@ -0,0 +1,86 @@
+from ...data import TimeSeries, UniTimeSeries
+import numpy as np
+import pandas as pd
+
+
+def _index_strings(index: pd.Index) -> list[str]:
+  """
+  `str(idx)` de cada instante, calculado em bloco.
+
+  Índices datetime sem fuso e sem frações de segundo (o caso comum) são
+  convertidos de uma vez por `np.datetime_as_string`; os demais caem para
+  `str` elemento a elemento, preservando a representação exata.
+  """
+  if isinstance(index, pd.DatetimeIndex) and index.tz is None and len(index):
+    values = index.to_numpy()
+    seconds = values.astype("datetime64[s]")
+    if not (values != seconds)[~np.isnat(values)].any():
+      # 'AAAA-MM-DDTHH:MM:SS' -> 'AAAA-MM-DD HH:MM:SS', trocando o 'T' em uma
+      # única passada.
+      stamps = np.datetime_as_string(seconds, unit="s").tolist()
+      return "\n".join(stamps).replace("T", " ").split("\n")
+  return list(map(str, index))
+
+
+def _value_strings(ts: TimeSeries, none: str | None = None) -> list[list[str]]:
+  """
+  `str(v)` dos valores, uma lista por coluna.
+
+  Colunas inteiras e de ponto flutuante são convertidas pelo NumPy, cuja
+  representação mais curta de float64 é idêntica à de `repr(float)`.
+
+  Args:
+      ts (TimeSeries): Série temporal.
+      none (str | None): Texto usado no lugar de valores None. Se None, usa `str(None)`.
+
+  Returns:
+      list[list[str]]: Valores convertidos, por coluna.
+  """
+  to_str = str if none is None else lambda v: none if v is None else str(v)
+  if isinstance(ts, UniTimeSeries):
+    if not isinstance(ts.dtype, np.dtype) or ts.dtype.kind not in "iuf":
+      return [list(map(to_str, ts.to_list()))]
+    values = ts.to_numpy().reshape(-1, 1)
+  else:
+    values = ts.to_numpy()
+
+  if values.dtype.kind in "iuf":
+    n = len(values)
+    flat = _numeric_strings(np.ascontiguousarray(values.T).ravel())
+    if not n:
+      return [[] for _ in range(values.shape[1])]
+    return [flat[i:i + n] for i in range(0, len(flat), n)]
+  return [list(map(to_str, column)) for column in values.T.tolist()]
+
+
+def _numeric_strings(values: np.ndarray) -> list[str]:
+  """
+  `str(v)` de um array numérico unidimensional.
+
+  Séries com muitos valores repetidos (ex: dados arredondados ou inteiros)
+  convertem cada valor distinto uma única vez. Os valores são comparados pelos
+  bits, distinguindo -0.0 de 0.0.
+  """
+  if values.dtype.kind == "f":
+    values = values.astype(np.float64)
+  bits = values.view(np.int64) if values.dtype.kind == "f" else values
+  ordered = np.sort(bits)
+  distinct = ordered
+  if len(ordered):
+    distinct = ordered[np.concatenate(([True], ordered[1:] != ordered[:-1]))]
+  if len(distinct) > len(values) // 2:
+    return values.astype(str).tolist()
+  strings = np.array(distinct.view(values.dtype).astype(str).tolist(), dtype=object)
+  return strings[np.searchsorted(distinct, bits)].tolist()
+
+
+def _template(*parts: str) -> str:
+  # Partes literais de um template `%`, com '%' escapado.
+  return "%s".join(part.replace("%", "%%") for part in parts)
+
+
+def _lines(template: str, *columns: list[str]) -> str:
+  """
+  Aplica `template % linha` a cada linha e une o resultado com quebras de linha.
+  """
+  return "\n".join(map(template.__mod__, zip(*columns)))
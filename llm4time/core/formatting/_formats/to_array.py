@@ -1,7 +1,8 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
 
 
-def to_array(ts: TimeSeries) -> str:
+def to_array(ts: TimeSeries, index: bool = True) -> str:
+  # O formato array não tem índice: `index` é aceito para uniformidade com os demais.
   if isinstance(ts, UniTimeSeries) or isinstance(ts, MultiTimeSeries):
     return str(ts.values.tolist() if not ts.empty else [])
   else:
@@ -1,16 +1,20 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from ._strings import _index_strings, _value_strings, _template, _lines
 
 
-def to_context(ts: TimeSeries) -> str:
+def to_context(ts: TimeSeries, index: bool = True) -> str:
   if isinstance(ts, UniTimeSeries):
     header = f"{ts.index.name},{ts.name}"
-    values = [[v] for v in ts.to_list()]
   elif isinstance(ts, MultiTimeSeries):
     header = f"{ts.index.name},{",".join(ts.columns)}"
-    values = ts.to_numpy().tolist()
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
-  lines = [f"{idx}," + ",".join(f"[{v}]" for v in row)
-           for idx, row in zip(ts.index, values)]
-  return header + "\n" + "\n".join(lines)
+  columns = _value_strings(ts)
+  template = _template("[", *["],["] * (len(columns) - 1), "]")
+  if not index:
+    header = header[len(f"{ts.index.name},"):]
+  else:
+    columns = [_index_strings(ts.index), *columns]
+    template = "%s," + template
+  return header + "\n" + _lines(template, *columns)
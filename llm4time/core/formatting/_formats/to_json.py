@@ -1,19 +1,56 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from ._strings import _index_strings, _value_strings
+import numpy as np
 import json
+import re
 
+# Caracteres que `json.dumps` escaparia em uma string.
+_ESCAPED = re.compile(r'[\x00-\x1f"\\\x7f-\U0010ffff]')
+_CONSTANTS = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
 
-def to_json(ts: TimeSeries) -> str:
+
+def to_json(ts: TimeSeries, index: bool = True) -> str:
   if isinstance(ts, UniTimeSeries):
     columns = [ts.name]
-    values = [[v] for v in ts.to_list()]
   elif isinstance(ts, MultiTimeSeries):
     columns = ts.columns
-    values = ts.to_numpy().tolist()
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
+  keys = [ts.index.name, *columns] if index else list(columns)
+  array = ts.to_numpy()
+  # Extensões do pandas (ex: Float64 com <NA>) e chaves não textuais ou repetidas
+  # seguem pelo caminho genérico.
+  numeric = array.dtype.kind in "iuf" and (
+      isinstance(ts, MultiTimeSeries) or isinstance(ts.dtype, np.dtype))
+  unique = len(set(keys)) == len(keys) and all(isinstance(key, str) for key in keys)
+  if not numeric or not unique:
+    return _to_json(ts, columns, index)
+
+  # Mesma saída do `json.dumps` padrão (separadores ', ' e ': '), montada por linha.
+  values = _value_strings(ts)
+  if array.dtype.kind == "f" and not np.isfinite(array).all():
+    values = [[_CONSTANTS.get(v, v) for v in column] for column in values]
+  fields = [f"{json.dumps(key).replace('%', '%%')}: %s" for key in keys]
+  if index:
+    stamps = _index_strings(ts.index)
+    if _ESCAPED.search("".join(stamps)):
+      values = [list(map(json.dumps, stamps)), *values]
+    else:
+      values = [stamps, *values]
+      fields[0] = fields[0][:-2] + '"%s"'
+  template = "{" + ", ".join(fields) + "}"
+  return "[" + ", ".join(map(template.__mod__, zip(*values))) + "]"
+
+
+def _to_json(ts: TimeSeries, columns: list, index: bool = True) -> str:
+  if isinstance(ts, UniTimeSeries):
+    values = [[v] for v in ts.to_list()]
+  else:
+    values = ts.to_numpy().tolist()
   data = [
-      {ts.index.name: idx, **{col: val for col, val in zip(columns, row)}}
+      {**({ts.index.name: idx} if index else {}),
+       **{col: val for col, val in zip(columns, row)}}
       for idx, row in zip([str(idx) for idx in ts.index], values)
   ]
   return json.dumps(data)
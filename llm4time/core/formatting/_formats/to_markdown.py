@@ -1,17 +1,20 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from ._strings import _index_strings, _value_strings, _template, _lines
 
 
-def to_markdown(ts: TimeSeries) -> str:
+def to_markdown(ts: TimeSeries, index: bool = True) -> str:
   if isinstance(ts, UniTimeSeries):
     header = f"|{ts.index.name}|{ts.name}|"
-    values = [[v] for v in ts.to_list()]
   elif isinstance(ts, MultiTimeSeries):
     header = "|" + ts.index.name + "|" + "|".join(ts.columns) + "|"
-    values = ts.to_numpy().tolist()
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
+  columns = _value_strings(ts)
+  if not index:
+    header = header[len(f"|{ts.index.name}"):]
+  else:
+    columns = [_index_strings(ts.index), *columns]
   sep = "|" + "|".join("---" for _ in header.split("|") if _ != "") + "|"
-  rows = [f"|{idx}|" + "|".join(str(v) for v in row) +
-          "|" for idx, row in zip(ts.index, values)]
-  return header + "\n" + sep + "\n" + "\n".join(rows)
+  template = _template("|", *["|"] * (len(columns) - 1), "|")
+  return header + "\n" + sep + "\n" + _lines(template, *columns)
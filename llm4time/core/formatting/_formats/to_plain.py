@@ -1,19 +1,18 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from ._strings import _index_strings, _value_strings, _template, _lines
 
 
-def to_plain(ts: TimeSeries) -> str:
+def to_plain(ts: TimeSeries, index: bool = True) -> str:
   if isinstance(ts, UniTimeSeries):
-    values = [[v] for v in ts.to_list()]
     columns = [ts.name]
   elif isinstance(ts, MultiTimeSeries):
-    values = ts.to_numpy().tolist()
     columns = ts.columns
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
-  lines = [
-      f"{ts.index.name}: {idx}, " +
-      ", ".join(f"{col}: {val}" for col, val in zip(columns, row))
-      for idx, row in zip(ts.index, values)
-  ]
-  return "\n".join(lines)
+  values = _value_strings(ts)
+  if index:
+    columns, values = [ts.index.name, *columns], [_index_strings(ts.index), *values]
+  labels = [f"{col}: " if i == 0 else f", {col}: " for i, col in enumerate(columns)]
+  template = _template(*labels, "")
+  return _lines(template, *values)
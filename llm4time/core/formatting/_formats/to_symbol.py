@@ -1,7 +1,7 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
 
 
-def to_symbol(ts: TimeSeries) -> str:
+def to_symbol(ts: TimeSeries, index: bool = True) -> str:
   def directions(vals):
     prev = None
     for v in vals:
@@ -17,9 +17,10 @@ def to_symbol(ts: TimeSeries) -> str:
 
   if isinstance(ts, UniTimeSeries):
     values = ts.to_list()
-    header = f"{ts.index.name},Value,DirectionIndicator"
-    lines = [f"{idx},{v},{d}" for idx, v, d in zip(
-        ts.index, values, directions(values))]
+    stamps = [f"{idx}," for idx in ts.index] if index else [""] * len(values)
+    header = (f"{ts.index.name}," if index else "") + "Value,DirectionIndicator"
+    lines = [f"{stamp}{v},{d}" for stamp, v, d in zip(
+        stamps, values, directions(values))]
 
   elif isinstance(ts, MultiTimeSeries):
     values = ts.to_numpy().tolist()
@@ -37,8 +38,10 @@ def to_symbol(ts: TimeSeries) -> str:
             f"{v},{'↑' if v > pv else '↓' if v < pv else '→'}"
             for v, pv in zip(row, prev_row)
         ]
-      lines.append(f"{idx}," + ",".join(row_parts))
+      lines.append((f"{idx}," if index else "") + ",".join(row_parts))
       prev_row = row
+    if not index:
+      header = header[len(f"{ts.index.name},"):]
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
@@ -1,18 +1,19 @@
 from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries
+from ._strings import _index_strings, _value_strings, _template, _lines
 
 
-def to_tsv(ts: TimeSeries) -> str:
+def to_tsv(ts: TimeSeries, index: bool = True) -> str:
   if isinstance(ts, UniTimeSeries):
     header = f"{ts.index.name}\t{ts.name}"
-    values = [[v] for v in ts.to_list()]
   elif isinstance(ts, MultiTimeSeries):
     header = ts.index.name + "\t" + "\t".join(map(str, ts.columns))
-    values = ts.to_numpy().tolist()
   else:
     raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
 
-  lines = [
-      f"{idx}\t" + "\t".join(str(v) if v is not None else "nan" for v in row)
-      for idx, row in zip(ts.index, values)
-  ]
-  return header + "\n" + "\n".join(lines)
+  columns = _value_strings(ts, none="nan")
+  if not index:
+    header = header[len(f"{ts.index.name}\t"):]
+  else:
+    columns = [_index_strings(ts.index), *columns]
+  template = _template("", *["\t"] * (len(columns) - 1), "")
+  return header + "\n" + _lines(template, *columns)
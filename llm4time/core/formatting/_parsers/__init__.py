@@ -7,3 +7,4 @@ from .from_markdown import *
 from .from_plain import *
 from .from_symbol import *
 from .from_tsv import *
+from .parse_forecast import *
@@ -3,7 +3,8 @@ import pandas as pd
 from ...data import TimeSeries, read_file
 
 
-def from_array(string: str) -> TimeSeries:
+def from_array(string: str, index: bool = True) -> TimeSeries:
+  # O formato array não tem índice: `index` é aceito para uniformidade com os demais.
   data = ast.literal_eval(string) or []
   df = pd.DataFrame(data)
   return read_file(df)
@@ -4,7 +4,7 @@ from ...data import TimeSeries, read_file
 import re
 
 
-def from_context(string: str) -> TimeSeries:
+def from_context(string: str, index: bool = True) -> TimeSeries:
   string = re.sub(r'\[([^\]]+)\]', r'\1', string)
   df = pd.read_csv(StringIO(string))
-  return read_file(df, index_col=df.columns[0])
+  return read_file(df, index_col=df.columns[0] if index else None)
@@ -3,6 +3,6 @@ from io import StringIO
 from ...data import TimeSeries, read_file
 
 
-def from_csv(string: str) -> TimeSeries:
+def from_csv(string: str, index: bool = True) -> TimeSeries:
   df = pd.read_csv(StringIO(string))
-  return read_file(df, index_col=df.columns[0])
+  return read_file(df, index_col=df.columns[0] if index else None)
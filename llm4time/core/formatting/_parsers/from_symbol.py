@@ -3,6 +3,7 @@ from io import StringIO
 from ...data import TimeSeries, read_file
 
 
-def from_symbol(string: str) -> TimeSeries:
-  df = pd.read_csv(StringIO(string)).iloc[:, :-1]
-  return read_file(df, index_col=df.columns[0])
+def from_symbol(string: str, index: bool = True) -> TimeSeries:
+  df = pd.read_csv(StringIO(string))
+  df = df.loc[:, ~df.columns.str.endswith("DirectionIndicator")]
+  return read_file(df, index_col=df.columns[0] if index else None)
@@ -3,6 +3,6 @@ from io import StringIO
 from ...data import TimeSeries, read_file
 
 
-def from_tsv(string: str) -> TimeSeries:
+def from_tsv(string: str, index: bool = True) -> TimeSeries:
   df = pd.read_csv(StringIO(string), sep="\t")
-  return read_file(df, index_col=df.columns[0])
+  return read_file(df, index_col=df.columns[0] if index else None)
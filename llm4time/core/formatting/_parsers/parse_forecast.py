@@ -0,0 +1,269 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from ...data import TimeSeries, UniTimeSeries, MultiTimeSeries, TSFormat, Scaler
+from .._formats._strings import _index_strings
+import numpy as np
+import pandas as pd
+import json
+import re
+
+_FENCE = re.compile(r"^\s*(?:```\w*|</?out>)\s*$")
+_MARKDOWN_RULE = re.compile(r"^\|?\s*:?-{3,}")
+_PAIR = re.compile(r"\s*([^:,]+?)\s*:\s*([^,]*)")
+_OBJECT = re.compile(r"\{[^{}]*\}")
+_ROW = re.compile(r"\[([^\[\]]*)\]")
+_SEPARATORS = {
+    TSFormat.CSV: ",",
+    TSFormat.CONTEXT: ",",
+    TSFormat.SYMBOL: ",",
+    TSFormat.TSV: "\t",
+    TSFormat.CUSTOM: "|",
+    TSFormat.MARKDOWN: "|",
+}
+
+
+@dataclass
+class ParseIssue:
+  """
+  Linha da resposta que não pôde ser usada.
+
+  Attributes:
+      line (int): Número da linha (a partir de 1) ou do registro, no caso de JSON
+          e array.
+      text (str): Conteúdo da linha.
+      reason (str): Motivo: 'malformed', 'unexpected timestamp', 'duplicate' ou
+          'beyond horizon'.
+  """
+  line: int
+  text: str
+  reason: str
+
+
+@dataclass
+class ParsedForecast:
+  """
+  Previsão lida por `parse_forecast`, alinhada ao índice esperado.
+
+  Attributes:
+      series (TimeSeries): Valores no índice esperado; posições sem valor ficam NaN.
+      missing (list): Instantes (ou posições) esperados que não vieram na resposta.
+      issues (list[ParseIssue]): Linhas ignoradas e o motivo.
+  """
+  series: TimeSeries
+  missing: list = field(default_factory=list)
+  issues: list[ParseIssue] = field(default_factory=list)
+
+  @property
+  def complete(self) -> bool:
+    return not self.missing and not self.issues
+
+
+def parse_forecast(
+    string: str,
+    index: pd.Index | int,
+    format: TSFormat = TSFormat.CSV,
+    columns: list[str] | None = None,
+    scaler: Scaler | None = None
+) -> ParsedForecast:
+  """
+  Lê a previsão de um modelo sem passar por `pd.read_csv`/`read_file`.
+
+  Os valores são extraídos em uma única passada com padrões pré-compilados e
+  alinhados aos instantes esperados: linhas com instante vão para a posição
+  correspondente e linhas sem instante (ex: formato array) seguem a ordem da
+  resposta. Linhas malformadas, repetidas, fora do índice ou além do horizonte
+  são registradas em `issues` em vez de gerar exceção. Valores da
+  representação textual ("1 2 . 5") são aceitos.
+
+  Args:
+      string (str): Previsão (ex: conteúdo do bloco `<out>`).
+      index (pd.Index | int): Instantes futuros esperados ou apenas o horizonte.
+      format (TSFormat): Formato em que a previsão foi escrita.
+      columns (list[str] | None): Colunas esperadas. Se None, usa o cabeçalho (ou as
+                                  chaves, em JSON e texto simples) da resposta; sem
+                                  nomes, as colunas são numeradas.
+      scaler (Scaler | None): Scaler usado no prompt, para inverter a escala dos
+                              valores.
+
+  Returns:
+      ParsedForecast: Série alinhada, instantes ausentes e linhas ignoradas.
+
+  Raises:
+      ValueError: Se o formato não for suportado.
+  """
+  index = pd.RangeIndex(index) if isinstance(index, int) else index
+  columns = None if columns is None else list(columns)
+  format = TSFormat(format)
+  if format in _SEPARATORS:
+    names, rows = _delimited(string, format, columns)
+  elif format == TSFormat.PLAIN:
+    names, rows = _pairs(string, columns)
+  elif format == TSFormat.JSON:
+    names, rows = _records(string, columns)
+  elif format == TSFormat.ARRAY:
+    names, rows = columns, _arrays(string)
+  else:
+    raise ValueError(f"Unknown format: {format}.")
+  if not names:
+    # Sem nomes (ex: array), as colunas são numeradas como em `from_array`.
+    names = list(range(max((len(r[3]) for r in rows if r[3]), default=1)))
+  parsed = _align(rows, index, names)
+  if scaler is not None:
+    parsed.series = scaler.inverse(parsed.series)
+  return parsed
+
+
+def _lines(string: str) -> Iterator[tuple[int, str]]:
+  for number, line in enumerate(string.splitlines(), start=1):
+    if line.strip() and not _FENCE.match(line):
+      yield number, line
+
+
+def _number(text: Any) -> float:
+  if isinstance(text, (int, float)) and not isinstance(text, bool):
+    return float(text)
+  return float(str(text).strip().strip("[]'\"").replace(" ", ""))
+
+
+def _is_number(text: Any) -> bool:
+  try:
+    _number(text)
+    return True
+  except (ValueError, TypeError):
+    return text is None
+
+
+def _delimited(
+    string: str,
+    format: TSFormat,
+    columns: list[str] | None
+) -> tuple[list[str] | None, list]:
+  # Linhas (número, texto, instante | None, valores) dos formatos delimitados.
+  sep = _SEPARATORS[format]
+  stride = 2 if format == TSFormat.SYMBOL else 1
+  names, labels, header, rows = columns, None, None, []
+  for number, line in _lines(string):
+    if format == TSFormat.MARKDOWN:
+      if _MARKDOWN_RULE.match(line.strip()):
+        continue
+      line = line.strip().strip("|")
+    fields = [f.strip() for f in line.split(sep)]
+
+    # Primeira linha com texto onde deveriam estar os valores: cabeçalho.
+    numbers = all(map(_is_number, fields[1::stride] or fields))
+    if not rows and labels is None and not numbers:
+      labels = fields
+      continue
+
+    # Sem o instante (ex: `index=False`), todos os campos são valores.
+    if names is not None:
+      bare = len(fields) == len(names) * stride
+    else:
+      bare = _is_number(fields[0])
+    if bare:
+      stamp, values = None, fields[::stride]
+    else:
+      stamp, values = fields[0], fields[1::stride]
+    # O cabeçalho só tem a coluna do instante se as linhas também tiverem.
+    if labels is not None and header is None:
+      header = labels[::stride] if stamp is None else labels[1::stride]
+      names = header if names is None else names
+    # Colunas pedidas em outra ordem que a do cabeçalho.
+    if header and names != header and len(values) == len(header):
+      if set(names) <= set(header):
+        values = [values[header.index(c)] for c in names]
+    rows.append((number, line, stamp, values))
+  if names is None and labels is not None:
+    names = labels[1::stride] or labels
+  return names, rows
+
+
+def _split_keys(keys: list, record: dict, names: list[str] | None) -> tuple[Any, list]:
+  # Instante (primeira chave que não é coluna) e valores de um registro.
+  if names is None:
+    names = [k for k in keys if _is_number(record[k])]
+  stamp = next((record[k] for k in keys if k not in names), None)
+  return stamp, names
+
+
+def _pairs(string: str, columns: list[str] | None) -> tuple[list[str] | None, list]:
+  names, rows = columns, []
+  for number, line in _lines(string):
+    pairs = dict((k, v.strip()) for k, v in _PAIR.findall(line))
+    stamp, names = _split_keys(list(pairs), pairs, names)
+    rows.append((number, line, stamp, [pairs.get(c) for c in names]))
+  return names, rows
+
+
+def _records(string: str, columns: list[str] | None) -> tuple[list[str] | None, list]:
+  try:
+    data = json.loads(string)
+    data = data if isinstance(data, list) else [data]
+    records = [(i, json.dumps(r), r) for i, r in enumerate(data, start=1)]
+  except ValueError:
+    # JSON inválido (ex: resposta cortada): lê cada objeto completo separadamente.
+    records = []
+    for i, match in enumerate(_OBJECT.finditer(string), start=1):
+      try:
+        records.append((i, match.group(), json.loads(match.group())))
+      except ValueError:
+        records.append((i, match.group(), None))
+  names, rows = columns, []
+  for i, text, record in records:
+    if not isinstance(record, dict):
+      rows.append((i, text, None, None))
+      continue
+    stamp, names = _split_keys(list(record), record, names)
+    stamp = None if stamp is None else str(stamp)
+    rows.append((i, text, stamp, [record.get(c) for c in names]))
+  return names, rows
+
+
+def _arrays(string: str) -> list:
+  body = string.strip()
+  if body.startswith("[["):
+    values = _ROW.findall(body[1:-1])
+    return [
+        (i, "[" + v + "]", None, v.split(",")) for i, v in enumerate(values, start=1)
+    ]
+  values = body.strip("[]").split(",")
+  return [(i, v, None, [v]) for i, v in enumerate(values, start=1) if v.strip()]
+
+
+def _align(rows: list, index: pd.Index, names: list[str]) -> ParsedForecast:
+  horizon, width = len(index), len(names)
+  values = np.full((horizon, width), np.nan)
+  filled = np.zeros(horizon, dtype=bool)
+  positions = dict(zip(_index_strings(index), range(horizon)))
+  issues, cursor = [], 0
+
+  for number, text, stamp, fields in rows:
+    try:
+      if fields is None or len(fields) != width:
+        raise ValueError
+      row = [np.nan if v is None else _number(v) for v in fields]
+    except ValueError:
+      issues.append(ParseIssue(number, text, "malformed"))
+      continue
+
+    if stamp is None or isinstance(index, pd.RangeIndex):
+      position = cursor
+    elif (position := positions.get(stamp)) is None:
+      try:
+        position = index.get_loc(pd.Timestamp(stamp))
+      except (KeyError, ValueError, TypeError):
+        issues.append(ParseIssue(number, text, "unexpected timestamp"))
+        continue
+    cursor = position + 1
+    if position >= horizon:
+      issues.append(ParseIssue(number, text, "beyond horizon"))
+    elif filled[position]:
+      issues.append(ParseIssue(number, text, "duplicate"))
+    else:
+      values[position], filled[position] = row, True
+
+  if width == 1:
+    series = UniTimeSeries(pd.Series(values[:, 0], index=index, name=names[0]))
+  else:
+    series = MultiTimeSeries(pd.DataFrame(values, index=index, columns=names))
+  return ParsedForecast(series=series, missing=list(index[~filled]), issues=issues)
@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+from ..data import TimeSeries, UniTimeSeries, MultiTimeSeries, TSFormat, TSType
+from ._formats import *
+from ._parsers import *
+
+
+@dataclass(frozen=True)
+class FormatSpec:
+  """
+  Formato de serialização registrado: par codificador/decodificador e capacidades.
+
+  O codificador recebe a série e retorna a string; o decodificador faz o
+  caminho inverso. Ambos são chamados com `index=False` apenas no modo sem
+  índice, então funções de um único argumento também podem ser registradas.
+
+  Attributes:
+      name (str): Nome do formato (ex: TSFormat.CSV ou 'compact').
+      encoder (Callable[..., str]): `encoder(ts[, index=False]) -> str`.
+      decoder (Callable[..., TimeSeries]):
+          `decoder(string[, index=False]) -> TimeSeries`.
+      numeric (bool): Aceita a representação numérica (`TSType.NUMERIC`).
+      textual (bool): Aceita a representação textual (`TSType.TEXTUAL`).
+      univariate (bool): Aceita séries univariadas.
+      multivariate (bool): Aceita séries multivariadas.
+  """
+  name: str
+  encoder: Callable[..., str]
+  decoder: Callable[..., TimeSeries]
+  numeric: bool = True
+  textual: bool = True
+  univariate: bool = True
+  multivariate: bool = True
+
+  def supports(self, ts: TimeSeries | None = None, type: TSType | None = None) -> bool:
+    """
+    Indica se o formato aceita a série e o tipo de representação.
+
+    Args:
+        ts (TimeSeries | None): Série temporal. Se None, não verifica a série.
+        type (TSType | None): Tipo da representação. Se None, não verifica o tipo.
+
+    Returns:
+        bool: True se o formato aceita ambos.
+    """
+    if type is not None:
+      textual = TSType(type) == TSType.TEXTUAL
+      if not (self.textual if textual else self.numeric):
+        return False
+    if isinstance(ts, UniTimeSeries):
+      return self.univariate
+    if isinstance(ts, MultiTimeSeries):
+      return self.multivariate
+    return True
+
+  def encode(self, ts: TimeSeries, index: bool = True) -> str:
+    return self.encoder(ts) if index else self.encoder(ts, index=False)
+
+  def decode(self, string: str, index: bool = True) -> TimeSeries:
+    return self.decoder(string) if index else self.decoder(string, index=False)
+
+
+_FORMATS: dict[str, FormatSpec] = {}
+
+
+def _key(name: Any) -> str:
+  # Membros de TSFormat e seus valores ('csv') apontam para o mesmo registro.
+  return getattr(name, "value", name)
+
+
+def register_format(
+    name: str,
+    encoder: Callable[..., str],
+    decoder: Callable[..., TimeSeries],
+    numeric: bool = True,
+    textual: bool = True,
+    univariate: bool = True,
+    multivariate: bool = True,
+    replace: bool = False
+) -> FormatSpec:
+  """
+  Registra um formato, que passa a ser aceito por `to_str`, `from_str` e `prompt`.
+
+  Args:
+      name (str): Nome do formato.
+      encoder (Callable[..., str]): Converte a série em string. Para suportar o modo
+          sem índice, deve aceitar o argumento `index`.
+      decoder (Callable[..., TimeSeries]): Converte a string em série. Para suportar o
+          modo sem índice, deve aceitar o argumento `index`.
+      numeric (bool): Aceita a representação numérica.
+      textual (bool): Aceita a representação textual.
+      univariate (bool): Aceita séries univariadas.
+      multivariate (bool): Aceita séries multivariadas.
+      replace (bool): Se True, substitui um formato já registrado com o mesmo nome.
+
+  Returns:
+      FormatSpec: Formato registrado.
+
+  Raises:
+      ValueError: Se já existir um formato com o mesmo nome e `replace=False`.
+  """
+  if _key(name) in _FORMATS and not replace:
+    raise ValueError(f"Format '{_key(name)}' is already registered.")
+  spec = FormatSpec(name, encoder, decoder, numeric, textual, univariate, multivariate)
+  _FORMATS[_key(name)] = spec
+  return spec
+
+
+def unregister_format(name: str) -> None:
+  """
+  Remove um formato do registro.
+
+  Args:
+      name (str): Nome do formato.
+
+  Raises:
+      ValueError: Se o formato não estiver registrado.
+  """
+  if _FORMATS.pop(_key(name), None) is None:
+    raise ValueError(f"Unknown format: {name}.")
+
+
+def get_format(name: str) -> FormatSpec:
+  """
+  Retorna o formato registrado com o nome informado.
+
+  Args:
+      name (str): Nome do formato (ex: TSFormat.CSV ou 'csv').
+
+  Returns:
+      FormatSpec: Formato registrado.
+
+  Raises:
+      ValueError: Se o formato não estiver registrado.
+  """
+  if (spec := _FORMATS.get(_key(name))) is None:
+    raise ValueError(f"Unknown format: {name}.")
+  return spec
+
+
+def list_formats(
+    ts: TimeSeries | None = None,
+    type: TSType | None = None
+) -> list[FormatSpec]:
+  """
+  Lista os formatos registrados, na ordem de registro.
+
+  Args:
+      ts (TimeSeries | None): Se informado, apenas formatos que aceitam a série.
+      type (TSType | None): Se informado, apenas formatos que aceitam o tipo.
+
+  Returns:
+      list[FormatSpec]: Formatos registrados.
+  """
+  return [spec for spec in _FORMATS.values() if spec.supports(ts, type)]
+
+
+for _name, _encoder, _decoder in [
+    (TSFormat.ARRAY, to_array, from_array),
+    (TSFormat.CONTEXT, to_context, from_context),
+    (TSFormat.CSV, to_csv, from_csv),
+    (TSFormat.CUSTOM, to_custom, from_custom),
+    (TSFormat.JSON, to_json, from_json),
+    (TSFormat.MARKDOWN, to_markdown, from_markdown),
+    (TSFormat.PLAIN, to_plain, from_plain),
+    (TSFormat.SYMBOL, to_symbol, from_symbol),
+    (TSFormat.TSV, to_tsv, from_tsv),
+]:
+  register_format(_name, _encoder, _decoder)
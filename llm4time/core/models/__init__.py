@@ -1,4 +1,11 @@
 from ._base import *
+from ._cache import *
+from ._ratelimit import *
+from ._callbacks import *
+from ._hedge import *
 from .lmstudio import *
 from .openai import *
 from .azure import *
+from .replay import *
+from .router import *
+from ._server import *
@@ -1,20 +1,75 @@
 from enum import Enum
-from typing import Self
+from typing import Any, Self
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context, ContextVar, copy_context
+from llm4time._infra import logger
+import itertools
+import threading
+import asyncio
+import weakref
+import time
 import re
 
+import numpy as np
+import pandas as pd
+from ..data import TimeSeries, TSFormat
+from ..formatting import from_str, parse_forecast, ParsedForecast
+from ..prompts._tokens import count_tokens
+from ._cache import ResponseCache
+from ._ratelimit import RateLimiter
+from ._callbacks import Callback
+from ._hedge import HedgePolicy
+
+_OUT_OPEN = "<out>"
+_OUT_CLOSE = "</out>"
+
+_request_ids = itertools.count(1)
+# Medições da requisição em andamento: (timing, instante inicial).
+_timing: ContextVar[tuple["Timing", float] | None] = ContextVar(
+    "llm4time_timing", default=None)
+# Nas amostras paralelas, uma resposta sem bloco `<out>` vira uma candidata None
+# em vez de interromper as demais (ver `Model._merge`).
+_lenient: ContextVar[bool] = ContextVar("llm4time_lenient", default=False)
+
+
+def _record(span: str, seconds: float) -> None:
+  """
+  Acumula a duração de uma etapa na medição da requisição em andamento, se houver.
+  """
+  if (current := _timing.get()) is not None:
+    setattr(current[0], span, getattr(current[0], span) + seconds)
+
+
+def _messages(content: str | list[dict]) -> list[dict]:
+  """
+  Normaliza o conteúdo da requisição para uma lista de mensagens de chat.
+  """
+  return [{"role": "user", "content": content}] if isinstance(content, str) else content
+
+
+def _text(content: str | list[dict]) -> str:
+  """
+  Concatena o texto das mensagens, para estimativas de tokens e buscas por conteúdo.
+  """
+  if isinstance(content, str):
+    return content
+  return "\n\n".join(str(m.get("content") or "") for m in content)
+
 
 class Provider(str, Enum):
   LM_STUDIO = "lm_studio"
   OPENAI = "openai"
   AZURE = "azure"
+  REPLAY = "replay"
 
   def __str__(self):
     return {
         Provider.LM_STUDIO: "LM Studio",
         Provider.OPENAI: "OpenAI",
-        Provider.AZURE: "Azure"
+        Provider.AZURE: "Azure",
+        Provider.REPLAY: "Replay"
     }[self]
 
   @classmethod
@@ -22,6 +77,27 @@ class Provider(str, Enum):
     return next((m for m in cls if str(m) == name), None)
 
 
+@dataclass
+class Timing:
+  """
+  Etapas de uma requisição, em segundos, medidas com relógio monotônico.
+
+  Attributes:
+      queue (float): Espera antes do envio (limitador de taxa e novas tentativas).
+      connect (float): Criação do cliente ou da conexão com o provedor.
+      time_to_first_token (float | None): Tempo até o primeiro token (apenas streaming).
+      generation (float): Requisição ao provedor, do envio ao fim da resposta.
+      parse (float): Extração do bloco `<out>` da resposta.
+      total (float): Duração total da chamada, incluindo o cache.
+  """
+  queue: float = 0.0
+  connect: float = 0.0
+  time_to_first_token: float | None = None
+  generation: float = 0.0
+  parse: float = 0.0
+  total: float = 0.0
+
+
 @dataclass(kw_only=True)
 class ModelResponse:
   raw: str
@@ -29,24 +105,713 @@ class ModelResponse:
   input_tokens: int
   output_tokens: int
   time: float
+  cached: bool = False
+  time_to_first_token: float | None = None
+  time_to_out: float | None = None
+  samples: list[str | None] | None = None
+  cached_tokens: int = 0
+  timing: Timing | None = None
+
+  def candidates(self, tsformat: TSFormat = TSFormat.CSV) -> list[TimeSeries | None]:
+    """
+    Converte cada previsão candidata (`samples`) em série temporal.
+
+    Args:
+        tsformat (TSFormat): Formato das previsões.
+
+    Returns:
+        list[TimeSeries | None]: Séries candidatas. Candidatas sem bloco `<out>`
+            ou que não puderam ser lidas retornam None.
+    """
+    candidates = []
+    for predicted in self.samples or [self.predicted]:
+      try:
+        candidates.append(from_str(predicted, tsformat) if predicted else None)
+      except Exception:
+        candidates.append(None)
+    return candidates
+
+  def parse(self, index: pd.Index | int, tsformat: TSFormat = TSFormat.CSV,
+            columns: list[str] | None = None) -> ParsedForecast:
+    """
+    Lê a previsão com `parse_forecast`, alinhada aos instantes esperados.
+
+    Args:
+        index (pd.Index | int): Instantes futuros esperados ou apenas o horizonte.
+        tsformat (TSFormat): Formato da previsão.
+        columns (list[str] | None): Colunas esperadas.
+
+    Returns:
+        ParsedForecast: Série alinhada, instantes ausentes e linhas ignoradas.
+    """
+    return parse_forecast(self.predicted, index, tsformat, columns)
+
+  def to_array(self, tsformat: TSFormat = TSFormat.CSV) -> np.ndarray:
+    """
+    Empilha as previsões candidatas em um array.
+
+    Candidatas inválidas ou mais curtas que o horizonte são completadas com NaN.
+
+    Args:
+        tsformat (TSFormat): Formato das previsões.
+
+    Returns:
+        np.ndarray: Array de formato (amostras, horizonte) para séries univariadas
+            ou (amostras, horizonte, colunas) para séries multivariadas.
+    """
+    arrays = [np.asarray(c.to_numpy(), dtype=float) if c is not None else None
+              for c in self.candidates(tsformat)]
+    valid = [a for a in arrays if a is not None]
+    if not valid:
+      return np.empty((len(arrays), 0))
+    horizon = max(len(a) for a in valid)
+    shape = valid[0].shape[1:]
+    out = np.full((len(arrays), horizon, *shape), np.nan)
+    for i, a in enumerate(arrays):
+      if a is not None and a.shape[1:] == shape:
+        out[i, :len(a)] = a
+    return out
+
+  def aggregate(
+      self,
+      tsformat: TSFormat = TSFormat.CSV,
+      method: str = "median",
+      q: float | None = None
+  ) -> TimeSeries:
+    """
+    Agrega as previsões candidatas ponto a ponto.
+
+    Args:
+        tsformat (TSFormat): Formato das previsões.
+        method (str): Agregação: 'median', 'mean' ou 'quantile'.
+        q (float | None): Quantil (0 <= q <= 1) quando `method='quantile'`.
+
+    Returns:
+        TimeSeries: Previsão agregada, indexada como a candidata mais longa.
+
+    Raises:
+        ValueError: Se o método não for suportado ou nenhuma candidata for válida.
+    """
+    candidates = [c for c in self.candidates(tsformat) if c is not None]
+    if not candidates:
+      raise ValueError("No valid forecast among the samples.")
+    values = self.to_array(tsformat)
+
+    if method == "median":
+      agg = np.nanmedian(values, axis=0)
+    elif method == "mean":
+      agg = np.nanmean(values, axis=0)
+    elif method == "quantile":
+      if q is None:
+        raise ValueError("Quantile 'q' must be set for method='quantile'.")
+      agg = np.nanquantile(values, q, axis=0)
+    else:
+      raise ValueError("Supported methods: median, mean, quantile.")
+
+    base = max(candidates, key=len).copy()
+    base.iloc[:] = agg
+    return base
+
+
+class _OutStream:
+  """
+  Acumula os fragmentos de uma resposta em streaming e detecta o fechamento do
+  bloco `<out>`.
+  """
+
+  def __init__(self, start_time: float) -> None:
+    self.start_time = start_time
+    self.text = ""
+    self.chunks = 0
+    self.time_to_first_token = None
+    self.time_to_out = None
+
+  def feed(self, delta: str, now: float) -> bool:
+    """
+    Adiciona um fragmento e retorna True se o bloco `<out>` acabou de ser fechado.
+    """
+    if not delta:
+      return False
+    if self.time_to_first_token is None:
+      self.time_to_first_token = now - self.start_time
+    offset = max(0, len(self.text) - len(_OUT_CLOSE))
+    self.text += delta
+    self.chunks += 1
+    if self.time_to_out is not None:
+      return False
+    if self.text.find(_OUT_CLOSE, offset) != -1 and _OUT_OPEN in self.text:
+      self.time_to_out = now - self.start_time
+      return True
+    return False
+
+  def finish(self, stopped: bool, now: float) -> str:
+    """
+    Encerra o stream e retorna o texto bruto.
+
+    Quando a geração é interrompida pela sequência de parada, o provedor não
+    devolve a própria tag, então `</out>` é reposto para o bloco aberto.
+    """
+    unclosed = self.text.rfind(_OUT_OPEN) > self.text.rfind(_OUT_CLOSE)
+    if self.time_to_out is None and stopped and unclosed:
+      self.text += _OUT_CLOSE
+      self.time_to_out = now - self.start_time
+    return self.text
 
 
 class Model(ABC):
+  provider: Provider
+  supports_n: bool = False
+
+  def __init__(self) -> None:
+    """
+    Inicializa o estado compartilhado dos modelos.
+
+    O cliente do provedor é criado sob demanda na primeira requisição e
+    reutilizado pelas chamadas seguintes, inclusive entre threads.
+
+    Atributos configuráveis:
+        cache (ResponseCache | None): Cache de respostas consultado antes de cada
+                                      requisição. Desativado por padrão.
+        limiter (RateLimiter | None): Limitador de taxa aplicado às requisições
+                                      enviadas ao provedor. Desativado por padrão.
+                                      Com um limitador, os clientes OpenAI são
+                                      criados sem as novas tentativas do SDK; por
+                                      isso, defina-o antes da primeira requisição.
+        max_input_tokens (int | None): Orçamento de tokens de entrada. Prompts acima
+                                       dele são rejeitados antes do envio.
+        callbacks (list[Callback]): Ganchos chamados no início, fim, erro e nova
+                                    tentativa de cada requisição.
+        hedge (HedgePolicy | None): Política de requisições redundantes para
+                                    respostas lentas. Desativada por padrão.
+    """
+    self.cache: ResponseCache | None = None
+    self.limiter: RateLimiter | None = None
+    self.max_input_tokens: int | None = None
+    self.callbacks: list[Callback] = []
+    self.hedge: HedgePolicy | None = None
+    self._client = None
+    self._lock = threading.RLock()
+    self._aclients = weakref.WeakKeyDictionary()
+    self._alocks = weakref.WeakKeyDictionary()
+
+  @property
+  def client(self) -> Any:
+    """
+    Cliente do provedor, criado uma única vez e reutilizado entre chamadas.
+    """
+    if self._client is None:
+      with self._lock:
+        if self._client is None:
+          start_time = time.perf_counter()
+          self._client = self._connect()
+          _record("connect", time.perf_counter() - start_time)
+    return self._client
 
   @abstractmethod
-  def predict(self: Self, content: str, temperature: float | None, **kwargs) -> ModelResponse:
+  def _connect(self: Self) -> Any:
+    """
+    Cria o cliente do provedor.
+
+    Returns:
+        Any: Cliente pronto para enviar requisições.
+    """
+    ...
+
+  def close(self) -> None:
+    """
+    Encerra o cliente do provedor e libera o pool de conexões.
+
+    Uma nova requisição após `close()` cria um novo cliente.
+    """
+    with self._lock:
+      client, self._client = self._client, None
+    if client is not None:
+      client.close()
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  async def _aclient(self) -> Any:
+    """
+    Retorna o cliente assíncrono do laço de eventos atual, criando-o se necessário.
+
+    Clientes assíncronos ficam presos ao laço de eventos em que foram abertos,
+    por isso cada laço mantém o seu.
+    """
+    loop = asyncio.get_running_loop()
+    lock = self._alocks.setdefault(loop, asyncio.Lock())
+    async with lock:
+      if loop not in self._aclients:
+        start_time = time.perf_counter()
+        self._aclients[loop] = await self._aconnect()
+        _record("connect", time.perf_counter() - start_time)
+    return self._aclients[loop]
+
+  @abstractmethod
+  async def _aconnect(self: Self) -> Any:
+    """
+    Cria o cliente assíncrono do provedor.
+
+    Returns:
+        Any: Cliente assíncrono pronto para enviar requisições.
+    """
+    ...
+
+  async def _adisconnect(self, client: Any) -> None:
+    await client.close()
+
+  async def aclose(self) -> None:
+    """
+    Encerra o cliente assíncrono do laço de eventos atual.
+    """
+    client = self._aclients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+      await self._adisconnect(client)
+
+  async def __aenter__(self) -> Self:
+    await self._aclient()
+    return self
+
+  async def __aexit__(self, *args) -> None:
+    await self.aclose()
+
+  def predict(
+      self: Self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
     """
     Envia uma requisição para o modelo e retorna a resposta.
 
     Args:
-        content (str): Conteúdo da mensagem do usuário a ser enviada.
+        content (str | list[dict]): Conteúdo da mensagem do usuário ou lista de
+            mensagens de chat (ex: o retorno de `prompt(..., cache_friendly=True)`).
         temperature (float | None): Grau de aleatoriedade da resposta.
         **kwargs: Argumentos adicionais passados para `client.chat.completions.create`.
+            `samples=N` gera N previsões candidatas em uma única requisição (parâmetro
+            `n` do provedor) ou em N chamadas paralelas quando `n` não é suportado.
+            As candidatas ficam em `ModelResponse.samples`.
+
+    Returns:
+        ModelResponse: Resposta do modelo com detalhes.
+    """
+    return self._run(self._predict, content, temperature, **kwargs)
+
+  async def apredict(
+      self: Self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Versão assíncrona de `predict`.
+
+    Args:
+        content (str | list[dict]): Conteúdo da mensagem do usuário ou lista de
+            mensagens de chat (ex: o retorno de `prompt(..., cache_friendly=True)`).
+        temperature (float | None): Grau de aleatoriedade da resposta.
+        **kwargs: Argumentos adicionais passados para o cliente do provedor.
 
     Returns:
         ModelResponse: Resposta do modelo com detalhes.
     """
+    return await self._arun(self._apredict, content, temperature, **kwargs)
+
+  def predict_stream(
+      self: Self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Envia uma requisição em modo streaming e encerra assim que o bloco `<out>` é
+    fechado.
+
+    `</out>` é enviado como sequência de parada quando o provedor suporta; caso
+    contrário, o stream é cancelado ao receber a tag. A resposta inclui o tempo
+    até o primeiro token e até o fechamento do bloco `<out>`.
+
+    Args:
+        content (str | list[dict]): Conteúdo da mensagem do usuário ou lista de
+            mensagens de chat (ex: o retorno de `prompt(..., cache_friendly=True)`).
+        temperature (float | None): Grau de aleatoriedade da resposta.
+        **kwargs: Argumentos adicionais passados para o cliente do provedor.
+
+    Returns:
+        ModelResponse: Resposta do modelo com detalhes.
+    """
+    return self._run(self._predict_stream, content, temperature, stream=True, **kwargs)
+
+  async def apredict_stream(
+      self: Self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Versão assíncrona de `predict_stream`.
+    """
+    return await self._arun(
+        self._apredict_stream, content, temperature, stream=True, **kwargs)
+
+  def _run(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      stream: bool = False,
+      **kwargs
+  ) -> ModelResponse:
+    if stream and kwargs.get("samples", 1) > 1:
+      raise ValueError("Streaming does not support multiple samples.")
+    request_id, token = self._begin(content)
+    try:
+      key = self._cache_key(content, temperature, stream, **kwargs)
+      if key is None or (response := self.cache.get(key)) is None:
+        self._check_budget(content)
+        if self.limiter is None:
+          response = self._send(call, content, temperature, **kwargs)
+        else:
+          response = self.limiter.run(
+              lambda: self._send(call, content, temperature, **kwargs),
+              tokens=self._estimate_tokens(content, **kwargs),
+              on_retry=lambda *args: self._emit("on_retry", request_id, *args))
+        if key is not None:
+          self.cache.set(key, response)
+    except Exception as e:
+      _timing.reset(token)
+      self._emit("on_error", request_id, e)
+      raise
+    return self._end(request_id, token, response)
+
+  async def _arun(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      stream: bool = False,
+      **kwargs
+  ) -> ModelResponse:
+    if stream and kwargs.get("samples", 1) > 1:
+      raise ValueError("Streaming does not support multiple samples.")
+    request_id, token = self._begin(content)
+    try:
+      key = self._cache_key(content, temperature, stream, **kwargs)
+      if key is None or (response := self.cache.get(key)) is None:
+        self._check_budget(content)
+        if self.limiter is None:
+          response = await self._asend(call, content, temperature, **kwargs)
+        else:
+          response = await self.limiter.arun(
+              lambda: self._asend(call, content, temperature, **kwargs),
+              tokens=self._estimate_tokens(content, **kwargs),
+              on_retry=lambda *args: self._emit("on_retry", request_id, *args))
+        if key is not None:
+          self.cache.set(key, response)
+    except Exception as e:
+      _timing.reset(token)
+      self._emit("on_error", request_id, e)
+      raise
+    return self._end(request_id, token, response)
+
+  def _begin(self, content: str | list[dict]) -> tuple[int, Any]:
+    request_id = next(_request_ids)
+    self._emit("on_start", request_id, content)
+    return request_id, _timing.set((Timing(), time.perf_counter()))
+
+  def _end(self, request_id: int, token: Any, response: ModelResponse) -> ModelResponse:
+    timing, start_time = _timing.get()
+    _timing.reset(token)
+    if not response.cached:
+      timing.generation = response.time
+      timing.time_to_first_token = response.time_to_first_token
+    timing.total = time.perf_counter() - start_time
+    response.timing = timing
+    self._emit("on_end", request_id, response)
+    return response
+
+  def _emit(self, event: str, *args) -> None:
+    for callback in self.callbacks:
+      try:
+        getattr(callback, event)(self, *args)
+      except Exception as e:
+        logger.warning(f"Callback {type(callback).__name__}.{event} failed: {e}")
+
+  def _dispatch(self) -> None:
+    # Marca o envio: a espera até aqui (limitador, novas tentativas) é a fila.
+    if (current := _timing.get()) is not None:
+      current[0].queue = time.perf_counter() - current[1]
+
+  def _send(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    if self.hedge is None:
+      return self._call(call, content, temperature, **kwargs)
+    target = self.hedge.alternate or self
+    return self.hedge.run(
+        lambda: self._call(call, content, temperature, **kwargs),
+        lambda: target._call(
+            getattr(target, call.__name__), content, temperature, **kwargs))
+
+  async def _asend(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    if self.hedge is None:
+      return await self._acall(call, content, temperature, **kwargs)
+    target = self.hedge.alternate or self
+    return await self.hedge.arun(
+        lambda: self._acall(call, content, temperature, **kwargs),
+        lambda: target._acall(
+            getattr(target, call.__name__), content, temperature, **kwargs))
+
+  def _call(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      samples: int = 1,
+      **kwargs
+  ) -> ModelResponse:
+    self._dispatch()
+    if samples <= 1:
+      return call(content, temperature, **kwargs)
+    if self.supports_n:
+      return call(content, temperature, n=samples, **kwargs)
+    with ThreadPoolExecutor(max_workers=samples) as executor:
+      futures = [
+          executor.submit(_lenient_context().run, call, content, temperature, **kwargs)
+          for _ in range(samples)
+      ]
+      return self._merge([f.result() for f in futures])
+
+  async def _acall(
+      self,
+      call,
+      content: str | list[dict],
+      temperature: float | None,
+      samples: int = 1,
+      **kwargs
+  ) -> ModelResponse:
+    self._dispatch()
+    if samples <= 1:
+      return await call(content, temperature, **kwargs)
+    if self.supports_n:
+      return await call(content, temperature, n=samples, **kwargs)
+    token = _lenient.set(True)
+    try:
+      responses = await asyncio.gather(
+          *(call(content, temperature, **kwargs) for _ in range(samples)))
+    finally:
+      _lenient.reset(token)
+    return self._merge(responses)
+
+  def _merge(self, responses: list[ModelResponse]) -> ModelResponse:
+    # Combina chamadas paralelas de uma amostra cada em uma única resposta.
+    raws = [r.raw for r in responses]
+    samples = self._samples(raws)
+    raw, predicted = self._first(raws, samples)
+    return ModelResponse(
+        raw=raw,
+        predicted=predicted,
+        input_tokens=sum(r.input_tokens for r in responses),
+        output_tokens=sum(r.output_tokens for r in responses),
+        time=max(r.time for r in responses),
+        samples=samples,
+        cached_tokens=sum(r.cached_tokens for r in responses)
+    )
+
+  def _estimate_tokens(
+      self,
+      content: str | list[dict],
+      samples: int = 1,
+      **kwargs
+  ) -> int:
+    max_tokens = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 0
+    return count_tokens(_text(content)) + max_tokens * max(1, samples)
+
+  def _check_budget(self, content: str | list[dict]) -> None:
+    if self.max_input_tokens is None:
+      return
+    if (tokens := count_tokens(_text(content))) > self.max_input_tokens:
+      raise ValueError(
+          f"Prompt has ~{tokens} input tokens, "
+          f"above the budget of {self.max_input_tokens}.")
+
+  def _cache_key(
+      self,
+      content: str | list[dict],
+      temperature: float | None,
+      stream: bool = False,
+      **kwargs
+  ) -> str | None:
+    if self.cache is None:
+      return None
+    request = {
+        "provider": self.provider.value,
+        "model": self.model,
+        "content": content,
+        "temperature": temperature,
+        "kwargs": kwargs
+    }
+    if stream:
+      request["stream"] = True
+    return self.cache.key(**request)
+
+  @abstractmethod
+  def _predict(
+      self: Self,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Envia a requisição ao provedor, sem passar pelo cache.
+    """
     ...
 
-  def _output(self, response: str) -> str:
-    return re.findall(r'<out>(.*?)</out>', response, re.DOTALL)[-1].strip()
+  @abstractmethod
+  async def _apredict(
+      self: Self,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Versão assíncrona de `_predict`.
+    """
+    ...
+
+  @abstractmethod
+  def _predict_stream(
+      self: Self,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Envia a requisição ao provedor em modo streaming, sem passar pelo cache.
+    """
+    ...
+
+  @abstractmethod
+  async def _apredict_stream(
+      self: Self,
+      content: str | list[dict],
+      temperature: float | None,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Versão assíncrona de `_predict_stream`.
+    """
+    ...
+
+  async def apredict_many(
+      self,
+      prompts: list[str | list[dict]],
+      concurrency: int = 8,
+      **kwargs
+  ) -> list[ModelResponse]:
+    """
+    Envia várias requisições em paralelo, limitando quantas ficam em andamento.
+
+    Args:
+        prompts (list[str]): Conteúdos das mensagens a serem enviadas.
+        concurrency (int): Número máximo de requisições simultâneas.
+        **kwargs: Argumentos adicionais passados para `apredict`.
+
+    Returns:
+        list[ModelResponse]: Respostas na mesma ordem de `prompts`.
+    """
+    if concurrency < 1:
+      raise ValueError("Concurrency must be at least 1.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(content: str | list[dict]) -> ModelResponse:
+      async with semaphore:
+        return await self.apredict(content, **kwargs)
+
+    return list(await asyncio.gather(*(run(content) for content in prompts)))
+
+  def predict_many(
+      self,
+      prompts: list[str | list[dict]],
+      concurrency: int = 8,
+      **kwargs
+  ) -> list[ModelResponse]:
+    """
+    Versão síncrona de `apredict_many`.
+
+    Executa as requisições em um laço de eventos próprio, que é encerrado
+    junto com o cliente assíncrono ao final. Pode ser chamada mesmo quando
+    já existe um laço em execução (ex: Jupyter).
+
+    Args:
+        prompts (list[str]): Conteúdos das mensagens a serem enviadas.
+        concurrency (int): Número máximo de requisições simultâneas.
+        **kwargs: Argumentos adicionais passados para `apredict`.
+
+    Returns:
+        list[ModelResponse]: Respostas na mesma ordem de `prompts`.
+    """
+    async def run() -> list[ModelResponse]:
+      async with self:
+        return await self.apredict_many(prompts, concurrency, **kwargs)
+
+    try:
+      asyncio.get_running_loop()
+    except RuntimeError:
+      return asyncio.run(run())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+      return executor.submit(asyncio.run, run()).result()
+
+  def _output(self, response: str) -> str | None:
+    start_time = time.perf_counter()
+    try:
+      matches = re.findall(r'<out>(.*?)</out>', response or "", re.DOTALL)
+      if not matches and _lenient.get():
+        return None
+      return matches[-1].strip()
+    finally:
+      _record("parse", time.perf_counter() - start_time)
+
+  def _samples(self, responses: list[str]) -> list[str | None] | None:
+    if len(responses) <= 1:
+      return None
+    samples = []
+    for response in responses:
+      try:
+        samples.append(self._output(response or ""))
+      except IndexError:
+        samples.append(None)
+    return samples
+
+  def _first(self, raws: list[str], samples: list[str | None]) -> tuple[str, str]:
+    """
+    Resposta bruta e previsão da primeira candidata com bloco `<out>`.
+
+    Raises:
+        IndexError: Se nenhuma candidata tiver bloco `<out>`.
+    """
+    for raw, predicted in zip(raws, samples):
+      if predicted is not None:
+        return raw, predicted
+    raise IndexError("No sample contains an <out> block.")
+
+
+def _lenient_context() -> Context:
+  # Contexto de uma amostra paralela: cada thread precisa da sua própria cópia.
+  context = copy_context()
+  context.run(_lenient.set, True)
+  return context
@@ -0,0 +1,200 @@
+from dataclasses import asdict, fields
+from typing import Any, TYPE_CHECKING
+import threading
+import hashlib
+import sqlite3
+import json
+import time
+import zlib
+import os
+
+try:
+  import zstandard
+except ImportError:
+  zstandard = None
+
+if TYPE_CHECKING:
+  from ._base import ModelResponse
+
+
+class ResponseCache:
+
+  def __init__(
+      self,
+      path: str,
+      max_size: int | None = None,
+      ttl: float | None = None,
+      compression: str | None = None,
+      timeout: float = 30.0
+  ) -> None:
+    """
+    Cache em disco (SQLite) para respostas de modelos, endereçado pelo conteúdo da
+    requisição.
+
+    O mesmo arquivo pode ser compartilhado por várias threads e processos.
+
+    Args:
+        path (str): Caminho do arquivo SQLite do cache.
+        max_size (int | None): Tamanho máximo, em bytes, das respostas armazenadas.
+                               Ao ser excedido, as entradas menos usadas recentemente
+                               são removidas (LRU). Se None, não há limite.
+        ttl (float | None): Tempo de vida, em segundos, de cada entrada.
+                            Se None, não expira.
+        compression (str | None): Compressão das respostas: 'zlib', 'zstd' ou None.
+                                  'zstd' requer o pacote `zstandard`.
+        timeout (float): Tempo, em segundos, de espera por um lock do banco.
+
+    Raises:
+        ValueError: Se a compressão informada não for suportada.
+        ImportError: Se 'zstd' for usada sem o pacote `zstandard` instalado.
+    """
+    if compression not in (None, "zlib", "zstd"):
+      raise ValueError("Supported compressions: zlib, zstd.")
+    if compression == "zstd" and zstandard is None:
+      raise ImportError("Compression 'zstd' requires the 'zstandard' package.")
+
+    self.path = path
+    self.max_size = max_size
+    self.ttl = ttl
+    self.compression = compression
+    self.timeout = timeout
+    self._local = threading.local()
+
+    with self._connection() as conn:
+      conn.execute(
+          "CREATE TABLE IF NOT EXISTS responses ("
+          "key TEXT PRIMARY KEY, value BLOB NOT NULL, codec TEXT, "
+          "size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+      )
+      conn.execute(
+          "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+  def _connection(self) -> sqlite3.Connection:
+    # Conexões SQLite não podem ser compartilhadas entre threads nem entre
+    # processos após um fork, então cada par (processo, thread) abre a sua.
+    conn = getattr(self._local, "conn", None)
+    if conn is None or self._local.pid != os.getpid():
+      conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+      self._local.pid = os.getpid()
+    return conn
+
+  @staticmethod
+  def key(**request: Any) -> str:
+    """
+    Gera a chave do cache a partir dos parâmetros da requisição.
+
+    Args:
+        **request: Parâmetros que identificam a requisição (provedor, modelo,
+                   conteúdo, temperatura e argumentos adicionais).
+
+    Returns:
+        str: Hash SHA-256 da representação canônica dos parâmetros.
+    """
+    data = json.dumps(request, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+  def _encode(self, data: bytes) -> bytes:
+    if self.compression == "zlib":
+      return zlib.compress(data)
+    if self.compression == "zstd":
+      return zstandard.ZstdCompressor().compress(data)
+    return data
+
+  @staticmethod
+  def _decode(data: bytes, codec: str | None) -> bytes:
+    if codec == "zlib":
+      return zlib.decompress(data)
+    if codec == "zstd":
+      if zstandard is None:
+        raise ImportError(
+            "Cache entry compressed with 'zstd' requires the 'zstandard' package.")
+      return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+  def get(self, key: str) -> "ModelResponse | None":
+    """
+    Busca uma resposta no cache.
+
+    Args:
+        key (str): Chave da requisição.
+
+    Returns:
+        ModelResponse | None: Resposta armazenada, marcada com `cached=True`,
+                              ou None se não existir ou estiver expirada.
+    """
+    from ._base import ModelResponse
+
+    conn = self._connection()
+    row = conn.execute(
+        "SELECT value, codec, created FROM responses WHERE key = ?", (key,)).fetchone()
+    if row is None:
+      return None
+
+    value, codec, created = row
+    now = time.time()
+    if self.ttl is not None and now - created > self.ttl:
+      conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+      return None
+    conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+    data = json.loads(self._decode(value, codec))
+    names = {f.name for f in fields(ModelResponse)}
+    response = ModelResponse(**{k: v for k, v in data.items() if k in names})
+    response.cached = True
+    return response
+
+  def set(self, key: str, response: "ModelResponse") -> None:
+    """
+    Armazena uma resposta no cache, removendo as entradas menos usadas se necessário.
+
+    Args:
+        key (str): Chave da requisição.
+        response (ModelResponse): Resposta a ser armazenada.
+    """
+    data = asdict(response)
+    data.pop("cached", None)
+    data.pop("timing", None)
+    value = self._encode(json.dumps(data).encode("utf-8"))
+    now = time.time()
+
+    conn = self._connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+      conn.execute(
+          "INSERT OR REPLACE INTO responses "
+          "(key, value, codec, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+          (key, value, self.compression, len(value), now, now)
+      )
+      if self.ttl is not None:
+        conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+      if self.max_size is not None:
+        self._evict(conn)
+      conn.execute("COMMIT")
+    except BaseException:
+      conn.execute("ROLLBACK")
+      raise
+
+  def _evict(self, conn: sqlite3.Connection) -> None:
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    if total <= self.max_size:
+      return
+    excess = total - self.max_size
+    keys = []
+    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+      keys.append((key,))
+      excess -= size
+      if excess <= 0:
+        break
+    conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+  def clear(self) -> None:
+    """
+    Remove todas as entradas do cache.
+    """
+    self._connection().execute("DELETE FROM responses")
+
+  def __len__(self) -> int:
+    return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
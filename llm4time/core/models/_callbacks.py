@@ -0,0 +1,125 @@
+from collections import deque
+from typing import TYPE_CHECKING
+import threading
+import numpy as np
+
+if TYPE_CHECKING:
+  from ._base import Model, ModelResponse
+
+
+class Callback:
+  """
+  Ganchos de instrumentação das requisições de um modelo.
+
+  Subclasses sobrescrevem apenas os eventos de interesse e são registradas em
+  `Model.callbacks`. `request_id` identifica a requisição entre os eventos.
+  Exceções lançadas por um gancho são registradas no log e não interrompem a
+  requisição.
+  """
+
+  def on_start(
+      self,
+      model: "Model",
+      request_id: int,
+      content: str | list[dict]
+  ) -> None:
+    """
+    Chamado antes da consulta ao cache e do envio da requisição.
+    """
+
+  def on_end(self, model: "Model", request_id: int, response: "ModelResponse") -> None:
+    """
+    Chamado ao final de uma requisição bem-sucedida (inclusive respostas do cache).
+    `response.timing` já está preenchido.
+    """
+
+  def on_error(self, model: "Model", request_id: int, error: Exception) -> None:
+    """
+    Chamado quando a requisição falha definitivamente.
+    """
+
+  def on_retry(
+      self,
+      model: "Model",
+      request_id: int,
+      error: Exception,
+      attempt: int,
+      delay: float
+  ) -> None:
+    """
+    Chamado quando o limitador de taxa vai repetir a requisição após `delay` segundos.
+    """
+
+
+class Metrics(Callback):
+
+  def __init__(self, window: int = 10000) -> None:
+    """
+    Coletor simples de métricas de latência, vazão e erros.
+
+    Args:
+        window (int): Quantidade de requisições recentes usadas nos percentis.
+    """
+    self.requests = 0
+    self.errors = 0
+    self.retries = 0
+    self.cached = 0
+    self._latencies = deque(maxlen=window)
+    self._tokens_per_second = deque(maxlen=window)
+    self._lock = threading.Lock()
+
+  def on_end(self, model: "Model", request_id: int, response: "ModelResponse") -> None:
+    with self._lock:
+      self.requests += 1
+      if response.cached:
+        self.cached += 1
+        return
+      self._latencies.append(response.timing.total)
+      if response.timing.generation > 0:
+        self._tokens_per_second.append(
+            response.output_tokens / response.timing.generation)
+
+  def on_error(self, model: "Model", request_id: int, error: Exception) -> None:
+    with self._lock:
+      self.requests += 1
+      self.errors += 1
+
+  def on_retry(
+      self,
+      model: "Model",
+      request_id: int,
+      error: Exception,
+      attempt: int,
+      delay: float
+  ) -> None:
+    with self._lock:
+      self.retries += 1
+
+  def summary(self) -> dict[str, float | int | None]:
+    """
+    Resume as métricas coletadas.
+
+    Returns:
+        dict[str, float | int | None]: Contagens de requisições, erros, novas
+            tentativas e acertos de cache, percentis p50/p95/p99 da latência total
+            (segundos, sem respostas do cache) e tokens de saída por segundo (mediana).
+    """
+    with self._lock:
+      latencies = np.array(self._latencies, dtype=float)
+      tokens_per_second = np.array(self._tokens_per_second, dtype=float)
+      summary = {
+          "requests": self.requests,
+          "errors": self.errors,
+          "retries": self.retries,
+          "cached": self.cached,
+      }
+    p50, p95, p99 = (map(float, np.quantile(latencies, [0.5, 0.95, 0.99]))
+                     if len(latencies) else (None,) * 3)
+    summary.update({
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+        "tokens_per_second": (float(np.median(tokens_per_second))
+                              if len(tokens_per_second) else None),
+    })
+    return summary
@@ -0,0 +1,181 @@
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextvars import copy_context
+from collections import deque
+from typing import Any, Awaitable, Callable, TYPE_CHECKING
+from llm4time._infra import logger
+import numpy as np
+import threading
+import asyncio
+import time
+
+if TYPE_CHECKING:
+  from ._base import Model
+
+
+class HedgePolicy:
+
+  def __init__(
+      self,
+      quantile: float = 0.95,
+      max_rate: float = 0.05,
+      alternate: "Model | None" = None,
+      window: int = 1000,
+      min_samples: int = 20
+  ) -> None:
+    """
+    Política de requisições redundantes (hedging) para reduzir a latência de cauda.
+
+    Se uma requisição não termina dentro do quantil `quantile` das latências
+    recentes, uma cópia é enviada ao mesmo provedor ou a `alternate`. Vale a
+    primeira resposta bem-sucedida e a outra é cancelada. Na API assíncrona a
+    requisição perdedora é interrompida; na síncrona, o resultado dela é descartado.
+
+    Args:
+        quantile (float): Quantil (0 a 1) das latências recentes após o qual a cópia
+                          é enviada.
+        max_rate (float): Fração máxima (0 a 1) das requisições que podem gerar cópias.
+        alternate (Model | None): Modelo que recebe as cópias (ex: outro endpoint ou
+                                  região).
+                                  Se None, a cópia vai para o próprio modelo.
+        window (int): Quantidade de latências recentes consideradas.
+        min_samples (int): Latências necessárias antes de enviar a primeira cópia.
+
+    Raises:
+        ValueError: Se `quantile` ou `max_rate` estiverem fora do intervalo [0, 1].
+    """
+    if not 0 <= quantile <= 1 or not 0 <= max_rate <= 1:
+      raise ValueError("Quantile and max_rate must be between 0 and 1.")
+
+    self.quantile = quantile
+    self.max_rate = max_rate
+    self.alternate = alternate
+    self.min_samples = min_samples
+    self.requests = 0
+    self.hedges = 0
+    self.wins = 0
+    self._latencies = deque(maxlen=window)
+    self._lock = threading.Lock()
+
+  def delay(self) -> float | None:
+    """
+    Espera, em segundos, antes de enviar a cópia.
+
+    Returns:
+        float | None: Quantil das latências recentes, ou None enquanto houver
+                      menos de `min_samples` medições.
+    """
+    with self._lock:
+      if len(self._latencies) < self.min_samples:
+        return None
+      latencies = np.array(self._latencies)
+    return float(np.quantile(latencies, self.quantile))
+
+  def _acquire(self) -> bool:
+    with self._lock:
+      if self.hedges + 1 > self.max_rate * self.requests:
+        return False
+      self.hedges += 1
+      return True
+
+  def _available(self) -> bool:
+    # Indica se ainda há orçamento para uma cópia, sem consumi-lo.
+    with self._lock:
+      return self.hedges + 1 <= self.max_rate * self.requests
+
+  def _record(self, start_time: float) -> None:
+    with self._lock:
+      self._latencies.append(time.perf_counter() - start_time)
+
+  def _observe(self, start_time: float) -> Callable[[Any], None]:
+    def observe(done: Any) -> None:
+      if not done.cancelled() and done.exception() is None:
+        self._record(start_time)
+    return observe
+
+  def _won(self, winner: Any, backup: Any) -> Any:
+    if winner is backup:
+      with self._lock:
+        self.wins += 1
+    return winner.result()
+
+  def run(self, send: Callable[[], Any], backup: Callable[[], Any]) -> Any:
+    """
+    Executa `send`, enviando `backup` se a resposta demorar.
+
+    Args:
+        send (Callable[[], Any]): Função que envia a requisição original.
+        backup (Callable[[], Any]): Função que envia a cópia.
+
+    Returns:
+        Any: Resultado da primeira requisição bem-sucedida.
+    """
+    with self._lock:
+      self.requests += 1
+    delay = self.delay()
+    if delay is None or not self._available():
+      # Nenhuma cópia pode ser enviada: a requisição segue na própria thread.
+      start_time = time.perf_counter()
+      result = send()
+      self._record(start_time)
+      return result
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+      primary = executor.submit(copy_context().run, send)
+      primary.add_done_callback(self._observe(time.perf_counter()))
+      try:
+        return primary.result(timeout=delay)
+      except TimeoutError:
+        pass
+      if not self._acquire():
+        return primary.result()
+
+      logger.debug(f"Request exceeded {delay:.2f}s; sending hedged request.")
+      duplicate = executor.submit(copy_context().run, backup)
+      pending: set[Future] = {primary, duplicate}
+      while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+          if future.exception() is None:
+            for other in pending:
+              other.cancel()
+            return self._won(future, duplicate)
+      return primary.result()
+    finally:
+      executor.shutdown(wait=False)
+
+  async def arun(
+      self,
+      send: Callable[[], Awaitable[Any]],
+      backup: Callable[[], Awaitable[Any]]
+  ) -> Any:
+    """
+    Versão assíncrona de `run`. A requisição perdedora é cancelada.
+    """
+    with self._lock:
+      self.requests += 1
+    delay = self.delay()
+    primary = asyncio.ensure_future(send())
+    primary.add_done_callback(self._observe(time.perf_counter()))
+    tasks = {primary}
+    try:
+      if delay is None:
+        return await primary
+      done, _ = await asyncio.wait(tasks, timeout=delay)
+      if done or not self._acquire():
+        return await primary
+
+      logger.debug(f"Request exceeded {delay:.2f}s; sending hedged request.")
+      duplicate = asyncio.ensure_future(backup())
+      tasks.add(duplicate)
+      pending = set(tasks)
+      while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+          if task.exception() is None:
+            return self._won(task, duplicate)
+      return primary.result()
+    finally:
+      for task in tasks:
+        if not task.done():
+          task.cancel()
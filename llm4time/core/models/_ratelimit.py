@@ -0,0 +1,299 @@
+from email.utils import parsedate_to_datetime
+from collections import deque
+from typing import Any, Awaitable, Callable
+from llm4time._infra import logger
+import threading
+import asyncio
+import random
+import openai
+import time
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class _TokenBucket:
+
+  def __init__(self, per_minute: float) -> None:
+    self.capacity = float(per_minute)
+    self.rate = per_minute / 60.0
+    self.tokens = self.capacity
+    self.updated = time.monotonic()
+
+  def reserve(self, amount: float, now: float) -> float:
+    # O saldo pode ficar negativo: quem reserva primeiro é atendido primeiro
+    # e o tempo de espera cresce com a dívida acumulada.
+    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+    self.updated = now
+    self.tokens -= min(amount, self.capacity)
+    return max(0.0, -self.tokens / self.rate)
+
+  def refund(self, amount: float) -> None:
+    self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+
+  def __init__(
+      self,
+      requests_per_minute: float | None = None,
+      tokens_per_minute: float | None = None,
+      max_retries: int = 6,
+      base_delay: float = 1.0,
+      max_delay: float = 60.0,
+      max_concurrency: int = 32,
+      min_concurrency: int = 1,
+      target_latency: float | None = None
+  ) -> None:
+    """
+    Limitador de taxa compartilhável entre modelos e threads.
+
+    Combina baldes de requisições e de tokens por minuto, novas tentativas com
+    backoff exponencial (respeitando `Retry-After`) e um limite de concorrência
+    ajustado por AIMD: cresce aditivamente a cada sucesso e cai pela metade a
+    cada resposta 429 ou quando a latência passa de `target_latency`.
+
+    Args:
+        requests_per_minute (float | None): Limite de requisições por minuto.
+        tokens_per_minute (float | None): Limite de tokens (entrada + saída) por minuto.
+        max_retries (int): Número máximo de novas tentativas por requisição.
+        base_delay (float): Espera inicial, em segundos, do backoff exponencial.
+        max_delay (float): Espera máxima, em segundos, entre tentativas.
+        max_concurrency (int): Limite superior de requisições simultâneas.
+        min_concurrency (int): Limite inferior de requisições simultâneas.
+        target_latency (float | None): Latência, em segundos, acima da qual a
+                                       concorrência é reduzida. Se None, só as
+                                       respostas 429 reduzem a concorrência.
+    """
+    if min_concurrency < 1 or max_concurrency < min_concurrency:
+      raise ValueError(
+          "Concurrency limits must satisfy 1 <= min_concurrency <= max_concurrency.")
+
+    self.max_retries = max_retries
+    self.base_delay = base_delay
+    self.max_delay = max_delay
+    self.max_concurrency = max_concurrency
+    self.min_concurrency = min_concurrency
+    self.target_latency = target_latency
+    self.concurrency = float(max_concurrency)
+
+    self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+    self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+    self._in_flight = 0
+    self._lock = threading.Lock()
+    self._slot = threading.Condition(self._lock)
+    # Tarefas assíncronas à espera de vaga, cada uma com o seu laço de eventos.
+    self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+  def _reserve(self, tokens: int) -> float:
+    now = time.monotonic()
+    wait = 0.0
+    with self._lock:
+      if self._requests is not None:
+        wait = max(wait, self._requests.reserve(1, now))
+      if self._tokens is not None:
+        wait = max(wait, self._tokens.reserve(tokens, now))
+    return wait
+
+  def _try_enter(self) -> bool:
+    if self._in_flight < int(self.concurrency):
+      self._in_flight += 1
+      return True
+    return False
+
+  def _enter(self) -> None:
+    with self._slot:
+      while not self._try_enter():
+        self._slot.wait()
+
+  async def _aenter(self) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+      with self._lock:
+        if self._try_enter():
+          return
+        waiter = loop.create_future()
+        self._waiters.append((loop, waiter))
+      try:
+        await waiter
+      except asyncio.CancelledError:
+        with self._lock:
+          if not waiter.cancelled():
+            # Acordada e cancelada antes de ocupar a vaga: repassa o aviso.
+            self._wake(1)
+          elif (loop, waiter) in self._waiters:
+            self._waiters.remove((loop, waiter))
+        raise
+
+  def _wake(self, count: int) -> None:
+    # Chamado com `_lock`: acorda até `count` tarefas assíncronas, na ordem de chegada.
+    while count > 0 and self._waiters:
+      loop, waiter = self._waiters.popleft()
+      try:
+        loop.call_soon_threadsafe(self._resolve, waiter)
+        count -= 1
+      except RuntimeError:
+        pass  # Laço de eventos já encerrado.
+
+  def _resolve(self, waiter: asyncio.Future) -> None:
+    # Executado no laço da tarefa. Se ela já foi cancelada, a vaga vai para a próxima.
+    if waiter.done():
+      with self._lock:
+        self._wake(1)
+    else:
+      waiter.set_result(None)
+
+  def _leave(self) -> None:
+    with self._slot:
+      self._in_flight -= 1
+      self._slot.notify()
+      self._wake(1)
+
+  def _on_success(self, latency: float, estimated: int, used: int | None) -> None:
+    with self._lock:
+      slots = int(self.concurrency)
+      if self.target_latency is not None and latency > self.target_latency:
+        self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+      else:
+        self.concurrency = min(self.max_concurrency,
+                               self.concurrency + 1 / self.concurrency)
+      if self._tokens is not None and used is not None:
+        self._tokens.refund(estimated - used)
+      self._slot.notify_all()
+      self._wake(int(self.concurrency) - slots)
+
+  def _on_failure(self, tokens: int) -> None:
+    # Tentativas que falham não consomem tokens: a reserva é devolvida e a
+    # próxima tentativa reserva de novo.
+    if self._tokens is not None:
+      with self._lock:
+        self._tokens.refund(tokens)
+
+  def _on_rate_limited(self) -> None:
+    with self._lock:
+      self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+
+  def _delay(self, attempt: int, error: Exception) -> float:
+    delay = _retry_after(error)
+    if delay is None:
+      delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+      delay = random.uniform(delay / 2, delay)
+    return min(self.max_delay, delay)
+
+  def run(
+      self,
+      call: Callable[[], Any],
+      tokens: int = 0,
+      on_retry: Callable[[Exception, int, float], None] | None = None
+  ) -> Any:
+    """
+    Executa `call` respeitando os limites e repetindo em erros transitórios.
+
+    Args:
+        call (Callable[[], Any]): Função que envia a requisição.
+        tokens (int): Estimativa de tokens (entrada + saída) da requisição.
+        on_retry (Callable[[Exception, int, float], None] | None): Chamada antes de
+            cada nova tentativa com o erro, o número da tentativa e a espera.
+
+    Returns:
+        Any: Resultado de `call`.
+    """
+    for attempt in range(self.max_retries + 1):
+      time.sleep(self._reserve(tokens))
+      self._enter()
+      start_time = time.monotonic()
+      try:
+        result = call()
+      except Exception as e:
+        self._on_failure(tokens)
+        if not self._retry(attempt, e):
+          raise
+        error, delay = e, self._delay(attempt, e)
+      else:
+        self._on_success(time.monotonic() - start_time, tokens, _used_tokens(result))
+        return result
+      finally:
+        self._leave()
+      logger.warning(f"Request failed ({error}); retrying in {delay:.2f}s.")
+      if on_retry is not None:
+        on_retry(error, attempt + 1, delay)
+      time.sleep(delay)
+
+  async def arun(
+      self,
+      call: Callable[[], Awaitable[Any]],
+      tokens: int = 0,
+      on_retry: Callable[[Exception, int, float], None] | None = None
+  ) -> Any:
+    """
+    Versão assíncrona de `run`.
+    """
+    for attempt in range(self.max_retries + 1):
+      await asyncio.sleep(self._reserve(tokens))
+      await self._aenter()
+      start_time = time.monotonic()
+      try:
+        result = await call()
+      except Exception as e:
+        self._on_failure(tokens)
+        if not self._retry(attempt, e):
+          raise
+        error, delay = e, self._delay(attempt, e)
+      else:
+        self._on_success(time.monotonic() - start_time, tokens, _used_tokens(result))
+        return result
+      finally:
+        self._leave()
+      logger.warning(f"Request failed ({error}); retrying in {delay:.2f}s.")
+      if on_retry is not None:
+        on_retry(error, attempt + 1, delay)
+      await asyncio.sleep(delay)
+
+  def _retry(self, attempt: int, error: Exception) -> bool:
+    if not _is_retryable(error):
+      return False
+    if getattr(error, "status_code", None) == 429:
+      self._on_rate_limited()
+    return attempt < self.max_retries
+
+
+def _is_retryable(error: Exception) -> bool:
+  """
+  Indica se o erro é transitório (limite de taxa, timeout, falha de conexão ou 5xx).
+  """
+  if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+    return True
+  return getattr(error, "status_code", None) in _RETRYABLE_STATUS
+
+
+def _retry_after(error: Exception) -> float | None:
+  """
+  Extrai o tempo de espera sugerido pelo servidor (`Retry-After` ou `retry-after-ms`).
+
+  Returns:
+      float | None: Espera em segundos, ou None se o servidor não informou.
+  """
+  response = getattr(error, "response", None)
+  headers = getattr(response, "headers", None)
+  if not headers:
+    return None
+
+  if (value := headers.get("retry-after-ms")) is not None:
+    try:
+      return float(value) / 1000
+    except ValueError:
+      pass
+  if (value := headers.get("retry-after")) is not None:
+    try:
+      return float(value)
+    except ValueError:
+      try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+      except (TypeError, ValueError):
+        return None
+  return None
+
+
+def _used_tokens(result: Any) -> int | None:
+  if result is None or getattr(result, "cached", False):
+    return None
+  return result.input_tokens + result.output_tokens
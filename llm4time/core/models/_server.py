@@ -0,0 +1,332 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from email.parser import BytesParser
+from email.policy import HTTP
+from typing import Self
+from ._base import Model, ModelResponse
+import threading
+import itertools
+import json
+import time
+import re
+
+_ids = itertools.count(1)
+# Parâmetros do corpo tratados pelo próprio servidor; os demais vão para `predict`.
+_HANDLED = ("model", "messages", "temperature", "stream", "stream_options", "stop", "n")
+
+
+def _new_id(prefix: str) -> str:
+  return f"{prefix}-{next(_ids)}"
+
+
+class ReplayServer:
+
+  def __init__(
+      self,
+      model: Model,
+      host: str = "127.0.0.1",
+      port: int = 0,
+      batch_delay: float = 0.0
+  ) -> None:
+    """
+    Servidor HTTP local, compatível com a API da OpenAI, que responde usando outro
+    modelo.
+
+    Implementa os endpoints de chat completions (com e sem streaming), files e
+    batches, permitindo exercitar os clientes reais (`OpenAI`, `AzureOpenAI`)
+    sem acesso à rede. Normalmente é usado com um modelo `Replay`.
+
+    Args:
+        model (Model): Modelo que gera as respostas.
+        host (str): Endereço de escuta.
+        port (int): Porta de escuta. Se 0, o sistema escolhe uma porta livre.
+        batch_delay (float): Tempo, em segundos, que um lote permanece em
+                             processamento antes de ser executado.
+    """
+    self.model = model
+    self.batch_delay = batch_delay
+    self.files: dict[str, dict] = {}
+    self.batches: dict[str, dict] = {}
+    self._lock = threading.Lock()
+    self._server = ThreadingHTTPServer((host, port), self._handler())
+    self._server.daemon_threads = True
+    self._server.request_queue_size = 128
+    self._thread = None
+
+  @property
+  def url(self) -> str:
+    """
+    URL base para usar como `base_url` (OpenAI) ou `azure_endpoint` (Azure).
+    """
+    host, port = self._server.server_address[:2]
+    return f"http://{host}:{port}/v1"
+
+  def start(self) -> Self:
+    """
+    Inicia o servidor em uma thread em segundo plano.
+    """
+    if self._thread is None:
+      self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+      self._thread.start()
+    return self
+
+  def close(self) -> None:
+    """
+    Encerra o servidor.
+    """
+    if self._thread is not None:
+      self._server.shutdown()
+      self._thread.join()
+      self._thread = None
+    self._server.server_close()
+
+  def __enter__(self) -> Self:
+    return self.start()
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  def _complete(self, body: dict) -> tuple[ModelResponse, str]:
+    content = body.get("messages", [])
+    kwargs = {k: v for k, v in body.items() if k not in _HANDLED}
+    response = self.model.predict(content, body.get("temperature", 0.7), **kwargs)
+    raw = response.raw
+    stop = body.get("stop") or []
+    for s in [stop] if isinstance(stop, str) else stop:
+      if (i := raw.find(s)) != -1:
+        raw = raw[:i]
+    return response, raw
+
+  def _completion(self, body: dict) -> dict:
+    results = [self._complete(body) for _ in range(max(1, body.get("n") or 1))]
+    input_tokens = results[0][0].input_tokens
+    cached_tokens = results[0][0].cached_tokens
+    output_tokens = sum(response.output_tokens for response, _ in results)
+    return {
+        "id": _new_id("chatcmpl"),
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model"),
+        "choices": [{
+            "index": i,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": raw}
+        } for i, (_, raw) in enumerate(results)],
+        "usage": {
+            "prompt_tokens": input_tokens,
+            "completion_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "prompt_tokens_details": {"cached_tokens": cached_tokens}
+        }
+    }
+
+  def _run_batch(self, batch_id: str) -> None:
+    time.sleep(self.batch_delay)
+    with self._lock:
+      batch = self.batches[batch_id]
+      if batch["status"] != "in_progress":
+        return
+      lines = self.files[batch["input_file_id"]]["content"].decode("utf-8").splitlines()
+
+    outputs, errors = [], []
+    for line in filter(str.strip, lines):
+      request = json.loads(line)
+      try:
+        outputs.append(json.dumps({
+            "id": _new_id("batch_req"),
+            "custom_id": request["custom_id"],
+            "response": {"status_code": 200, "request_id": _new_id("req"),
+                         "body": self._completion(request["body"])},
+            "error": None
+        }))
+      except Exception as e:
+        errors.append(json.dumps({
+            "id": _new_id("batch_req"),
+            "custom_id": request["custom_id"],
+            "response": None,
+            "error": {"code": type(e).__name__, "message": str(e)}
+        }))
+
+    with self._lock:
+      if batch["status"] != "in_progress":
+        return
+      batch["output_file_id"] = self._store_file(
+          "batch_output.jsonl", "\n".join(outputs).encode(), "batch_output")
+      if errors:
+        batch["error_file_id"] = self._store_file(
+            "batch_errors.jsonl", "\n".join(errors).encode(), "batch_output")
+      batch["request_counts"] = {"total": len(outputs) + len(errors),
+                                 "completed": len(outputs), "failed": len(errors)}
+      batch["status"] = "completed"
+      batch["completed_at"] = int(time.time())
+
+  def _store_file(self, filename: str, content: bytes, purpose: str) -> str:
+    file_id = _new_id("file")
+    self.files[file_id] = {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(content),
+        "created_at": int(time.time()),
+        "filename": filename,
+        "purpose": purpose,
+        "status": "processed",
+        "content": content
+    }
+    return file_id
+
+  def _handler(self) -> type[BaseHTTPRequestHandler]:
+    server = self
+
+    class Handler(BaseHTTPRequestHandler):
+      protocol_version = "HTTP/1.1"
+
+      def log_message(self, *args) -> None:
+        pass
+
+      def _send(
+          self,
+          status: int,
+          data: bytes,
+          content_type: str = "application/json"
+      ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+      def _json(self, status: int, obj: dict) -> None:
+        self._send(status, json.dumps(obj).encode())
+
+      def _error(self, status: int, message: str) -> None:
+        self._json(status, {
+            "error": {"message": message, "type": "invalid_request_error"}})
+
+      def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+      def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        with server._lock:
+          if m := re.search(r"/files/([^/]+)/content$", path):
+            if (file := server.files.get(m.group(1))) is None:
+              return self._error(404, "File not found.")
+            return self._send(200, file["content"], "application/octet-stream")
+          if m := re.search(r"/files/([^/]+)$", path):
+            if (file := server.files.get(m.group(1))) is None:
+              return self._error(404, "File not found.")
+            return self._json(200, {k: v for k, v in file.items() if k != "content"})
+          if m := re.search(r"/batches/([^/]+)$", path):
+            if (batch := server.batches.get(m.group(1))) is None:
+              return self._error(404, "Batch not found.")
+            return self._json(200, batch)
+        self._error(404, "Not found.")
+
+      def do_POST(self) -> None:
+        path = self.path.split("?")[0]
+        try:
+          if path.endswith("/chat/completions"):
+            return self._chat(json.loads(self._body()))
+          if path.endswith("/files"):
+            return self._upload()
+          if path.endswith("/batches"):
+            return self._create_batch(json.loads(self._body()))
+          if m := re.search(r"/batches/([^/]+)/cancel$", path):
+            return self._cancel_batch(m.group(1))
+        except Exception as e:
+          status = getattr(e, "status_code", 500)
+          return self._error(status if isinstance(status, int) else 500, str(e))
+        self._error(404, "Not found.")
+
+      def _chat(self, body: dict) -> None:
+        if not body.get("stream"):
+          return self._json(200, server._completion(body))
+
+        response, raw = server._complete(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def event(
+            delta: dict,
+            finish_reason: str | None = None,
+            usage: dict | None = None
+        ) -> bytes:
+          chunk = {
+              "id": "chatcmpl-stream",
+              "object": "chat.completion.chunk",
+              "created": int(time.time()),
+              "model": body.get("model"),
+              "choices": [] if usage else [
+                  {"index": 0, "delta": delta, "finish_reason": finish_reason}],
+          }
+          if usage:
+            chunk["usage"] = usage
+          return f"data: {json.dumps(chunk)}\n\n".encode()
+
+        try:
+          pieces = re.findall(r"\S+\s*|\s+", raw)
+          for piece in pieces:
+            self.wfile.write(event({"content": piece}))
+          self.wfile.write(event({}, "stop"))
+          if (body.get("stream_options") or {}).get("include_usage"):
+            self.wfile.write(event({}, usage={
+                "prompt_tokens": response.input_tokens,
+                "completion_tokens": len(pieces),
+                "total_tokens": response.input_tokens + len(pieces),
+                "prompt_tokens_details": {"cached_tokens": response.cached_tokens}
+            }))
+          self.wfile.write(b"data: [DONE]\n\n")
+          self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+          pass
+
+      def _upload(self) -> None:
+        message = BytesParser(policy=HTTP).parsebytes(
+            b"Content-Type: " + self.headers["Content-Type"].encode()
+            + b"\r\n\r\n" + self._body())
+        fields = {part.get_param("name", header="content-disposition"): part
+                  for part in message.iter_parts()}
+        file = fields["file"]
+        purpose = (fields["purpose"].get_content().strip()
+                   if "purpose" in fields else "batch")
+        with server._lock:
+          file_id = server._store_file(file.get_filename() or "upload.jsonl",
+                                       file.get_payload(decode=True), purpose)
+          self._json(200, {k: v for k, v in server.files[file_id].items()
+                           if k != "content"})
+
+      def _create_batch(self, body: dict) -> None:
+        with server._lock:
+          if body.get("input_file_id") not in server.files:
+            return self._error(400, "Input file not found.")
+          batch_id = _new_id("batch")
+          server.batches[batch_id] = {
+              "id": batch_id,
+              "object": "batch",
+              "endpoint": body.get("endpoint"),
+              "errors": None,
+              "input_file_id": body["input_file_id"],
+              "completion_window": body.get("completion_window", "24h"),
+              "status": "in_progress",
+              "output_file_id": None,
+              "error_file_id": None,
+              "created_at": int(time.time()),
+              "in_progress_at": int(time.time()),
+              "completed_at": None,
+              "request_counts": {"total": 0, "completed": 0, "failed": 0},
+          }
+          self._json(200, server.batches[batch_id])
+        threading.Thread(
+            target=server._run_batch, args=(batch_id,), daemon=True).start()
+
+      def _cancel_batch(self, batch_id: str) -> None:
+        with server._lock:
+          if (batch := server.batches.get(batch_id)) is None:
+            return self._error(404, "Batch not found.")
+          if batch["status"] == "in_progress":
+            batch["status"] = "cancelled"
+          self._json(200, batch)
+
+    return Handler
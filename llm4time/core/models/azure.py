@@ -1,11 +1,23 @@
-from openai import AzureOpenAI as Client
-from ._base import Model, ModelResponse
-import time
-
-
-class AzureOpenAI(Model):
-
-  def __init__(self, model: str, api_key: str, azure_endpoint: str, api_version: str) -> ModelResponse:
+from openai import AzureOpenAI as Client, AsyncAzureOpenAI as AsyncClient
+from openai import DefaultHttpxClient, DefaultAsyncHttpxClient
+from ._base import Provider
+from .openai import OpenAI
+
+
+class AzureOpenAI(OpenAI):
+  provider = Provider.AZURE
+  batch_endpoint = "/chat/completions"
+
+  def __init__(
+      self,
+      model: str,
+      api_key: str,
+      azure_endpoint: str,
+      api_version: str,
+      max_connections: int = 100,
+      max_keepalive_connections: int = 20,
+      keepalive_expiry: float = 5.0
+  ) -> None:
     """
     Inicializa a classe AzureOpenAI com configurações de conexão.
 
@@ -14,38 +26,37 @@ class AzureOpenAI(Model):
         api_key (str): Chave de API para autenticação.
         azure_endpoint (str): URL do endpoint Azure OpenAI.
         api_version (str): Versão da API Azure OpenAI.
+        max_connections (int): Número máximo de conexões simultâneas no pool.
+        max_keepalive_connections (int): Número máximo de conexões ociosas mantidas
+            abertas.
+        keepalive_expiry (float): Tempo, em segundos, que uma conexão ociosa permanece
+            aberta.
     """
-    self.model = model
-    self.api_key = api_key
+    super().__init__(
+        model,
+        api_key,
+        None,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry
+    )
     self.azure_endpoint = azure_endpoint
     self.api_version = api_version
-    super().__init__(model)
 
-  def predict(self, content: str, temperature: float = 0.7, **kwargs) -> ModelResponse:
-    client = Client(
+  def _connect(self) -> Client:
+    return Client(
         api_key=self.api_key,
         azure_endpoint=self.azure_endpoint,
-        api_version=self.api_version
+        api_version=self.api_version,
+        max_retries=self._max_retries(),
+        http_client=DefaultHttpxClient(limits=self._limits())
     )
 
-    params = {
-        "model": self.model,
-        "messages": [{"role": "user", "content": content}],
-        "temperature": temperature
-    }
-    params.update(kwargs)
-
-    start_time = time.time()
-    response = client.chat.completions.create(**params)
-    end_time = time.time()
-
-    raw = response.choices[0].message.content
-    usage = response.usage
-
-    return ModelResponse(
-        raw=raw,
-        predicted=self._output(raw),
-        input_tokens=usage.prompt_tokens,
-        output_tokens=usage.completion_tokens,
-        time=end_time - start_time
+  async def _aconnect(self) -> AsyncClient:
+    return AsyncClient(
+        api_key=self.api_key,
+        azure_endpoint=self.azure_endpoint,
+        api_version=self.api_version,
+        max_retries=self._max_retries(),
+        http_client=DefaultAsyncHttpxClient(limits=self._limits())
     )
@@ -1,29 +1,180 @@
 import lmstudio as lms
-from ._base import Model, ModelResponse
+from ._base import Model, ModelResponse, Provider, _OutStream, _OUT_CLOSE, _record
+import asyncio
 import time
 
 
 class LMStudio(Model):
+  provider = Provider.LM_STUDIO
 
-  def __init__(self, model: str) -> None:
+  def __init__(self, model: str, api_host: str = None) -> None:
     """
     Inicializa a classe LMStudio com o modelo especificado.
 
     Args:
         model (str): Nome ou caminho do modelo LM Studio.
+        api_host (str, opcional): Endereço do servidor LM Studio (ex: 'localhost:1234').
+                                  Se None, usa o endereço padrão.
     """
+    super().__init__()
     self.model = model
+    self.api_host = api_host
+    self._llm = None
 
-  def predict(self, content: str, temperature: float = 0.7, **kwargs) -> tuple[str, int, int, float]:
-    client = lms.llm(self.model)
+  def _connect(self) -> lms.Client:
+    return lms.Client(self.api_host)
 
+  @property
+  def llm(self) -> lms.LLM:
+    """
+    Handle do modelo no servidor, obtido uma única vez por conexão.
+    """
+    client = self.client
+    if self._llm is None:
+      with self._lock:
+        if self._llm is None:
+          start_time = time.perf_counter()
+          self._llm = client.llm.model(self.model)
+          _record("connect", time.perf_counter() - start_time)
+    return self._llm
+
+  def close(self) -> None:
+    with self._lock:
+      self._llm = None
+      super().close()
+
+  async def _aconnect(self) -> tuple[lms.AsyncClient, lms.AsyncLLM]:
+    client = lms.AsyncClient(self.api_host)
+    await client.__aenter__()
+    try:
+      return client, await client.llm.model(self.model)
+    except BaseException:
+      await client.aclose()
+      raise
+
+  async def _adisconnect(self, client: tuple[lms.AsyncClient, lms.AsyncLLM]) -> None:
+    await client[0].aclose()
+
+  def _predict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    config = {"temperature": temperature}
+    config.update(kwargs)
+    llm = self.llm
+
+    start_time = time.perf_counter()
+    response = llm.respond(_history(content), config=config)
+    end_time = time.perf_counter()
+
+    return self._response(response, end_time - start_time)
+
+  async def _apredict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    """
+    Versão assíncrona de `_predict`.
+
+    A API assíncrona do LM Studio exige que a conexão seja aberta e fechada
+    na mesma tarefa. Dentro de `async with model:` (ou de `predict_many`) a
+    conexão é compartilhada; fora dele, cada chamada abre a sua própria.
+    """
+    config = {"temperature": temperature}
+    config.update(kwargs)
+
+    if asyncio.get_running_loop() in self._aclients:
+      _, llm = await self._aclient()
+      start_time = time.perf_counter()
+      response = await llm.respond(_history(content), config=config)
+      end_time = time.perf_counter()
+    else:
+      async with lms.AsyncClient(self.api_host) as client:
+        llm = await self._amodel(client)
+        start_time = time.perf_counter()
+        response = await llm.respond(_history(content), config=config)
+        end_time = time.perf_counter()
+
+    return self._response(response, end_time - start_time)
+
+  async def _amodel(self, client: lms.AsyncClient) -> lms.AsyncLLM:
+    # Conexão aberta por chamada: o handshake é contabilizado como conexão.
+    start_time = time.perf_counter()
+    llm = await client.llm.model(self.model)
+    _record("connect", time.perf_counter() - start_time)
+    return llm
+
+  def _stream_config(self, temperature: float, **kwargs) -> dict:
     config = {"temperature": temperature}
     config.update(kwargs)
+    stop = list(config.get("stopStrings") or [])
+    if _OUT_CLOSE not in stop:
+      stop.append(_OUT_CLOSE)
+    config["stopStrings"] = stop
+    return config
+
+  def _predict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    config = self._stream_config(temperature, **kwargs)
+    llm = self.llm
+
+    start_time = time.perf_counter()
+    out = _OutStream(start_time)
+    stream = llm.respond_stream(_history(content), config=config)
+    for fragment in stream:
+      if out.feed(fragment.content, time.perf_counter()):
+        stream.cancel()
+    end_time = time.perf_counter()
+
+    return self._stream_response(out, stream.result(), end_time)
+
+  async def _apredict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    config = self._stream_config(temperature, **kwargs)
 
-    start_time = time.time()
-    response = client.respond(content, config=config)
-    end_time = time.time()
+    async def consume(llm: lms.AsyncLLM) -> ModelResponse:
+      start_time = time.perf_counter()
+      out = _OutStream(start_time)
+      stream = await llm.respond_stream(_history(content), config=config)
+      async for fragment in stream:
+        if out.feed(fragment.content, time.perf_counter()):
+          await stream.cancel()
+      end_time = time.perf_counter()
+      return self._stream_response(out, stream.result(), end_time)
 
+    if asyncio.get_running_loop() in self._aclients:
+      _, llm = await self._aclient()
+      return await consume(llm)
+    async with lms.AsyncClient(self.api_host) as client:
+      return await consume(await self._amodel(client))
+
+  def _stream_response(self, out: _OutStream, result, end_time: float) -> ModelResponse:
+    stats = getattr(result, "stats", None)
+    stopped = stats is not None and stats.stop_reason == "stopStringFound"
+    raw = out.finish(stopped, end_time)
+    return ModelResponse(
+        raw=raw,
+        predicted=self._output(raw),
+        input_tokens=(stats.prompt_tokens_count or 0) if stats else 0,
+        output_tokens=(stats.predicted_tokens_count or 0) if stats else out.chunks,
+        time=end_time - out.start_time,
+        time_to_first_token=out.time_to_first_token,
+        time_to_out=out.time_to_out
+    )
+
+  def _response(self, response, elapsed: float) -> ModelResponse:
     raw = response.text if hasattr(
         response, 'text') else str(response)
 
@@ -37,5 +188,11 @@ class LMStudio(Model):
         predicted=self._output(raw),
         input_tokens=input_tokens,
         output_tokens=output_tokens,
-        time=end_time - start_time
+        time=elapsed
     )
+
+
+def _history(content: str | list[dict]) -> str | lms.Chat:
+  if isinstance(content, str):
+    return content
+  return lms.Chat.from_history({"messages": content})
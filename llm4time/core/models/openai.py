@@ -1,11 +1,29 @@
-from openai import OpenAI as Client
-from ._base import Model, ModelResponse
+from openai import OpenAI as Client, AsyncOpenAI as AsyncClient
+from openai import DefaultHttpxClient, DefaultAsyncHttpxClient, DEFAULT_MAX_RETRIES
+from openai.types.chat import ChatCompletion
+from ._base import Model, ModelResponse, Provider, _OutStream, _OUT_CLOSE, _messages
+from llm4time._infra import logger
+import httpx
+import json
 import time
 
+_BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
 
 class OpenAI(Model):
+  provider = Provider.OPENAI
+  supports_n = True
+  batch_endpoint = "/v1/chat/completions"
 
-  def __init__(self, model: str, api_key: str, base_url: str) -> None:
+  def __init__(
+      self,
+      model: str,
+      api_key: str,
+      base_url: str,
+      max_connections: int = 100,
+      max_keepalive_connections: int = 20,
+      keepalive_expiry: float = 5.0
+  ) -> None:
     """
     Inicializa a classe OpenAI com configurações de conexão.
 
@@ -13,32 +31,307 @@ class OpenAI(Model):
         model (str): Nome do modelo OpenAI.
         api_key (str): Chave de API para autenticação.
         base_url (str): URL base do endpoint OpenAI.
+        max_connections (int): Número máximo de conexões simultâneas no pool.
+        max_keepalive_connections (int): Número máximo de conexões ociosas mantidas
+            abertas.
+        keepalive_expiry (float): Tempo, em segundos, que uma conexão ociosa permanece
+            aberta.
     """
+    super().__init__()
     self.model = model
     self.api_key = api_key
     self.base_url = base_url
+    self.max_connections = max_connections
+    self.max_keepalive_connections = max_keepalive_connections
+    self.keepalive_expiry = keepalive_expiry
+
+  def _limits(self) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=self.max_connections,
+        max_keepalive_connections=self.max_keepalive_connections,
+        keepalive_expiry=self.keepalive_expiry
+    )
 
-  def predict(self, content: str, temperature: float = 0.7, **kwargs) -> ModelResponse:
-    client = Client(api_key=self.api_key, base_url=self.base_url)
+  def _max_retries(self) -> int:
+    # Com um limitador, as novas tentativas ficam só com ele: os retries do SDK
+    # esconderiam as respostas 429 do AIMD e somariam o seu backoff ao do limitador.
+    return 0 if self.limiter is not None else DEFAULT_MAX_RETRIES
 
+  def _connect(self) -> Client:
+    return Client(
+        api_key=self.api_key,
+        base_url=self.base_url,
+        max_retries=self._max_retries(),
+        http_client=DefaultHttpxClient(limits=self._limits())
+    )
+
+  async def _aconnect(self) -> AsyncClient:
+    return AsyncClient(
+        api_key=self.api_key,
+        base_url=self.base_url,
+        max_retries=self._max_retries(),
+        http_client=DefaultAsyncHttpxClient(limits=self._limits())
+    )
+
+  def _params(self, content: str | list[dict], temperature: float, **kwargs) -> dict:
     params = {
         "model": self.model,
-        "messages": [{"role": "user", "content": content}],
+        "messages": _messages(content),
         "temperature": temperature
     }
     params.update(kwargs)
+    return params
+
+  def _predict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    params = self._params(content, temperature, **kwargs)
+    client = self.client
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = client.chat.completions.create(**params)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
-    raw = response.choices[0].message.content
-    usage = response.usage
+    return self._response(response, end_time - start_time)
+
+  async def _apredict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    params = self._params(content, temperature, **kwargs)
+    client = await self._aclient()
+
+    start_time = time.perf_counter()
+    response = await client.chat.completions.create(**params)
+    end_time = time.perf_counter()
 
+    return self._response(response, end_time - start_time)
+
+  def _stream_params(
+      self,
+      content: str | list[dict],
+      temperature: float,
+      **kwargs
+  ) -> dict:
+    params = self._params(content, temperature, **kwargs)
+    stop = params.get("stop") or []
+    stop = [stop] if isinstance(stop, str) else list(stop)
+    if _OUT_CLOSE not in stop:
+      stop.append(_OUT_CLOSE)
+    params.update({
+        "stop": stop,
+        "stream": True,
+        "stream_options": {"include_usage": True}
+    })
+    return params
+
+  def _predict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    params = self._stream_params(content, temperature, **kwargs)
+    client = self.client
+
+    start_time = time.perf_counter()
+    out = _OutStream(start_time)
+    usage, finish_reason = None, None
+    with client.chat.completions.create(**params) as stream:
+      for chunk in stream:
+        usage = chunk.usage or usage
+        if not chunk.choices:
+          continue
+        finish_reason = chunk.choices[0].finish_reason or finish_reason
+        if out.feed(chunk.choices[0].delta.content, time.perf_counter()):
+          break
+    end_time = time.perf_counter()
+
+    return self._stream_response(out, finish_reason, usage, end_time)
+
+  async def _apredict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    params = self._stream_params(content, temperature, **kwargs)
+    client = await self._aclient()
+
+    start_time = time.perf_counter()
+    out = _OutStream(start_time)
+    usage, finish_reason = None, None
+    async with await client.chat.completions.create(**params) as stream:
+      async for chunk in stream:
+        usage = chunk.usage or usage
+        if not chunk.choices:
+          continue
+        finish_reason = chunk.choices[0].finish_reason or finish_reason
+        if out.feed(chunk.choices[0].delta.content, time.perf_counter()):
+          break
+    end_time = time.perf_counter()
+
+    return self._stream_response(out, finish_reason, usage, end_time)
+
+  def _stream_response(
+      self,
+      out: _OutStream,
+      finish_reason: str | None,
+      usage,
+      end_time: float
+  ) -> ModelResponse:
+    # Sem o bloco de uso (stream cancelado), cada fragmento conta como um token.
+    raw = out.finish(finish_reason == "stop", end_time)
     return ModelResponse(
         raw=raw,
         predicted=self._output(raw),
+        input_tokens=usage.prompt_tokens if usage else 0,
+        output_tokens=usage.completion_tokens if usage else out.chunks,
+        time=end_time - out.start_time,
+        time_to_first_token=out.time_to_first_token,
+        time_to_out=out.time_to_out,
+        cached_tokens=_cached_tokens(usage)
+    )
+
+  def _response(self, response, elapsed: float) -> ModelResponse:
+    raws = [c.message.content for c in response.choices]
+    usage = response.usage
+    # Com `n` > 1, uma escolha sem bloco `<out>` vira uma candidata None.
+    if (samples := self._samples(raws)) is None:
+      raw, predicted = raws[0], self._output(raws[0])
+    else:
+      raw, predicted = self._first(raws, samples)
+
+    return ModelResponse(
+        raw=raw,
+        predicted=predicted,
         input_tokens=usage.prompt_tokens,
         output_tokens=usage.completion_tokens,
-        time=end_time - start_time
+        time=elapsed,
+        samples=samples,
+        cached_tokens=_cached_tokens(usage)
     )
+
+  def predict_batch(
+      self,
+      prompts: list[str | list[dict]],
+      temperature: float = 0.7,
+      poll_interval: float = 30.0,
+      timeout: float | None = None,
+      completion_window: str = "24h",
+      **kwargs
+  ) -> list[ModelResponse | None]:
+    """
+    Envia várias requisições pela Batch API e aguarda a conclusão do lote.
+
+    Indicado para execuções longas sem requisito de latência: o lote é gravado
+    em um arquivo JSONL, submetido ao provedor e consultado periodicamente até
+    terminar. Prompts já presentes no cache não são reenviados.
+
+    Args:
+        prompts (list[str | list[dict]]): Conteúdos (ou listas de mensagens) a serem
+            enviados.
+        temperature (float): Grau de aleatoriedade das respostas.
+        poll_interval (float): Intervalo, em segundos, entre consultas ao status do
+            lote.
+        timeout (float | None): Tempo máximo de espera, em segundos. Ao ser excedido,
+                                o lote é cancelado. Se None, aguarda indefinidamente.
+        completion_window (str): Janela de conclusão solicitada ao provedor.
+        **kwargs: Argumentos adicionais incluídos no corpo de cada requisição.
+
+    Returns:
+        list[ModelResponse | None]: Respostas na mesma ordem de `prompts`. Requisições
+            que falharam no provedor ou cuja resposta não tem bloco `<out>` retornam
+            None. O campo `time` de cada resposta é o tempo total do lote.
+
+    Raises:
+        RuntimeError: Se o lote terminar com status diferente de 'completed'.
+        TimeoutError: Se o lote não terminar dentro de `timeout`.
+    """
+    responses: list[ModelResponse | None] = [None] * len(prompts)
+    keys = [self._cache_key(content, temperature, **kwargs) for content in prompts]
+    pending = []
+    for i, key in enumerate(keys):
+      if key is not None and (response := self.cache.get(key)) is not None:
+        responses[i] = response
+      else:
+        pending.append(i)
+    if not pending:
+      return responses
+
+    if (samples := kwargs.pop("samples", 1)) > 1:
+      kwargs["n"] = samples
+    lines = [
+        json.dumps({
+            "custom_id": f"request-{i}",
+            "method": "POST",
+            "url": self.batch_endpoint,
+            "body": self._params(prompts[i], temperature, **kwargs)
+        })
+        for i in pending
+    ]
+
+    start_time = time.perf_counter()
+    batch_file = self.client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = self.client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=self.batch_endpoint,
+        completion_window=completion_window
+    )
+    logger.info(f"Batch {batch.id} submitted with {len(pending)} requests.")
+
+    while batch.status not in _BATCH_FINAL_STATUSES:
+      if timeout is not None and time.perf_counter() - start_time > timeout:
+        self.client.batches.cancel(batch.id)
+        raise TimeoutError(f"Batch {batch.id} did not finish within {timeout} seconds.")
+      time.sleep(poll_interval)
+      batch = self.client.batches.retrieve(batch.id)
+    end_time = time.perf_counter()
+
+    if batch.status != "completed":
+      raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'.")
+
+    if batch.error_file_id:
+      for line in self.client.files.content(batch.error_file_id).text.splitlines():
+        if line.strip():
+          result = json.loads(line)
+          logger.error(f"Batch request {result['custom_id']} failed: "
+                       f"{result.get('error')}")
+
+    if batch.output_file_id:
+      for line in self.client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+          continue
+        result = json.loads(line)
+        i = int(result["custom_id"].removeprefix("request-"))
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code", 200) != 200:
+          logger.error(f"Batch request {result['custom_id']} failed: "
+                       f"{result.get('error') or response.get('body')}")
+          continue
+        completion = ChatCompletion.model_validate(response["body"])
+        try:
+          responses[i] = self._response(completion, end_time - start_time)
+        except IndexError:
+          # Resposta sem bloco `<out>`: as demais linhas do lote continuam.
+          logger.error(f"Batch request {result['custom_id']} failed: "
+                       "no <out> block in the response.")
+          continue
+        if keys[i] is not None:
+          self.cache.set(keys[i], responses[i])
+
+    return responses
+
+
+def _cached_tokens(usage) -> int:
+  """
+  Tokens de entrada atendidos pelo cache de prompts do provedor.
+  """
+  details = getattr(usage, "prompt_tokens_details", None)
+  return getattr(details, "cached_tokens", None) or 0
@@ -0,0 +1,252 @@
+from typing import Callable
+from ..data import TSFormat
+from ..formatting import from_str
+from ._base import Model, ModelResponse, Provider, _OutStream, _OUT_OPEN, _OUT_CLOSE
+from ._base import _text
+import pandas as pd
+import threading
+import asyncio
+import random
+import json
+import time
+import re
+
+
+class ReplayError(Exception):
+
+  def __init__(self, message: str, status_code: int) -> None:
+    """
+    Erro sintético gerado pelo provedor de replay.
+
+    Args:
+        message (str): Mensagem de erro.
+        status_code (int): Código HTTP simulado (ex: 429, 503).
+    """
+    super().__init__(message)
+    self.status_code = status_code
+
+
+def seasonal_naive(
+    tsformat: str = "csv",
+    season: int | None = None,
+    index: bool = True
+) -> Callable[[str], str]:
+  """
+  Cria um gerador de respostas com a previsão sazonal ingênua da série do prompt.
+
+  O gerador lê o horizonte ("next N values") e a série após "Series Data for
+  Forecast:", repete os últimos `season` valores e devolve a previsão no mesmo
+  formato, delimitada por `<out></out>`.
+
+  Args:
+      tsformat (TSFormat | str): Formato da série no prompt.
+      season (int | None): Período sazonal. Se None, usa o horizonte da previsão.
+      index (bool): Se False, lê a série de prompts sem índice
+                    (`prompt(..., index=False)`), precedida pelo instante inicial e
+                    pela frequência, e responde sem índice.
+
+  Returns:
+      Callable[[str], str]: Função que recebe o prompt e retorna a resposta bruta.
+  """
+  def generate(content: str) -> str:
+    horizon = re.search(r"next (\d+)", content)
+    data = re.search(r"Series Data for Forecast:\n(.*)$", content, re.DOTALL)
+    if horizon is None or data is None:
+      raise ValueError("Prompt does not contain a forecast horizon and series data.")
+    periods = int(horizon.group(1))
+    format = TSFormat(tsformat)
+
+    body = data.group(1).strip()
+    if index:
+      ts = from_str(body, format)
+    else:
+      start = re.match(r"Start: (.+), frequency: (\S+)\n", body)
+      if start is None:
+        raise ValueError(
+            "Prompt does not contain the start and frequency of the series.")
+      ts = from_str(
+          body[start.end():], format, last=start.group(1), freq=start.group(2))
+      ts.index = ts.index.shift(-1)
+    k = min(season or periods, len(ts))
+    reps = -(-periods // k)
+    values = pd.concat([ts.iloc[-k:]] * reps).iloc[:periods]
+
+    if (freq := getattr(ts.index, "freq", None)) is not None:
+      future = pd.date_range(ts.index[-1], periods=periods + 1, freq=freq)[1:]
+      values.index = future.rename(ts.index.name)
+    forecast = ts._constructor(values)
+    return f"{_OUT_OPEN}\n{forecast.to_str(format, index=index)}\n{_OUT_CLOSE}"
+
+  return generate
+
+
+class Replay(Model):
+  provider = Provider.REPLAY
+
+  def __init__(
+      self,
+      model: str = "replay",
+      responses: str | list[dict] | None = None,
+      generator: Callable[[str], str] | None = None,
+      latency: float = 0.0,
+      jitter: float = 0.0,
+      tokens_per_second: float | None = None,
+      error_rate: float = 0.0,
+      error_status: int = 429,
+      seed: int | None = None
+  ) -> None:
+    """
+    Inicializa um provedor local e determinístico, sem acesso à rede.
+
+    As respostas vêm de um registro gravado (busca exata pelo conteúdo do prompt)
+    ou, na falta dele, de um gerador sintético. Latência, contagem de tokens e
+    taxa de erros são configuráveis para medir desempenho do pipeline.
+
+    Prompts em lista de mensagens simulam o cache de prompts dos provedores:
+    as mensagens anteriores à última, quando já vistas, contam como `cached_tokens`.
+
+    Args:
+        model (str): Nome do modelo reportado nas respostas.
+        responses (str | list[dict] | None): Caminho de um arquivo JSONL ou lista de
+            registros com as chaves 'content' (texto ou lista de mensagens) e 'raw'
+            (e, opcionalmente, 'input_tokens', 'output_tokens' e 'time').
+        generator (Callable[[str], str] | None): Função que recebe o prompt e retorna
+            a resposta bruta. Usada quando o prompt não está no registro.
+            Se None e sem registro, usa `seasonal_naive()`.
+        latency (float): Latência base, em segundos, de cada requisição.
+        jitter (float): Variação máxima, em segundos, somada à latência.
+        tokens_per_second (float | None): Velocidade simulada de geração. Se definida,
+            o tempo de geração dos tokens de saída é somado à latência.
+        error_rate (float): Probabilidade (0 a 1) de uma requisição falhar.
+        error_status (int): Código HTTP simulado dos erros.
+        seed (int | None): Semente do gerador aleatório de latência e erros.
+    """
+    super().__init__()
+    self.model = model
+    self.latency = latency
+    self.jitter = jitter
+    self.tokens_per_second = tokens_per_second
+    self.error_rate = error_rate
+    self.error_status = error_status
+    self.generator = generator
+    self._random = random.Random(seed)
+    self._random_lock = threading.Lock()
+    self._prefixes: set[str] = set()
+
+    if isinstance(responses, str):
+      with open(responses, encoding="utf-8") as f:
+        responses = [json.loads(line) for line in f if line.strip()]
+    self.responses = {_text(r["content"]): r for r in (responses or [])}
+    if self.generator is None and not self.responses:
+      self.generator = seasonal_naive()
+
+  def _connect(self) -> None:
+    return None
+
+  async def _aconnect(self) -> None:
+    return None
+
+  def _tokens(self, text: str) -> int:
+    return max(1, len(text) // 4)
+
+  def _sample(self, content: str | list[dict]) -> tuple[dict, float]:
+    prefix = "" if isinstance(content, str) else _text(content[:-1])
+    with self._random_lock:
+      failed = self._random.random() < self.error_rate
+      jitter = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+      cached = bool(prefix) and prefix in self._prefixes
+      if prefix and not failed:
+        self._prefixes.add(prefix)
+    if failed:
+      raise ReplayError(f"Simulated error {self.error_status}.", self.error_status)
+
+    content = _text(content)
+    if content in self.responses:
+      record = self.responses[content]
+    elif self.generator is not None:
+      record = {"raw": self.generator(content)}
+    else:
+      raise KeyError("Prompt not found in the replay log.")
+
+    record = {
+        "raw": record["raw"],
+        "input_tokens": record.get("input_tokens", self._tokens(content)),
+        "output_tokens": record.get("output_tokens", self._tokens(record["raw"])),
+        "cached_tokens": self._tokens(prefix) if cached else 0,
+    }
+    delay = self.latency + jitter
+    if self.tokens_per_second:
+      delay += record["output_tokens"] / self.tokens_per_second
+    return record, delay
+
+  def _predict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    start_time = time.perf_counter()
+    record, delay = self._sample(content)
+    time.sleep(delay)
+    return self._response(record, time.perf_counter() - start_time)
+
+  async def _apredict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    start_time = time.perf_counter()
+    record, delay = self._sample(content)
+    await asyncio.sleep(delay)
+    return self._response(record, time.perf_counter() - start_time)
+
+  def _predict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    start_time = time.perf_counter()
+    record, delay = self._sample(content)
+    time.sleep(delay)
+    return self._stream_response(record, start_time)
+
+  async def _apredict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    start_time = time.perf_counter()
+    record, delay = self._sample(content)
+    await asyncio.sleep(delay)
+    return self._stream_response(record, start_time)
+
+  def _response(self, record: dict, elapsed: float) -> ModelResponse:
+    return ModelResponse(
+        raw=record["raw"],
+        predicted=self._output(record["raw"]),
+        input_tokens=record["input_tokens"],
+        output_tokens=record["output_tokens"],
+        time=elapsed,
+        cached_tokens=record["cached_tokens"]
+    )
+
+  def _stream_response(self, record: dict, start_time: float) -> ModelResponse:
+    out = _OutStream(start_time)
+    raw = record["raw"]
+    end = raw.find(_OUT_CLOSE, raw.find(_OUT_OPEN))
+    out.feed(raw if end == -1 else raw[:end + len(_OUT_CLOSE)], time.perf_counter())
+    end_time = time.perf_counter()
+    raw = out.finish(True, end_time)
+    return ModelResponse(
+        raw=raw,
+        predicted=self._output(raw),
+        input_tokens=record["input_tokens"],
+        output_tokens=self._tokens(raw),
+        time=end_time - start_time,
+        time_to_first_token=out.time_to_first_token,
+        time_to_out=out.time_to_out,
+        cached_tokens=record["cached_tokens"]
+    )
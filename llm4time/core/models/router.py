@@ -0,0 +1,280 @@
+from typing import Any, Callable
+from llm4time._infra import logger
+from ._base import Model, ModelResponse
+from ._ratelimit import _RETRYABLE_STATUS
+import lmstudio as lms
+import threading
+import asyncio
+import openai
+import time
+
+# Falhas de transporte atribuídas ao endpoint
+# (APITimeoutError herda de APIConnectionError).
+_CONNECTION_ERRORS = (
+    openai.APIConnectionError,
+    lms.LMStudioWebsocketError,
+    lms.LMStudioChannelClosedError,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+class _Endpoint:
+
+  def __init__(self, model: Model) -> None:
+    self.model = model
+    self.in_flight = 0
+    self.latency: float | None = None
+    self.failures = 0
+    self.ejected_until = 0.0
+
+
+class RoutedModel(Model):
+
+  def __init__(
+      self,
+      models: list[Model],
+      strategy: str = "ewma",
+      alpha: float = 0.3,
+      max_failures: int = 3,
+      cooldown: float = 30.0,
+      max_attempts: int | None = None,
+      health_check: Callable[[Model], bool] | None = None
+  ) -> None:
+    """
+    Distribui requisições entre vários endpoints que servem o mesmo modelo.
+
+    Cada requisição vai ao endpoint com menor carga: menos requisições em
+    andamento ('least_in_flight') ou menor latência média móvel (EWMA) ponderada
+    pelas requisições em andamento ('ewma'). Endpoints com `max_failures` falhas
+    seguidas são removidos por `cooldown` segundos e uma requisição que falha por
+    conexão, timeout ou erro HTTP transitório é repetida em outro endpoint.
+
+    Cache, limitador de taxa, callbacks e hedging configurados no `RoutedModel`
+    valem para todas as requisições; os dos modelos internos não são usados.
+
+    Args:
+        models (list[Model]): Modelos (um por endpoint) que servem o mesmo modelo.
+        strategy (str): Estratégia de balanceamento: 'ewma' ou 'least_in_flight'.
+        alpha (float): Peso (0 a 1) da latência mais recente na média móvel.
+        max_failures (int): Falhas seguidas até o endpoint ser removido.
+        cooldown (float): Tempo, em segundos, que um endpoint removido fica fora.
+        max_attempts (int | None): Endpoints tentados por requisição. Se None, todos.
+        health_check (Callable[[Model], bool] | None): Verificação executada antes de
+            readmitir um endpoint ao fim do cooldown. Se None, o endpoint volta e
+            é removido novamente na primeira falha.
+
+    Raises:
+        ValueError: Se a lista de modelos estiver vazia ou a estratégia não for
+            suportada.
+    """
+    if not models:
+      raise ValueError("At least one model must be set.")
+    if strategy not in ("ewma", "least_in_flight"):
+      raise ValueError("Supported strategies: ewma, least_in_flight.")
+
+    super().__init__()
+    self.provider = models[0].provider
+    self.model = models[0].model
+    self.supports_n = all(m.supports_n for m in models)
+    self.strategy = strategy
+    self.alpha = alpha
+    self.max_failures = max_failures
+    self.cooldown = cooldown
+    self.max_attempts = max_attempts or len(models)
+    self.health_check = health_check
+    self._endpoints = [_Endpoint(m) for m in models]
+    self._route_lock = threading.Lock()
+
+  @property
+  def models(self) -> list[Model]:
+    return [e.model for e in self._endpoints]
+
+  def status(self) -> list[dict[str, Any]]:
+    """
+    Estado atual de cada endpoint.
+
+    Returns:
+        list[dict[str, Any]]: Modelo, requisições em andamento, latência EWMA,
+            falhas seguidas e se o endpoint está removido.
+    """
+    now = time.monotonic()
+    with self._route_lock:
+      return [{
+          "model": e.model,
+          "in_flight": e.in_flight,
+          "latency": e.latency,
+          "failures": e.failures,
+          "ejected": e.ejected_until > now,
+      } for e in self._endpoints]
+
+  def _connect(self) -> None:
+    return None
+
+  async def _aconnect(self) -> None:
+    return None
+
+  def close(self) -> None:
+    for model in self.models:
+      model.close()
+
+  async def aclose(self) -> None:
+    await asyncio.gather(*(model.aclose() for model in self.models))
+
+  def _expired(self) -> list[_Endpoint]:
+    # Endpoints cujo cooldown terminou e ainda não foram readmitidos.
+    now = time.monotonic()
+    with self._route_lock:
+      expired = [e for e in self._endpoints if 0 < e.ejected_until <= now]
+      for e in expired:
+        e.ejected_until = 0.0
+        e.failures = self.max_failures - 1
+    return expired
+
+  def _readmit(self, expired: list[_Endpoint]) -> None:
+    for endpoint in expired:
+      try:
+        healthy = self.health_check(endpoint.model)
+      except Exception:
+        healthy = False
+      if not healthy:
+        logger.warning(f"Endpoint {endpoint.model.model} failed the health check.")
+        with self._route_lock:
+          endpoint.ejected_until = time.monotonic() + self.cooldown
+      else:
+        with self._route_lock:
+          endpoint.failures = 0
+
+  def _select(self, tried: list[_Endpoint]) -> _Endpoint | None:
+    now = time.monotonic()
+    with self._route_lock:
+      candidates = [e for e in self._endpoints if e not in tried]
+      if not candidates:
+        return None
+      # Com todos removidos, usa o que volta primeiro em vez de falhar.
+      available = [e for e in candidates if e.ejected_until <= now]
+      if not available:
+        available = [min(candidates, key=lambda e: e.ejected_until)]
+      if self.strategy == "least_in_flight":
+        endpoint = min(available, key=lambda e: (e.in_flight, e.latency or 0.0))
+      else:
+        endpoint = min(available, key=lambda e: (
+            (e.latency or 0.0) * (e.in_flight + 1), e.in_flight))
+      endpoint.in_flight += 1
+      return endpoint
+
+  def _release(
+      self,
+      endpoint: _Endpoint,
+      latency: float | None,
+      failed: bool = False
+  ) -> None:
+    with self._route_lock:
+      endpoint.in_flight -= 1
+      if latency is not None:
+        endpoint.failures = 0
+        endpoint.latency = latency if endpoint.latency is None else (
+            self.alpha * latency + (1 - self.alpha) * endpoint.latency)
+      elif failed:
+        endpoint.failures += 1
+        if endpoint.failures >= self.max_failures:
+          endpoint.ejected_until = time.monotonic() + self.cooldown
+          logger.warning(
+              f"Endpoint {endpoint.model.model} ejected for {self.cooldown}s.")
+
+  def _route(self, name: str, *args, **kwargs) -> ModelResponse:
+    if self.health_check is not None and (expired := self._expired()):
+      self._readmit(expired)
+    tried, error = [], None
+    while len(tried) < self.max_attempts:
+      if (endpoint := self._select(tried)) is None:
+        break
+      tried.append(endpoint)
+      start_time = time.perf_counter()
+      try:
+        response = getattr(endpoint.model, name)(*args, **kwargs)
+      except Exception as e:
+        failover = _failover(e)
+        self._release(endpoint, None, failed=failover)
+        if not failover:
+          raise
+        logger.warning(f"Endpoint {endpoint.model.model} failed ({e}); "
+                       "trying another endpoint.")
+        error = e
+        continue
+      self._release(endpoint, time.perf_counter() - start_time)
+      return response
+    raise error
+
+  async def _aroute(self, name: str, *args, **kwargs) -> ModelResponse:
+    if self.health_check is not None and (expired := self._expired()):
+      await asyncio.to_thread(self._readmit, expired)
+    tried, error = [], None
+    while len(tried) < self.max_attempts:
+      if (endpoint := self._select(tried)) is None:
+        break
+      tried.append(endpoint)
+      start_time = time.perf_counter()
+      try:
+        response = await getattr(endpoint.model, name)(*args, **kwargs)
+      except asyncio.CancelledError:
+        self._release(endpoint, None)
+        raise
+      except Exception as e:
+        failover = _failover(e)
+        self._release(endpoint, None, failed=failover)
+        if not failover:
+          raise
+        logger.warning(f"Endpoint {endpoint.model.model} failed ({e}); "
+                       "trying another endpoint.")
+        error = e
+        continue
+      self._release(endpoint, time.perf_counter() - start_time)
+      return response
+    raise error
+
+  def _predict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    return self._route("_predict", content, temperature, **kwargs)
+
+  async def _apredict(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    return await self._aroute("_apredict", content, temperature, **kwargs)
+
+  def _predict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    return self._route("_predict_stream", content, temperature, **kwargs)
+
+  async def _apredict_stream(
+      self,
+      content: str | list[dict],
+      temperature: float = 0.7,
+      **kwargs
+  ) -> ModelResponse:
+    return await self._aroute("_apredict_stream", content, temperature, **kwargs)
+
+
+def _failover(error: Exception) -> bool:
+  """
+  Indica se o erro justifica tentar outro endpoint.
+
+  Apenas falhas de conexão, timeouts e códigos HTTP transitórios (429, 5xx) são
+  atribuídos ao endpoint. Erros da própria requisição (ex: 400, 401) ou da
+  resposta (ex: sem bloco `<out>`) falhariam em qualquer endpoint e são
+  relançados sem contar como falha.
+  """
+  if isinstance(error, _CONNECTION_ERRORS):
+    return True
+  return getattr(error, "status_code", None) in _RETRYABLE_STATUS
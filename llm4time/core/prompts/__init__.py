@@ -1,6 +1,12 @@
 from ._templates import *
+from ._tokens import *
+from ._batch import *
+from ._compiler import _render
 import llm4time.core.data as l4t
+from typing import Any, Callable
+from functools import cache
 from enum import Enum
+import math
 
 
 class PromptType(str, Enum):
@@ -19,55 +25,29 @@ def prompt(
     tstype: l4t.TSType = l4t.TSType.NUMERIC,
     examples: int = 0,
     sampling: l4t.Sampling = None,
-    template: str = None,
+    template: str | tuple[str, str] = None,
+    cache_friendly: bool = False,
+    max_input_tokens: int | None = None,
+    compression: l4t.Compression = l4t.Compression.LTTB,
+    keep_recent: int | None = None,
+    tokenizer: Callable[[str], Any] | None = None,
+    decimals: int | None = None,
+    significant_digits: int | None = None,
+    scaler: l4t.Scaler | None = None,
+    index: bool = True,
+    return_compression: bool = False,
     **kwargs
-) -> str:
+) -> str | list[dict[str, str]] | tuple[str | list[dict[str, str]], dict[str, Any]]:
   if template is None and type == PromptType.CUSTOM:
     raise ValueError("Template must be set for custom prompt.")
+  if type == PromptType.CUSTOM and cache_friendly != isinstance(template, tuple):
+    raise ValueError(
+        "Cache-friendly custom prompts require a (system, user) template tuple.")
   if examples == 0 and type in [PromptType.FEW_SHOT, PromptType.COT_FEW]:
     raise ValueError("Must contain at least 1 example.")
 
-  base_kwargs = {
-      "input_len": len(ts),
-      "input": ts.to_str(tsformat, tstype),
-      "output_example": ts[:periods].to_str(tsformat, tstype),
-      "forecast_horizon": periods,
-  }
-  base_kwargs.update(kwargs)
-
-  if isinstance(ts, l4t.UniTimeSeries):
-    base_kwargs.update({
-        "statistics": "\n".join([
-            f"- Mean: {ts.mean()}\n"
-            f"- Median: {ts.median()}\n"
-            f"- Standard Deviation: {ts.std()}\n"
-            f"- Minimum Value: {ts.min()}\n"
-            f"- Maximum Value: {ts.max()}\n"
-            f"- First Quartile (Q1): {ts.quantile(0.25)}\n"
-            f"- Terceiro Quartil (Q3): {ts.quantile(0.75)}\n"
-            f"- Força da Tendência (STL): {ts.trend(strength=True)}\n"
-            f"- Força da Sazonalidade (STL): {ts.seasonal(strength=True)}\n"
-        ]),
-    })
-  elif isinstance(ts, l4t.MultiTimeSeries):
-    base_kwargs.update({
-        "statistics": "\n".join([
-            f"{f'Column: {col}\n' if len(ts.num_columns) > 1 else ''}"
-            f"- Mean: {ts[col].mean()}\n"
-            f"- Median: {ts[col].median()}\n"
-            f"- Standard Deviation: {ts[col].std()}\n"
-            f"- Minimum Value: {ts[col].min()}\n"
-            f"- Maximum Value: {ts[col].max()}\n"
-            f"- First Quartile (Q1): {ts[col].quantile(0.25)}\n"
-            f"- Third Quartile (Q3): {ts[col].quantile(0.75)}\n"
-            f"- Trend Strength (STL): {ts[col].trend(strength=True)}\n"
-            f"- Seasonality Strength (STL): {ts[col].seasonal(strength=True)}"
-            f"{'' if i == len(ts.num_columns) - 1 else '\n'}"
-            for i, col in enumerate(ts.num_columns)
-        ]),
-    })
-  else:
-    raise TypeError(f"Expected TimeSeries, got {type(ts).__name__}.")
+  if not isinstance(ts, (l4t.UniTimeSeries, l4t.MultiTimeSeries)):
+    raise TypeError(f"Expected TimeSeries, got {ts.__class__.__name__}.")
 
   min_periods = periods * 2 * examples
   if len(ts) < min_periods:
@@ -77,31 +57,199 @@ def prompt(
   try:
     sampling = l4t.Sampling(sampling or l4t.Sampling.BACKEND.value)
   except ValueError:
-    raise ValueError("Supported samplings: frontend, backend, random, uniform.")
-
-  if "forecast_examples" not in kwargs:
-    forecast_examples = "\n".join([
-        f"- Example {i}:\n"
-        f"Input (history):\n{input.to_str(tsformat, tstype)}\n\n"
-        f"Output (forecast):\n<out>\n{output.to_str(tsformat, tstype)}\n</out>"
-        f"{'' if i == examples else '\n'}"
-        for i, (input, output) in enumerate(
-            ts.slide(method=sampling, window=periods, samples=examples),
-            start=1)
-    ])
-    base_kwargs.update({"forecast_examples": forecast_examples})
-
-  prompt_map = {
-      PromptType.ZERO_SHOT: ZERO_SHOT,
-      PromptType.FEW_SHOT: FEW_SHOT,
-      PromptType.COT_FEW: COT_FEW,
-      PromptType.COT: COT,
-      PromptType.CUSTOM: template
-  }
+    raise ValueError(
+        "Supported samplings: frontend, backend, random, uniform, similar.")
+
+  if cache_friendly:
+    # Instruções e exemplos (estáticos) vão na mensagem de sistema e os dados
+    # que variam a cada janela por último, maximizando o prefixo reaproveitado
+    # pelo cache de prompts dos provedores.
+    prompt_map = {
+        PromptType.ZERO_SHOT: (ZERO_SHOT_SYSTEM, ZERO_SHOT_USER),
+        PromptType.FEW_SHOT: (FEW_SHOT_SYSTEM, FEW_SHOT_USER),
+        PromptType.COT_FEW: (COT_FEW_SYSTEM, COT_FEW_USER),
+        PromptType.COT: (COT_SYSTEM, COT_USER),
+        PromptType.CUSTOM: template
+    }
+  else:
+    prompt_map = {
+        PromptType.ZERO_SHOT: ZERO_SHOT,
+        PromptType.FEW_SHOT: FEW_SHOT,
+        PromptType.COT_FEW: COT_FEW,
+        PromptType.COT: COT,
+        PromptType.CUSTOM: template
+    }
   if type not in prompt_map:
     raise ValueError("Supported prompts: zero_shot, few_shot, cot, cot_few, custom.")
 
-  try:
-    return prompt_map[type].format(**base_kwargs)
-  except KeyError as e:
-    raise ValueError(f"Key {e} not defined.")
+  # Toda a série (histórico, exemplos e estatísticas) vai para a escala do
+  # scaler; a previsão do modelo é invertida com `from_str(..., scaler=scaler)`.
+  if scaler is not None:
+    ts = (scaler if scaler.fitted else scaler.fit(ts)).transform(ts)
+    decimals = 0 if decimals is None else decimals
+  # Sem índice (`index=False`), os blocos trazem apenas os valores; a previsão
+  # é lida com `from_str(..., last=ts)`, que reconstrói os instantes.
+  options = {
+      "decimals": decimals, "significant_digits": significant_digits, "index": index
+  }
+
+  # Cada campo é calculado apenas se o template o referencia. Só o histórico
+  # ({input}, {input_len}) muda quando a série é comprimida.
+  providers = {
+      "output_example": cache(lambda: ts[:periods].to_str(tsformat, tstype, **options)),
+      "forecast_horizon": lambda: periods,
+      "statistics": cache(lambda: _statistics(ts)),
+      "forecast_examples": cache(lambda: _forecast_examples(
+          ts, periods, examples, sampling, tsformat, tstype, options)),
+  }
+
+  def render(history: l4t.TimeSeries) -> str | list[dict[str, str]]:
+    providers.update({
+        "input_len": lambda: len(history),
+        "input": lambda: _history(history, tsformat, tstype, options),
+    })
+    providers.update({key: (lambda value=value: value)
+                      for key, value in kwargs.items()})
+    if cache_friendly:
+      system, user = _render(list(prompt_map[type]), providers)
+      return [
+          {"role": "system", "content": system},
+          {"role": "user", "content": user}
+      ]
+    return _render([prompt_map[type]], providers)[0]
+
+  if max_input_tokens is None:
+    result, record = render(ts), _uncompressed(ts)
+  else:
+    result, record = _fit_budget(ts, render, max_input_tokens, compression,
+                                 keep_recent, tsformat, tstype, tokenizer, options)
+  # O registro da compressão acompanha o resultado; a série recebida não é alterada.
+  return (result, record) if return_compression else result
+
+
+def _fit_budget(
+    ts: l4t.TimeSeries,
+    render: Callable[[l4t.TimeSeries], str | list[dict[str, str]]],
+    max_input_tokens: int,
+    compression: l4t.Compression,
+    keep_recent: int | None,
+    tsformat: l4t.TSFormat,
+    tstype: l4t.TSType,
+    tokenizer: Callable[[str], Any] | None,
+    options: dict[str, Any]
+) -> tuple[str | list[dict[str, str]], dict[str, Any]]:
+  """
+  Comprime o histórico até o prompt caber em `max_input_tokens`.
+
+  O número de observações é estimado pelo custo em tokens por linha e refinado
+  com a contagem do prompt gerado. Retorna o prompt e o registro da compressão
+  aplicada (método, tamanhos original e comprimido e taxa).
+  """
+  def tokens(result: str | list[dict[str, str]]) -> int:
+    if not isinstance(result, str):
+      result = "\n\n".join(m["content"] for m in result)
+    return count_tokens(result, tokenizer)
+
+  history = ts
+  result = render(history)
+  used = tokens(result)
+  for _ in range(8):
+    if used <= max_input_tokens:
+      break
+    per_row, _ = tokens_per_row(history, tsformat, tstype, tokenizer, **options)
+    excess = math.ceil((used - max_input_tokens) / max(per_row, 1e-9))
+    points = min(len(history) - 1, len(history) - excess)
+    if points < 1:
+      raise ValueError(
+          f"Prompt without history has ~{used - round(per_row * len(history))} tokens, "
+          f"above the budget of {max_input_tokens}.")
+    recent = points // 2 if keep_recent is None else keep_recent
+    history = ts.compress(points, compression, recent)
+    result = render(history)
+    used = tokens(result)
+  else:
+    raise ValueError(f"Could not fit the prompt in {max_input_tokens} tokens.")
+
+  record = history.attrs["compression"] if history is not ts else _uncompressed(ts)
+  return result, record
+
+
+def _uncompressed(ts: l4t.TimeSeries) -> dict[str, Any]:
+  return {
+      "method": None,
+      "original": len(ts),
+      "compressed": len(ts),
+      "ratio": 1.0,
+  }
+
+
+def _history(
+    ts: l4t.TimeSeries,
+    tsformat: l4t.TSFormat,
+    tstype: l4t.TSType,
+    options: dict[str, Any]
+) -> str:
+  """
+  Histórico serializado para o prompt.
+
+  Sem índice, o bloco começa pelo instante inicial e pela frequência, que
+  situam os valores no tempo. Históricos sem frequência regular (ex: após a
+  compressão por LTTB ou PAA) mantêm os instantes.
+  """
+  if options.get("index", True):
+    return ts.to_str(tsformat, tstype, **options)
+  if (freq := getattr(ts.index, "freqstr", None)) is None or not len(ts):
+    return ts.to_str(tsformat, tstype, **{**options, "index": True})
+  history = ts.to_str(tsformat, tstype, **options)
+  return f"Start: {ts.index[0]}, frequency: {freq}\n{history}"
+
+
+def _statistics(ts: l4t.TimeSeries) -> str:
+  if isinstance(ts, l4t.UniTimeSeries):
+    stats = ts.summary_stats()
+    return "\n".join([
+        f"- Mean: {stats['mean']}\n"
+        f"- Median: {stats['median']}\n"
+        f"- Standard Deviation: {stats['std']}\n"
+        f"- Minimum Value: {stats['min']}\n"
+        f"- Maximum Value: {stats['max']}\n"
+        f"- First Quartile (Q1): {stats['q1']}\n"
+        f"- Terceiro Quartil (Q3): {stats['q3']}\n"
+        f"- Força da Tendência (STL): {stats['trend_strength']}\n"
+        f"- Força da Sazonalidade (STL): {stats['seasonal_strength']}\n"
+    ])
+  stats = ts.summary_stats()
+  return "\n".join([
+      f"{f'Column: {col}\n' if len(stats.columns) > 1 else ''}"
+      f"- Mean: {stats.at['mean', col]}\n"
+      f"- Median: {stats.at['median', col]}\n"
+      f"- Standard Deviation: {stats.at['std', col]}\n"
+      f"- Minimum Value: {stats.at['min', col]}\n"
+      f"- Maximum Value: {stats.at['max', col]}\n"
+      f"- First Quartile (Q1): {stats.at['q1', col]}\n"
+      f"- Third Quartile (Q3): {stats.at['q3', col]}\n"
+      f"- Trend Strength (STL): {stats.at['trend_strength', col]}\n"
+      f"- Seasonality Strength (STL): {stats.at['seasonal_strength', col]}"
+      f"{'' if i == len(stats.columns) - 1 else '\n'}"
+      for i, col in enumerate(stats.columns)
+  ])
+
+
+def _forecast_examples(
+    ts: l4t.TimeSeries,
+    periods: int,
+    examples: int,
+    sampling: l4t.Sampling,
+    tsformat: l4t.TSFormat,
+    tstype: l4t.TSType,
+    options: dict[str, Any]
+) -> str:
+  return "\n".join([
+      f"- Example {i}:\n"
+      f"Input (history):\n{_history(input, tsformat, tstype, options)}\n\n"
+      f"Output (forecast):\n<out>\n{output.to_str(tsformat, tstype, **options)}\n</out>"
+      f"{'' if i == examples else '\n'}"
+      for i, (input, output) in enumerate(
+          ts.iter_slide(method=sampling, window=periods, samples=examples),
+          start=1)
+  ])
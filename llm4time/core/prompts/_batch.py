@@ -0,0 +1,169 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import Any, Callable, Iterator
+from llm4time._infra import logger
+import llm4time.core.data as l4t
+import llm4time.core.prompts as l4p
+import pandas as pd
+import numbers
+import json
+import os
+
+
+def _positions(ts: l4t.TimeSeries, cutoffs: list) -> list[int]:
+  # Cut-off inteiro: quantidade de observações do histórico.
+  # Cut-off de data: último instante incluído no histórico.
+  return [int(c) if isinstance(c, numbers.Integral)
+          else int(ts.index.searchsorted(pd.Timestamp(c), side="right"))
+          for c in cutoffs]
+
+
+def _prompt_chunk(
+    ts: l4t.TimeSeries,
+    ends: list[int],
+    window: int | None,
+    kwargs: dict
+) -> list:
+  starts = [0 if window is None else max(0, end - window) for end in ends]
+  return [l4p.prompt(ts.iloc[start:end], **kwargs) for start, end in zip(starts, ends)]
+
+
+def _tasks(
+    series: dict,
+    cutoffs: list,
+    window: int | None,
+    chunksize: int,
+    kwargs: dict
+) -> Iterator[tuple]:
+  for key, ts in series.items():
+    positions = _positions(ts, cutoffs)
+    for i in range(0, len(positions), chunksize):
+      ends = positions[i:i + chunksize]
+      # Envia ao processo apenas o trecho da série usado pelo lote.
+      start = 0 if window is None else max(0, min(ends) - window)
+      labels = [int(c) if isinstance(c, numbers.Integral) else str(c)
+                for c in cutoffs[i:i + chunksize]]
+      offsets = [end - start for end in ends]
+      yield key, labels, (ts.iloc[start:max(ends)], offsets, window, kwargs)
+
+
+def _report(
+    progress: bool | Callable[[int, int], None],
+    done: int,
+    total: int,
+    last: int
+) -> int:
+  if callable(progress):
+    progress(done, total)
+  elif progress and (done == total or done * 10 // total > last):
+    logger.info(f"Prompts generated: {done}/{total}.")
+    return done * 10 // total
+  return last
+
+
+def prompt_batch(
+    ts: l4t.TimeSeries | dict[Any, l4t.TimeSeries] | list[l4t.TimeSeries],
+    cutoffs: list[int | str | pd.Timestamp],
+    periods: int,
+    type: "l4p.PromptType",
+    window: int | None = None,
+    workers: int | None = None,
+    chunksize: int = 32,
+    progress: bool | Callable[[int, int], None] = False,
+    **kwargs
+) -> Iterator[dict[str, Any]]:
+  """
+  Gera prompts para vários pontos de corte de uma ou mais séries.
+
+  Os prompts são produzidos sob demanda (gerador) e calculados em um pool de
+  processos: os pontos de corte são agrupados em lotes de `chunksize` e no
+  máximo `2 * workers` lotes ficam pendentes, mantendo a memória limitada.
+  Os resultados saem na ordem das séries e dos pontos de corte.
+
+  Args:
+      ts (TimeSeries | dict[Any, TimeSeries] | list[TimeSeries]): Série ou coleção
+          de séries. Em um dicionário, as chaves identificam as séries; em uma lista,
+          os índices.
+      cutoffs (list[int | str | pd.Timestamp]): Pontos de corte. Inteiros indicam a
+          quantidade de observações do histórico; datas, a última observação incluída.
+      periods (int): Horizonte da previsão.
+      type (PromptType): Tipo do prompt.
+      window (int | None): Tamanho máximo do histórico (janela deslizante).
+                           Se None, usa todo o histórico até o corte (janela expansiva).
+      workers (int | None): Número de processos. Se None, usa todos os núcleos;
+                            se 1, gera os prompts no próprio processo.
+      chunksize (int): Pontos de corte por tarefa enviada a um processo.
+      progress (bool | Callable[[int, int], None]): Se True, registra o progresso no
+          log; se função, é chamada com (prompts gerados, total).
+      **kwargs: Argumentos adicionais passados para `prompt()`. Um `scaler` deve
+                estar ajustado: os prompts são gerados em outros processos, que
+                não alteram o objeto original.
+
+  Yields:
+      dict[str, Any]: Registro com 'series' (identificador da série), 'cutoff' e
+          'prompt'.
+
+  Raises:
+      ValueError: Se `chunksize` for menor que 1 ou o `scaler` não estiver ajustado.
+  """
+  if isinstance(ts, l4t.TimeSeries):
+    series = {0: ts}
+  elif isinstance(ts, dict):
+    series = ts
+  else:
+    series = dict(enumerate(ts))
+  if chunksize < 1:
+    raise ValueError("Chunk size must be at least 1.")
+  if kwargs.get("scaler") is not None and not kwargs["scaler"].fitted:
+    raise ValueError(
+        "Scaler must be fitted before prompt_batch; call scaler.fit(ts) first.")
+
+  kwargs.update({"periods": periods, "type": type})
+  tasks = _tasks(series, list(cutoffs), window, chunksize, kwargs)
+  total = len(series) * len(cutoffs)
+  done, last = 0, -1
+  workers = workers or os.cpu_count() or 1
+
+  def results(key: Any, labels: list, prompts: list) -> Iterator[dict[str, Any]]:
+    nonlocal done, last
+    for cutoff, prompt in zip(labels, prompts):
+      yield {"series": key, "cutoff": cutoff, "prompt": prompt}
+    done += len(labels)
+    last = _report(progress, done, total, last)
+
+  if workers == 1:
+    for key, labels, args in tasks:
+      yield from results(key, labels, _prompt_chunk(*args))
+    return
+
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    pending = deque()
+    for key, labels, args in tasks:
+      pending.append((key, labels, executor.submit(_prompt_chunk, *args)))
+      if len(pending) >= 2 * workers:
+        key, labels, future = pending.popleft()
+        yield from results(key, labels, future.result())
+    while pending:
+      key, labels, future = pending.popleft()
+      yield from results(key, labels, future.result())
+
+
+def write_prompts(path: str, *args, **kwargs) -> int:
+  """
+  Grava os prompts de `prompt_batch` em um arquivo JSONL, um registro por linha.
+
+  Os registros são gravados à medida que ficam prontos, sem acumular em memória.
+
+  Args:
+      path (str): Caminho do arquivo JSONL.
+      *args, **kwargs: Argumentos de `prompt_batch`.
+
+  Returns:
+      int: Quantidade de prompts gravados.
+  """
+  count = 0
+  with open(path, "w", encoding="utf-8") as f:
+    for record in prompt_batch(*args, **kwargs):
+      f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+      count += 1
+  return count
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Any, Callable
+import string
+
+
+class _CompiledTemplate:
+
+  def __init__(self, template: str) -> None:
+    self.template = template
+    self.parts = list(string.Formatter().parse(template))
+    self.fields = {_root(field) for _, field, _, _ in self.parts if field is not None}
+    # Campos simples ({nome} ou {nome:spec}) são montados diretamente; acesso a
+    # atributos/índices, conversões ou campos posicionais ficam com `str.format`.
+    self.simple = "" not in self.fields and all(
+        field is None or (field == _root(field) and not conversion
+                          and "{" not in (spec or ""))
+        for _, field, spec, conversion in self.parts
+    )
+
+  def render(self, values: dict[str, Any]) -> str:
+    if not self.simple:
+      return self.template.format(**values)
+    return "".join(
+        literal if field is None else literal + format(values[field], spec or "")
+        for literal, field, spec, _ in self.parts
+    )
+
+
+def _root(field: str) -> str:
+  return field.split(".", 1)[0].split("[", 1)[0]
+
+
+@lru_cache(maxsize=256)
+def _compile(template: str) -> _CompiledTemplate:
+  """
+  Analisa o template uma única vez e guarda o resultado para as próximas chamadas.
+  """
+  return _CompiledTemplate(template)
+
+
+def _render(templates: list[str], providers: dict[str, Callable[[], Any]]) -> list[str]:
+  """
+  Preenche os templates calculando apenas os campos referenciados.
+
+  Raises:
+      ValueError: Se um campo referenciado não tiver valor.
+  """
+  compiled = [_compile(t) for t in templates]
+  fields = set().union(*(c.fields for c in compiled))
+  if missing := sorted(fields - providers.keys()):
+    raise ValueError(f"Key '{missing[0]}' not defined.")
+  values = {name: providers[name]() for name in fields}
+  return [c.render(values) for c in compiled]
@@ -35,3 +35,48 @@ Examples:
 Series Data for Forecast:
 {input}
 """
+
+
+COT_FEW_SYSTEM = \
+"""You are a specialist in statistical modeling and machine learning, with expertise \
+in time series forecasting.
+
+Objective:
+Predict the future values of the historical series provided by the user.
+
+Reasoning Instructions:
+Before generating the forecast, analyze the historical series step by step, considering:
+- Trend: Identify the overall direction (increasing, decreasing, stable) and the \
+trend strength.
+- Seasonality: Patterns that repeat at regular intervals (e.g., daily, weekly, monthly).
+- Outliers: Possible outliers or abrupt changes.
+- Cycles: Not seasonal long-term patterns.
+- Noise reduction: Apply a technique to reduce noise when necessary.
+- Consistency with the provided descriptive statistics (mean, median, etc.).
+- Adjustment for data frequency and contextual events (holidays, promotions, etc.).
+
+Rules:
+1. The forecast should start immediately after the last observed point.
+2. Produce only the predicted values, without text, comments, or code.
+3. Delimit the output exclusively with <out></out>.
+
+Steps:
+1. Analyze the series step by step (internally; do not include this in the final \
+output).
+2. Generate the forecast for the requested number of periods.
+3. Format the output exactly as in the example, with values inside <out>.
+
+Examples:
+{forecast_examples}
+"""
+
+COT_FEW_USER = \
+"""Predict the next {forecast_horizon} values based on the historical series \
+({input_len} periods).
+
+Statistical Context (to guide the forecast):
+{statistics}
+
+Series Data for Forecast:
+{input}
+"""
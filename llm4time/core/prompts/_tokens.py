@@ -0,0 +1,136 @@
+from typing import Any, Callable
+import llm4time.core.data as l4t
+import llm4time.core.formatting as l4f
+import math
+import re
+
+# Tokens de raciocínio reservados por tipo de prompt, além da própria previsão.
+REASONING_TOKENS = {
+    "zero_shot": 0,
+    "few_shot": 0,
+    "cot": 1024,
+    "cot_few": 1024,
+    "custom": 0,
+}
+
+_DIGITS = re.compile(r"\d+")
+_tokenizer: Callable[[str], Any] | None = None
+
+
+def set_tokenizer(tokenizer: Callable[[str], Any] | None) -> None:
+  """
+  Define o tokenizador padrão usado nas estimativas de tokens.
+
+  Args:
+      tokenizer (Callable[[str], Any] | None): Função que recebe um texto e retorna
+          a lista de tokens ou a quantidade de tokens (ex: `tiktoken.get_encoding(
+          "o200k_base").encode`). Se None, volta à estimativa por caracteres.
+  """
+  global _tokenizer
+  _tokenizer = tokenizer
+
+
+def count_tokens(text: str, tokenizer: Callable[[str], Any] | None = None) -> int:
+  """
+  Conta (ou estima) a quantidade de tokens de um texto.
+
+  Sem tokenizador, usa uma estimativa rápida por caracteres: tokenizadores BPE
+  agrupam dígitos de até 3 em 3 e o restante do texto rende ~4 caracteres por token.
+
+  Args:
+      text (str): Texto a ser medido.
+      tokenizer (Callable[[str], Any] | None): Tokenizador a ser usado.
+          Se None, usa o definido em `set_tokenizer`.
+
+  Returns:
+      int: Quantidade de tokens.
+  """
+  tokenizer = tokenizer or _tokenizer
+  if tokenizer is not None:
+    tokens = tokenizer(text)
+    return tokens if isinstance(tokens, int) else len(tokens)
+
+  digits = _DIGITS.findall(text)
+  n_digits = sum(map(len, digits))
+  return sum(-(-len(d) // 3) for d in digits) + math.ceil((len(text) - n_digits) / 4)
+
+
+def tokens_per_row(
+    ts: l4t.TimeSeries,
+    tsformat: l4t.TSFormat,
+    tstype: l4t.TSType = l4t.TSType.NUMERIC,
+    tokenizer: Callable[[str], Any] | None = None,
+    sample: int = 100,
+    **kwargs
+) -> tuple[float, int]:
+  """
+  Mede o custo em tokens de uma série em um formato.
+
+  Args:
+      ts (TimeSeries): Série temporal de referência.
+      tsformat (TSFormat): Formato de serialização.
+      tstype (TSType): Tipo da representação (numérica ou textual).
+      tokenizer (Callable[[str], Any] | None): Tokenizador a ser usado.
+      sample (int): Quantidade de linhas finais usadas na medição.
+      **kwargs: Opções de serialização passadas para `to_str` (ex: `decimals`).
+
+  Returns:
+      tuple[float, int]: Tokens por linha e tokens fixos (cabeçalho) do formato.
+  """
+  window = ts.iloc[-sample:]
+  header = count_tokens(window.iloc[:0].to_str(tsformat, tstype, **kwargs), tokenizer)
+  total = count_tokens(window.to_str(tsformat, tstype, **kwargs), tokenizer)
+  return (total - header) / max(1, len(window)), header
+
+
+def format_tokens(
+    ts: l4t.TimeSeries,
+    tstype: l4t.TSType = l4t.TSType.NUMERIC,
+    tokenizer: Callable[[str], Any] | None = None
+) -> dict[l4t.TSFormat | str, int]:
+  """
+  Conta os tokens da série serializada em cada formato registrado que aceita a série.
+
+  Args:
+      ts (TimeSeries): Série temporal.
+      tstype (TSType): Tipo da representação (numérica ou textual).
+      tokenizer (Callable[[str], Any] | None): Tokenizador a ser usado.
+
+  Returns:
+      dict[TSFormat | str, int]: Quantidade de tokens por formato.
+  """
+  return {spec.name: count_tokens(ts.to_str(spec.name, tstype), tokenizer)
+          for spec in l4f.list_formats(ts, tstype)}
+
+
+def max_tokens(
+    ts: l4t.TimeSeries,
+    periods: int,
+    type: str,
+    tsformat: l4t.TSFormat = l4t.TSFormat.CSV,
+    tstype: l4t.TSType = l4t.TSType.NUMERIC,
+    margin: float = 1.25,
+    tokenizer: Callable[[str], Any] | None = None
+) -> int:
+  """
+  Calcula um `max_tokens` seguro para a previsão de `periods` períodos.
+
+  Soma o custo do bloco de saída (cabeçalho do formato, tokens por linha medidos
+  na própria série e as tags `<out></out>`) ao raciocínio esperado do tipo de
+  prompt, com uma margem de segurança.
+
+  Args:
+      ts (TimeSeries): Série temporal usada no prompt.
+      periods (int): Horizonte da previsão.
+      type (PromptType): Tipo do prompt.
+      tsformat (TSFormat): Formato da saída.
+      tstype (TSType): Tipo da representação (numérica ou textual).
+      margin (float): Fator multiplicativo de segurança.
+      tokenizer (Callable[[str], Any] | None): Tokenizador a ser usado.
+
+  Returns:
+      int: Limite de tokens de saída.
+  """
+  per_row, header = tokens_per_row(ts, tsformat, tstype, tokenizer)
+  output = header + per_row * periods + count_tokens("<out>\n\n</out>", tokenizer)
+  return math.ceil((output + REASONING_TOKENS.get(type, 0)) * margin)
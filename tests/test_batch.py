@@ -0,0 +1,15 @@
+from llm4time.core.models._server import ReplayServer
+from llm4time.core.models.openai import OpenAI
+from llm4time.core.models.replay import Replay
+
+
+def test_batch_line_without_out_block_is_none():
+  # O `stop` corta a resposta do prompt "bad" antes do bloco `<out>`.
+  def generate(content):
+    return "X<out>bad</out>" if "bad" in str(content) else "<out>ok</out>"
+
+  with ReplayServer(Replay(generator=generate)) as server:
+    model = OpenAI("replay", "key", server.url)
+    responses = model.predict_batch(
+        ["good", "bad", "good"], poll_interval=0.01, stop=["X"])
+  assert [r and r.predicted for r in responses] == ["ok", None, "ok"]
@@ -0,0 +1,27 @@
+from llm4time.core.models._ratelimit import RateLimiter
+import asyncio
+
+
+def test_async_concurrency_limit_and_cancellation():
+  limiter = RateLimiter(max_concurrency=4, min_concurrency=4)
+  active, peak = 0, 0
+
+  async def call():
+    nonlocal active, peak
+    active += 1
+    peak = max(peak, active)
+    await asyncio.sleep(0.005)
+    active -= 1
+
+  async def main():
+    await asyncio.gather(*(limiter.arun(call) for _ in range(100)))
+    # Tarefas canceladas na fila não podem prender vagas nem avisos.
+    tasks = [asyncio.create_task(limiter.arun(call)) for _ in range(40)]
+    await asyncio.sleep(0.001)
+    for task in tasks[4:24]:
+      task.cancel()
+    await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 10)
+
+  asyncio.run(main())
+  assert peak == 4
+  assert limiter._in_flight == 0 and not limiter._waiters
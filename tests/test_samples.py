@@ -0,0 +1,53 @@
+from llm4time.core.models.openai import OpenAI
+from llm4time.core.models.replay import Replay
+from openai.types.chat import ChatCompletion
+import asyncio
+import itertools
+import pytest
+import threading
+
+MIXED = ["no block here", "<out>1,2</out>", "<out>3,4</out>"]
+
+
+def _replay(raws: list[str]) -> Replay:
+  # Devolve as respostas em ordem, mesmo com as amostras em threads paralelas.
+  outputs, lock = itertools.cycle(raws), threading.Lock()
+
+  def generate(content):
+    with lock:
+      return next(outputs)
+  return Replay(generator=generate)
+
+
+def _check(response):
+  assert response.predicted == "1,2"
+  assert response.raw == "<out>1,2</out>"
+  assert sorted(response.samples, key=str) == ["1,2", "3,4", None]
+
+
+def test_parallel_samples_keep_invalid_as_none():
+  _check(_replay(MIXED).predict("hello", samples=3))
+
+
+def test_parallel_samples_keep_invalid_as_none_async():
+  _check(asyncio.run(_replay(MIXED).apredict("hello", samples=3)))
+
+
+def test_parallel_samples_all_invalid():
+  with pytest.raises(IndexError):
+    _replay(["no block"]).predict("hello", samples=3)
+
+
+def test_n_samples_keep_invalid_as_none():
+  completion = ChatCompletion.model_validate({
+      "id": "c", "object": "chat.completion", "created": 0, "model": "m",
+      "choices": [
+          {"index": i, "finish_reason": "stop",
+           "message": {"role": "assistant", "content": raw}}
+          for i, raw in enumerate(MIXED)
+      ],
+      "usage": {"prompt_tokens": 10, "completion_tokens": 9, "total_tokens": 19},
+  })
+  response = OpenAI("m", "key", "http://localhost")._response(completion, 0.1)
+  assert response.predicted == "1,2"
+  assert response.samples == [None, "1,2", "3,4"]
@@ -0,0 +1,111 @@
+from llm4time.core.data import UniTimeSeries, MultiTimeSeries, TSFormat, TSType
+from llm4time.core.formatting import encode_textual, decode_textual, from_str
+import numpy as np
+import pandas as pd
+import pytest
+import re
+
+
+# Implementações valor a valor anteriores à vetorização, usadas como referência.
+def _legacy_encode(v):
+  return v if pd.isna(v) else ' '.join(str(v))
+
+
+def _legacy_decode(v):
+  s = str(v).strip()
+  if re.fullmatch(r"[-\d\s.]+", s):
+    return float(s.replace(" ", ""))
+  return v
+
+
+def _values(column) -> list:
+  # NaN != NaN; normaliza os ausentes para comparar listas.
+  return [None if pd.isna(v) else v for v in column]
+
+
+def _floats(column) -> np.ndarray:
+  return column.to_numpy(dtype=float)
+
+
+def _column(rng: np.random.Generator, size: int) -> np.ndarray:
+  # Inteiros, floats de precisão variável ou negativos, com ou sem ausentes.
+  kind = rng.integers(4)
+  if kind == 0:
+    return rng.integers(-10_000, 10_000, size)
+  values = rng.normal(0, 10.0 ** rng.integers(-2, 6), size)
+  # Notação científica ('2e-05') não é um número espaçado, nem na versão anterior.
+  values[np.abs(values) < 1e-3] = 0.0
+  if kind == 1:
+    values = np.round(values, rng.integers(0, 6))
+  if kind == 3:
+    values[rng.random(size) < 0.2] = np.nan
+  return values
+
+
+def _series(seed: int) -> UniTimeSeries | MultiTimeSeries:
+  rng = np.random.default_rng(seed)
+  size = int(rng.integers(1, 60))
+  index = pd.date_range("2024-01-01", periods=size, freq="h", name="date")
+  if seed % 2 == 0:
+    return UniTimeSeries(_column(rng, size), index=index, name="value")
+  data = {f"x{i}": _column(rng, size) for i in range(int(rng.integers(1, 4)))}
+  data["label"] = rng.choice(["a", "b", "c"], size)
+  return MultiTimeSeries(data, index=index)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_encode_matches_legacy(seed):
+  ts = _series(seed)
+  encoded = encode_textual(ts)
+  if isinstance(ts, UniTimeSeries):
+    assert _values(encoded) == _values(map(_legacy_encode, ts))
+  else:
+    for col in ts.num_columns:
+      assert _values(encoded[col]) == _values(map(_legacy_encode, ts[col]))
+    assert encoded["label"].tolist() == ts["label"].tolist()
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_roundtrip(seed):
+  ts = _series(seed)
+  decoded = decode_textual(encode_textual(ts))
+  assert decoded.index.equals(ts.index)
+  if isinstance(ts, UniTimeSeries):
+    np.testing.assert_array_equal(_floats(decoded), _floats(ts))
+  else:
+    for col in ts.num_columns:
+      np.testing.assert_array_equal(_floats(decoded[col]), _floats(ts[col]))
+    assert decoded["label"].tolist() == ts["label"].tolist()
+
+
+@pytest.mark.parametrize("values", [
+    ["1 . 5", "2", "n/a", None],
+    [" - 3", "abc", "4 . 0 0"],
+    ["x", "y"],
+    [None, None],
+])
+def test_decode_mixed_matches_legacy(values):
+  index = pd.date_range("2024-01-01", periods=len(values), freq="D")
+  ts = UniTimeSeries(values, index=index, dtype=object)
+  assert _values(decode_textual(ts)) == _values(map(_legacy_decode, values))
+
+
+def test_decode_keeps_categorical_columns():
+  # Marcadores como '-' parecem números espaçados, mas não têm dígitos.
+  index = pd.date_range("2024-01-01", periods=4, freq="D", name="date")
+  ts = MultiTimeSeries({
+      "x": [1.5, np.nan, -3.0, 40.0],
+      "flag": ["-", "-", "-", None],
+      "label": ["-", "a", "b c", "-"],
+      "kind": pd.Categorical(["1", "2", "1", "2"]),
+  }, index=index)
+  decoded = decode_textual(encode_textual(ts))
+  np.testing.assert_array_equal(_floats(decoded["x"]), _floats(ts["x"]))
+  for col in ["flag", "label", "kind"]:
+    assert _values(decoded[col]) == _values(ts[col])
+  assert isinstance(decoded["kind"].dtype, pd.CategoricalDtype)
+
+  string = ts.to_str(TSFormat.CSV, TSType.TEXTUAL)
+  decoded = from_str(string, TSFormat.CSV)
+  np.testing.assert_array_equal(_floats(decoded["x"]), _floats(ts["x"]))
+  assert _values(decoded["label"]) == _values(ts["label"])